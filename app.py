@@ -13,268 +13,402 @@ a single-page application from the static/ folder.
 """
 from __future__ import annotations
 
-from flask import Flask, jsonify, request, send_from_directory
+import functools
+import hashlib
+import mimetypes
+import re
+import threading
+from decimal import Decimal
+from pathlib import Path
+from types import MappingProxyType
+from typing import Iterator
+
+import orjson
+from flask import (
+    Blueprint,
+    Flask,
+    Response,
+    current_app,
+    g,
+    request,
+    send_from_directory,
+    stream_with_context,
+)
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from werkzeug.security import safe_join
 
 import os
 from tractatus_config import TrcliConfig
-from tractatus_orm.database import SessionLocal, init_db
+from tractatus_orm.database import ScopedSession, init_db
 from tractatus_service import TractatusService
 
-# Initialize Flask app with static file serving configuration
-app = Flask(__name__, static_folder="static", static_url_path="/static")
-# Enable Cross-Origin Resource Sharing for web client access
-CORS(app)
 
-# Initialize database connection and create tables if needed
-init_db()
+class OrjsonProvider(JSONProvider):
+    """JSON provider that routes ``jsonify`` through orjson.
+
+    orjson serializes datetimes natively; ``_default`` covers the remaining
+    types that can appear in service payloads (e.g. ``Decimal``).
+    """
+
+    _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    @staticmethod
+    def _default(value):
+        if isinstance(value, Decimal):
+            return str(value)
+        if isinstance(value, (set, frozenset)):
+            return list(value)
+        if isinstance(value, MappingProxyType):
+            # Read-only views such as TrcliConfig.list_preferences()
+            return dict(value)
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self._default, option=self._OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def dumpb(self, obj) -> bytes:
+        """Serialize obj straight to bytes, for hand-assembled streaming bodies."""
+        return orjson.dumps(obj, default=self._default, option=self._OPTIONS)
 
-# Global service instance cache (maps session IDs to service instances)
-# In production, this should use per-user sessions with proper session management
-_service_cache: dict[str, TractatusService] = {}
+
+# Web UI routes (single-page app and its assets)
+web = Blueprint("web", __name__)
+# JSON API routes, all served below /api
+api = Blueprint("api", __name__, url_prefix="/api")
+
+# Process-wide service instance, built lazily on the first request. It keeps
+# no navigation state: every request names its proposition via ?id=
+_service: TractatusService | None = None
+_service_lock = threading.Lock()
 
 
 def get_service() -> TractatusService:
     """Get or create a shared TractatusService instance.
 
-    Returns a singleton service instance that maintains navigation state
-    across requests. For multi-user production environments, this should
-    be replaced with per-session instances using Flask session management.
+    Returns a singleton service instance shared by all requests and threads.
+    It is built with ``track_current=False``, so it holds no navigation
+    state: the client sends the proposition it is looking at as ``?id=``
+    and views pass it on as ``proposition_id``. Database access goes
+    through the scoped session registry, so every request works on its own
+    SQLAlchemy session that is released in ``remove_session``.
 
     Returns:
-        TractatusService: Shared service instance with database session and config
+        TractatusService: Shared service instance with scoped session and config
     """
-    # For simplicity, use a single shared service instance
-    # TODO: In production, implement per-user sessions with proper cleanup
-    if "default" not in _service_cache:
-        # Create new database session for ORM queries
-        session = SessionLocal()
-        # Load user configuration from ~/.trclirc
-        config = TrcliConfig()
-        # Initialize service with session and config
-        _service_cache["default"] = TractatusService(session, config)
-    service = _service_cache["default"]
+    global _service
+    # Double-checked locking: concurrent first requests must not each build
+    # (and then discard) a service and its config
+    service = _service
+    if service is None:
+        with _service_lock:
+            if _service is None:
+                # Load user configuration from ~/.trclirc and bind it to the
+                # request-scoped session registry
+                _service = TractatusService(
+                    ScopedSession, TrcliConfig(), track_current=False
+                )
+            service = _service
     service.sync_preferences()
     return service
 
 
+def remove_session(exception: BaseException | None = None) -> None:
+    """Release the request's database session back to the connection pool."""
+    ScopedSession.remove()
+
+
 # --- Web UI Routes ---
 
+# Directory holding the single-page app and its assets
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+
+# Cache lifetime for fingerprinted asset URLs (?v=<content hash>): one year
+_IMMUTABLE_MAX_AGE = 31536000
+
+# Precompressed siblings (e.g. app.js.br, app.js.gz) checked in preference order
+_PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
 
-@app.route("/")
+_ASSET_REF_RE = re.compile(r'(?P<attr>href|src)="/static/(?P<path>[^"?]+)"')
+
+
+@functools.lru_cache(maxsize=1)
+def _index_html() -> bytes:
+    """Return index.html with each local asset URL tagged by its content hash.
+
+    Fingerprinted URLs change whenever the asset changes, so browsers can
+    cache them for a year without ever serving a stale file after a deploy.
+    """
+
+    def fingerprint(match: re.Match[str]) -> str:
+        asset = STATIC_DIR / match["path"]
+        if not asset.is_file():
+            return match[0]
+        version = hashlib.md5(asset.read_bytes()).hexdigest()[:12]
+        return f'{match["attr"]}="/static/{match["path"]}?v={version}"'
+
+    html = (STATIC_DIR / "index.html").read_text(encoding="utf-8")
+    return _ASSET_REF_RE.sub(fingerprint, html).encode("utf-8")
+
+
+@web.route("/")
 def index():
     """Serve main web interface."""
-    return send_from_directory("static", "index.html")
+    response = Response(_index_html(), mimetype="text/html")
+    # Always revalidate the page itself; the assets it links are immutable
+    response.add_etag()
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
 
 
-@app.route("/static/<path:path>")
+@web.route("/static/<path:path>")
 def serve_static(path):
-    """Serve static files."""
-    return send_from_directory("static", path)
+    """Serve static files, preferring precompressed variants when accepted.
+
+    Requests carrying a ``v`` fingerprint are cached for a year; plain URLs
+    fall back to ETag/Last-Modified revalidation.
+    """
+    max_age = _IMMUTABLE_MAX_AGE if request.args.get("v") else None
+
+    for encoding, suffix in _PRECOMPRESSED:
+        if not request.accept_encodings[encoding]:
+            continue
+        compressed = safe_join(str(STATIC_DIR), path + suffix)
+        if compressed is None or not os.path.isfile(compressed):
+            continue
+        response = send_from_directory(
+            STATIC_DIR,
+            path + suffix,
+            mimetype=mimetypes.guess_type(path)[0],
+            max_age=max_age,
+        )
+        response.content_encoding = encoding
+        break
+    else:
+        response = send_from_directory(STATIC_DIR, path, max_age=max_age)
+
+    response.vary.add("Accept-Encoding")
+    if max_age:
+        response.cache_control.immutable = True
+    return response
 
 
 # --- API Routes ---
 
+# Endpoints that just call a service method on the ?id= proposition and wrap
+# its result, mapped as path -> (HTTP methods, TractatusService method name)
+ROUTES: dict[str, tuple[tuple[str, ...], str]] = {
+    "parent": (("GET",), "parent"),
+    "next": (("GET",), "next"),
+    "previous": (("GET",), "previous"),
+    "children": (("GET",), "children"),
+    "translations": (("POST",), "translations"),
+    "alternatives": (("GET",), "alternatives"),
+}
 
-@app.route("/api/current", methods=["GET"])
-def api_current():
-    """Get current proposition."""
-    service = get_service()
-    if service.current:
-        return jsonify({"success": True, "data": service._proposition_to_dict(service.current)})
-    return jsonify({"success": False, "error": "No current proposition"})
+# Navigation results depend only on the starting proposition (and display
+# preferences), so GETs naming it via ?id= may be cached by the browser
+CACHEABLE_ROUTES = frozenset({"parent", "next", "previous", "children"})
+_NAVIGATION_MAX_AGE = 60
 
 
-@app.route("/api/get", methods=["POST"])
-def api_get():
-    """Navigate to a specific proposition by name or database ID.
+def _error(message: str) -> Response:
+    """Return the ``{"success": false, "error": ...}`` API envelope."""
+    return current_app.json.response(success=False, error=message)
 
-    Accepts proposition names like "1", "1.1", "2.0121" or database IDs like "id:42".
-    Sets this proposition as the current context for subsequent operations.
 
-    Request JSON:
-        key (str): Proposition name (e.g., "1.1") or database ID (e.g., "id:42")
+def _respond(result: dict | None) -> Response:
+    """Wrap a service result in the API response envelope.
 
-    Returns:
-        JSON response with proposition data or error message
+    Service methods report failures as a dictionary with an ``error`` key;
+    anything else is returned as the ``data`` payload.
     """
-    data = request.get_json() or {}
-    key = data.get("key", "").strip()
+    if isinstance(result, dict) and "error" in result:
+        return _error(result["error"])
+    return current_app.json.response(success=True, data=result)
 
-    # Validate that a key was provided
-    if not key:
-        return jsonify({"success": False, "error": "Key required"})
 
-    service = get_service()
-    # Retrieve the proposition and set it as current
-    result = service.get(key)
+@api.before_request
+def parse_requested_proposition():
+    """Store ``?id=<proposition id>`` as ``g.proposition_id`` for this request.
 
-    # Return error if proposition not found
-    if "error" in result:
-        return jsonify({"success": False, "error": result["error"]})
+    The web client sends the proposition it is looking at with every call
+    that depends on one. Only the request context is touched; the shared
+    service is never moved, so concurrent requests cannot see each other's
+    position.
+    """
+    raw_id = request.args.get("id")
+    g.proposition_id = None
+    if raw_id is None:
+        return None
+    try:
+        g.proposition_id = int(raw_id)
+    except ValueError:
+        return _error(f"Invalid id: {raw_id}")
+    return None
 
-    return jsonify({"success": True, "data": result})
 
+def _wrap(attr: str, cacheable: bool = False):
+    """Build a view that calls ``TractatusService.<attr>(proposition_id=...)`` and wraps the result."""
 
-@app.route("/api/parent", methods=["POST"])
-def api_parent():
-    """Navigate to parent."""
-    service = get_service()
-    result = service.parent()
+    def view():
+        result = getattr(get_service(), attr)(proposition_id=g.proposition_id)
 
-    if "error" in result:
-        return jsonify({"success": False, "error": result["error"]})
+        response = _respond(result)
 
-    return jsonify({"success": True, "data": result})
+        if cacheable and g.proposition_id is not None:
+            response.cache_control.private = True
+            response.cache_control.max_age = _NAVIGATION_MAX_AGE
+            response.add_etag()
+            return response.make_conditional(request)
+        return response
 
+    view.__name__ = f"api_{attr}"
+    view.__doc__ = getattr(TractatusService, attr).__doc__
+    return view
 
-@app.route("/api/next", methods=["POST"])
-def api_next():
-    """Navigate to next proposition."""
-    service = get_service()
-    result = service.next()
 
-    if "error" in result:
-        return jsonify({"success": False, "error": result["error"]})
+for _path, (_methods, _attr) in ROUTES.items():
+    api.add_url_rule(
+        f"/{_path}",
+        endpoint=_path,
+        view_func=_wrap(_attr, cacheable=_path in CACHEABLE_ROUTES),
+        methods=list(_methods),
+    )
 
-    return jsonify({"success": True, "data": result})
 
+@api.route("/current", methods=["GET"])
+def api_current():
+    """Get the proposition named by ``?id=``."""
+    if g.proposition_id is None:
+        return _error("No current proposition")
+    return _respond(get_service().get(f"id:{g.proposition_id}"))
 
-@app.route("/api/previous", methods=["POST"])
-def api_previous():
-    """Navigate to previous proposition."""
-    service = get_service()
-    result = service.previous()
 
-    if "error" in result:
-        return jsonify({"success": False, "error": result["error"]})
+@api.route("/get", methods=["POST"])
+def api_get():
+    """Navigate to a specific proposition by name or database ID.
+
+    Accepts proposition names like "1", "1.1", "2.0121" or database IDs like "id:42".
+    The client keeps the returned id and sends it as ``?id=`` on later calls.
 
-    return jsonify({"success": True, "data": result})
+    Request JSON:
+        key (str): Proposition name (e.g., "1.1") or database ID (e.g., "id:42")
 
+    Returns:
+        JSON response with proposition data or error message
+    """
+    data = request.get_json(silent=True, cache=False) or {}
+    key = data.get("key", "").strip()
 
-@app.route("/api/children", methods=["POST"])
-def api_children():
-    """Get children of current node."""
-    service = get_service()
-    result = service.children()
+    # Validate that a key was provided
+    if not key:
+        return _error("Key required")
 
-    if "error" in result:
-        return jsonify({"success": False, "error": result["error"]})
+    service = get_service()
+    result = service.get(key)
 
-    return jsonify({"success": True, "data": result})
+    return _respond(result)
 
 
-@app.route("/api/list", methods=["POST"])
+@api.route("/list", methods=["POST"])
 def api_list():
     """List children for target or current node."""
-    data = request.get_json() or {}
+    data = request.get_json(silent=True, cache=False) or {}
     target = data.get("target", "").strip()
 
     service = get_service()
-    result = service.list(target or None)
+    result = service.list(target or None, proposition_id=g.proposition_id)
 
-    if "error" in result:
-        return jsonify({"success": False, "error": result["error"]})
-
-    return jsonify({"success": True, "data": result})
+    return _respond(result)
 
 
-@app.route("/api/tree", methods=["POST"])
+@api.route("/tree", methods=["POST"])
 def api_tree():
     """Get tree for target or current node."""
-    data = request.get_json() or {}
+    data = request.get_json(silent=True, cache=False) or {}
     target = data.get("target", "").strip()
 
     service = get_service()
-    result = service.tree(target or None)
-
+    result = service.iter_tree(target or None, proposition_id=g.proposition_id)
     if "error" in result:
-        return jsonify({"success": False, "error": result["error"]})
+        return _respond(result)
 
-    return jsonify({"success": True, "data": result})
+    # Stream the envelope node by node instead of serializing the whole
+    # subtree up front; the shape matches a regular _respond() payload
+    return Response(
+        stream_with_context(_stream_tree(result["current"], result["tree"])),
+        mimetype="application/json",
+    )
 
 
-@app.route("/api/search", methods=["POST"])
+def _stream_tree(current: dict, nodes: Iterator[dict]) -> Iterator[bytes]:
+    """Yield the ``/api/tree`` JSON envelope in chunks, one node at a time."""
+    dumpb = current_app.json.dumpb
+    yield b'{"success":true,"data":{"current":' + dumpb(current) + b',"tree":['
+    separator = b""
+    for node in nodes:
+        yield separator + dumpb(node)
+        separator = b","
+    yield b"]}}"
+
+
+@api.route("/search", methods=["POST"])
 def api_search():
     """Search propositions."""
-    data = request.get_json() or {}
+    data = request.get_json(silent=True, cache=False) or {}
     term = data.get("term", "").strip()
 
     if not term:
-        return jsonify({"success": False, "error": "Search term required"})
+        return _error("Search term required")
 
     service = get_service()
     result = service.search(term)
 
-    if "error" in result:
-        return jsonify({"success": False, "error": result["error"]})
-
-    return jsonify({"success": True, "data": result})
-
-
-@app.route("/api/translations", methods=["POST"])
-def api_translations():
-    """Get translations of current node."""
-    service = get_service()
-    result = service.translations()
-
-    if "error" in result:
-        return jsonify({"success": False, "error": result["error"]})
+    return _respond(result)
 
-    return jsonify({"success": True, "data": result})
 
-
-@app.route("/api/translate", methods=["POST"])
+@api.route("/translate", methods=["POST"])
 def api_translate():
     """Get specific translation."""
-    data = request.get_json() or {}
+    data = request.get_json(silent=True, cache=False) or {}
     lang = data.get("lang", "").strip()
 
     if not lang:
-        return jsonify({"success": False, "error": "Language code required"})
+        return _error("Language code required")
 
     service = get_service()
-    result = service.translate(lang)
-
-    if "error" in result:
-        return jsonify({"success": False, "error": result["error"]})
-
-    return jsonify({"success": True, "data": result})
+    result = service.translate(lang, proposition_id=g.proposition_id)
 
+    return _respond(result)
 
-@app.route("/api/alternatives", methods=["GET"])
-def api_alternatives_list():
-    """Return alternative text variants for the active proposition."""
 
-    service = get_service()
-    result = service.alternatives()
-
-    if "error" in result:
-        return jsonify({"success": False, "error": result["error"]})
-
-    return jsonify({"success": True, "data": result})
-
-
-@app.route("/api/alternatives", methods=["POST"])
+@api.route("/alternatives", methods=["POST"])
 def api_alternatives_create():
     """Create a new alternative text variant for the active proposition."""
 
-    data = request.get_json() or {}
+    data = request.get_json(silent=True, cache=False) or {}
     text_value = data.get("text", "")
     lang = data.get("lang")
     editor = data.get("editor")
     tags = data.get("tags")
 
     service = get_service()
-    result = service.create_alternative(text_value, lang=lang, editor=editor, tags=tags)
-
-    if "error" in result:
-        return jsonify({"success": False, "error": result["error"]})
+    result = service.create_alternative(
+        text_value,
+        lang=lang,
+        editor=editor,
+        tags=tags,
+        proposition_id=g.proposition_id,
+    )
 
-    return jsonify({"success": True, "data": result})
+    return _respond(result)
 
 
-@app.route("/api/agent", methods=["POST"])
+@api.route("/agent", methods=["POST"])
 def api_agent():
     """Invoke an LLM agent to analyze propositions using AI.
 
@@ -292,6 +426,7 @@ def api_agent():
         targets (list[str], optional): List of proposition names to analyze
         language (str, optional): Language code for response ("de", "en", etc.)
         user_input (str, optional): Additional user prompt to guide the analysis
+        no_cache (bool, optional): Bypass the response cache and regenerate
 
     Returns:
         JSON response with AI-generated analysis or error message
@@ -299,7 +434,7 @@ def api_agent():
     Example:
         {"action": "comment", "targets": ["1.1"], "language": "en"}
     """
-    data = request.get_json() or {}
+    data = request.get_json(silent=True, cache=False) or {}
     action = data.get("action", "").strip()
     targets = data.get("targets", [])
     language = data.get("language", "").strip()
@@ -307,33 +442,31 @@ def api_agent():
 
     # Validate that an action was specified
     if not action:
-        return jsonify({"success": False, "error": "Action required"})
+        return _error("Action required")
 
     service = get_service()
     # Invoke the LLM agent with the specified action and parameters
     result = service.agent(
         action,
-        targets if targets else None,  # Use current proposition if no targets
+        targets if targets else None,  # Use the ?id= proposition if no targets
         language=language or None,      # Use config default if not specified
         user_input=user_input or None,  # Optional user guidance
+        use_cache=not data.get("no_cache", False),
+        proposition_id=g.proposition_id,
     )
 
-    # Return error if agent invocation failed
-    if "error" in result:
-        return jsonify({"success": False, "error": result["error"]})
-
-    return jsonify({"success": True, "data": result})
+    return _respond(result)
 
 
-@app.route("/api/config", methods=["GET"])
+@api.route("/config", methods=["GET"])
 def api_config_get():
     """Get current configuration."""
     service = get_service()
     config = service.config.list_preferences()
-    return jsonify({"success": True, "data": config})
+    return _respond(config)
 
 
-@app.route("/api/config/set", methods=["POST"])
+@api.route("/config/set", methods=["POST"])
 def api_config_set():
     """Update a user configuration preference with type conversion and validation.
 
@@ -351,85 +484,119 @@ def api_config_set():
     Example:
         {"key": "display_length", "value": "500"}
     """
-    data = request.get_json() or {}
+    data = request.get_json(silent=True, cache=False) or {}
     key = data.get("key", "").strip()
     value_str = data.get("value", "")
 
     # Validate that a key was provided
     if not key:
-        return jsonify({"success": False, "error": "Key required"})
+        return _error("Key required")
 
     service = get_service()
     config = service.config
 
     # Type conversion based on default value type
     try:
-        # Get the default value to infer the expected type
-        default_value = config.DEFAULT_PREFERENCES.get(key)
-        if default_value is None:
-            return jsonify({"success": False, "error": f"Unknown preference: {key}"})
-
-        # Convert string input to the appropriate type
-        expected_type = type(default_value)
-        if expected_type == int:
-            # Convert to integer (e.g., display_length, tree_max_depth)
-            value = int(value_str)
-        elif expected_type == bool:
-            # Convert to boolean (accept multiple formats)
-            value = value_str.lower() in ("true", "1", "yes", "on")
-        else:
-            # Keep as string (e.g., lang)
-            value = value_str
+        # Look up the string converter derived from the default value's type
+        converter = config.CONVERTERS.get(key)
+        if converter is None:
+            return _error(f"Unknown preference: {key}")
+
+        # Convert string input to the appropriate type (int, bool or str)
+        value = converter(value_str)
 
         # Validate the converted value (checks ranges, valid options, etc.)
         is_valid, error_msg = config.validate_preference(key, value)
         if not is_valid:
-            return jsonify({"success": False, "error": error_msg})
+            return _error(error_msg)
 
-        # Persist the preference to ~/.trclirc
-        config.set(key, value)
-        service.record_config_update(key)
-        return jsonify({"success": True, "data": {"key": key, "value": value}})
+        # Persist the preference to ~/.trclirc right away, so other workers
+        # and the CLI pick it up
+        if not service.set_preference(key, value):
+            return _error(f"Could not set preference: {key}")
+        return _respond({"key": key, "value": value})
     except ValueError as e:
-        return jsonify({"success": False, "error": f"Invalid value: {e}"})
+        return _error(f"Invalid value: {e}")
+
+
+# The help document never changes at runtime, so it is serialized (and
+# fingerprinted) once at import time instead of on every request
+_HELP_BODY = orjson.dumps({
+    "success": True,
+    "data": {
+        "commands": {
+            "get": {"method": "POST", "params": {"key": "proposition name or id:N"}, "description": "Navigate to proposition"},
+            "parent": {"method": "GET", "params": {"id": "starting proposition id (query)"}, "description": "Go to parent"},
+            "next": {"method": "GET", "params": {"id": "starting proposition id (query)"}, "description": "Go to next proposition"},
+            "previous": {"method": "GET", "params": {"id": "starting proposition id (query)"}, "description": "Go to previous proposition"},
+            "children": {"method": "GET", "params": {"id": "starting proposition id (query)"}, "description": "List children"},
+            "list": {"method": "POST", "params": {"target": "optional", "id": "proposition id (query) when no target"}, "description": "List children"},
+            "tree": {"method": "POST", "params": {"target": "optional", "id": "proposition id (query) when no target"}, "description": "Get tree view"},
+            "search": {"method": "POST", "params": {"term": "search string"}, "description": "Search propositions"},
+            "translations": {"method": "POST", "params": {"id": "proposition id (query)"}, "description": "Get translations"},
+            "translate": {"method": "POST", "params": {"lang": "language code", "id": "proposition id (query)"}, "description": "Get specific translation"},
+            "agent": {"method": "POST", "params": {"action": "comment|comparison|websearch|reference", "targets": "list of proposition names"}, "description": "Invoke LLM agent"},
+            "config": {"method": "GET", "params": {}, "description": "Get config"},
+            "config/set": {"method": "POST", "params": {"key": "preference", "value": "value"}, "description": "Set preference"},
+        }
+    }
+})
+_HELP_ETAG = hashlib.md5(_HELP_BODY).hexdigest()
 
 
-@app.route("/api/help", methods=["GET"])
+@api.route("/help", methods=["GET"])
 def api_help():
     """Get API documentation."""
-    return jsonify({
-        "success": True,
-        "data": {
-            "commands": {
-                "get": {"method": "POST", "params": {"key": "proposition name or id:N"}, "description": "Navigate to proposition"},
-                "parent": {"method": "POST", "params": {}, "description": "Go to parent"},
-                "next": {"method": "POST", "params": {}, "description": "Go to next proposition"},
-                "previous": {"method": "POST", "params": {}, "description": "Go to previous proposition"},
-                "children": {"method": "POST", "params": {}, "description": "List children of current"},
-                "list": {"method": "POST", "params": {"target": "optional"}, "description": "List children"},
-                "tree": {"method": "POST", "params": {"target": "optional"}, "description": "Get tree view"},
-                "search": {"method": "POST", "params": {"term": "search string"}, "description": "Search propositions"},
-                "translations": {"method": "POST", "params": {}, "description": "Get translations"},
-                "translate": {"method": "POST", "params": {"lang": "language code"}, "description": "Get specific translation"},
-                "agent": {"method": "POST", "params": {"action": "comment|comparison|websearch|reference", "targets": "list of proposition names"}, "description": "Invoke LLM agent"},
-                "config": {"method": "GET", "params": {}, "description": "Get config"},
-                "config/set": {"method": "POST", "params": {"key": "preference", "value": "value"}, "description": "Set preference"},
-            }
-        }
-    })
+    response = Response(_HELP_BODY, mimetype="application/json")
+    response.set_etag(_HELP_ETAG)
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    # Answers 304 Not Modified when If-None-Match carries the current ETag
+    return response.make_conditional(request)
 
 
-@app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors."""
-    return jsonify({"success": False, "error": "Not found"}), 404
+    return _error("Not found"), 404
 
 
-@app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors."""
-    return jsonify({"success": False, "error": "Internal server error"}), 500
+    return _error("Internal server error"), 500
+
+
+def create_app() -> Flask:
+    """Create the Flask application and register the web and API blueprints."""
+
+    # Initialize Flask app; /static is served by the web blueprint (cache
+    # headers, precompressed variants), so the built-in static route is disabled
+    app = Flask(__name__, static_folder=None)
+    # Serialize all API responses with orjson instead of the stdlib json module
+    app.json = OrjsonProvider(app)
+    # Enable Cross-Origin Resource Sharing for web client access
+    CORS(app)
+
+    # Initialize database connection and create tables if needed
+    init_db()
+
+    app.register_blueprint(web)
+    app.register_blueprint(api)
+    app.teardown_appcontext(remove_session)
+    app.register_error_handler(404, not_found)
+    app.register_error_handler(500, internal_error)
+    return app
+
+
+app = create_app()
 
 if __name__ == "__main__":
+    # Flask's built-in server is for local development only; production runs
+    # under gunicorn (see wsgi.py)
+    if not os.environ.get("FLASK_DEV"):
+        raise SystemExit(
+            "Use gunicorn to serve the app, e.g. "
+            "'gunicorn -w 4 -k gthread --threads 8 -b 0.0.0.0:8000 wsgi:app', "
+            "or set FLASK_DEV=1 to run the development server."
+        )
     port = int(os.environ.get("PORT", 8000))
     app.run(host="0.0.0.0", port=port)
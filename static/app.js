@@ -13,6 +13,8 @@ let currentLanguage = 'en';
 let currentTreeData = [];
 let treeLayoutNodes = [];
 let activePropositionId = null;
+// Bumped on every config change so cached navigation responses are not reused
+let configRevision = 0;
 let currentAlternatives = [];
 // Last result cache for AI analysis
 let lastResultCache = {
@@ -290,6 +292,19 @@ function executeCommand(command) {
 /**
  * API Calls
  */
+
+/**
+ * Build an API URL that carries the active proposition (and config revision)
+ * in the query string, so the server does not depend on its own navigation
+ * state and GET responses can be cached by the browser.
+ */
+function withCurrent(path) {
+    if (activePropositionId === null || typeof activePropositionId === 'undefined') {
+        return `${API_BASE}/${path}`;
+    }
+    const params = new URLSearchParams({ id: activePropositionId, rev: configRevision });
+    return `${API_BASE}/${path}?${params}`;
+}
 async function apiGet(key) {
     if (!key) {
         showError('Usage: get <name or id:N>');
@@ -318,7 +333,7 @@ async function apiGet(key) {
 
 async function apiList(target) {
     try {
-        const res = await fetch(`${API_BASE}/list`, {
+        const res = await fetch(withCurrent('list'), {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
             body: JSON.stringify({ target: target || '' }),
@@ -341,7 +356,7 @@ async function apiList(target) {
 
 async function apiChildren() {
     try {
-        const res = await fetch(`${API_BASE}/children`, { method: 'POST' });
+        const res = await fetch(withCurrent('children'));
         const data = await res.json();
 
         if (data.success) {
@@ -356,7 +371,7 @@ async function apiChildren() {
 
 async function apiParent() {
     try {
-        const res = await fetch(`${API_BASE}/parent`, { method: 'POST' });
+        const res = await fetch(withCurrent('parent'));
         const data = await res.json();
 
         if (data.success) {
@@ -373,7 +388,7 @@ async function apiParent() {
 
 async function apiNext() {
     try {
-        const res = await fetch(`${API_BASE}/next`, { method: 'POST' });
+        const res = await fetch(withCurrent('next'));
         const data = await res.json();
 
         if (data.success) {
@@ -390,7 +405,7 @@ async function apiNext() {
 
 async function apiPrevious() {
     try {
-        const res = await fetch(`${API_BASE}/previous`, { method: 'POST' });
+        const res = await fetch(withCurrent('previous'));
         const data = await res.json();
 
         if (data.success) {
@@ -408,7 +423,7 @@ async function apiPrevious() {
 async function apiTree(target, options = {}) {
     const { updateCurrent = true } = options;
     try {
-        const res = await fetch(`${API_BASE}/tree`, {
+        const res = await fetch(withCurrent('tree'), {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
             body: JSON.stringify({ target: target || '' }),
@@ -464,7 +479,7 @@ function performSearch() {
 
 async function apiTranslations() {
     try {
-        const res = await fetch(`${API_BASE}/translations`, { method: 'POST' });
+        const res = await fetch(withCurrent('translations'), { method: 'POST' });
         const data = await res.json();
 
         if (data.success) {
@@ -484,7 +499,7 @@ async function apiTranslate(lang) {
     }
 
     try {
-        const res = await fetch(`${API_BASE}/translate`, {
+        const res = await fetch(withCurrent('translate'), {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
             body: JSON.stringify({ lang }),
@@ -513,7 +528,7 @@ async function loadAlternatives() {
     }
 
     try {
-        const res = await fetch(`${API_BASE}/alternatives`);
+        const res = await fetch(withCurrent('alternatives'));
         const data = await res.json();
 
         if (data.success) {
@@ -564,7 +579,7 @@ async function handleAlternativeSubmit(event) {
     };
 
     try {
-        const res = await fetch(`${API_BASE}/alternatives`, {
+        const res = await fetch(withCurrent('alternatives'), {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
             body: JSON.stringify(payload),
@@ -607,7 +622,7 @@ async function apiAgent(action, targets, userInput) {
             agentSpinner.classList.remove('hidden');
         }
 
-        const res = await fetch(`${API_BASE}/agent`, {
+        const res = await fetch(withCurrent('agent'), {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
             body: JSON.stringify({
@@ -717,6 +732,7 @@ async function setConfigValue(key) {
         const data = await res.json();
 
         if (data.success) {
+            configRevision += 1;
             showMessage(`Updated ${key} = ${value}`);
             const existingConfig = loadConfigFromCookie() || {};
             const updatedConfig = { ...existingConfig, [key]: value };
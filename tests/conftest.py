@@ -0,0 +1,43 @@
+"""Shared test setup: an isolated working directory, home and database.
+
+``tractatus_orm.database`` opens ``sqlite:///tractatus.db`` relative to the
+working directory, and ``TrcliConfig`` reads ``~/.trclirc``. Both are pointed
+at a fresh temporary directory here, before any project module is imported,
+so the tests never touch the checked-in database or the user's preferences.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+_WORKDIR = tempfile.mkdtemp(prefix="tractatus-tests-")
+os.chdir(_WORKDIR)
+os.environ["HOME"] = _WORKDIR
+sys.path.insert(0, str(REPO_ROOT))
+
+
+@pytest.fixture(scope="session")
+def corpus() -> int:
+    """Ingest tractatus.xml into the test database once per session.
+
+    Returns:
+        Number of propositions ingested
+    """
+    from tractatus_orm.xml_ingest import ingest_multilang_xml
+
+    return ingest_multilang_xml(REPO_ROOT / "tractatus.xml")
+
+
+@pytest.fixture
+def session(corpus):
+    """A database session on the ingested corpus, closed after the test."""
+    from tractatus_orm.database import SessionLocal
+
+    with SessionLocal() as session:
+        yield session
@@ -0,0 +1,72 @@
+"""Packed batch comments stay within the backend's output limit."""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from tractatus_agents.cache import AgentCache
+from tractatus_agents.llm import LLMAgent
+from tractatus_agents.router import AgentAction, AgentRouter
+
+
+class _LimitedClient:
+    """Backend stub that rejects completions above its output limit, like the APIs."""
+
+    max_output_tokens = 8192
+
+    def __init__(self) -> None:
+        self.requests: list[int] = []
+
+    def complete(self, prompt=None, *, system=None, user=None, max_tokens=None) -> str:
+        if max_tokens > self.max_output_tokens:
+            raise ValueError(f"max_tokens: {max_tokens} > {self.max_output_tokens}")
+        self.requests.append(max_tokens)
+        count = user.count("<ID ")
+        return json.dumps([{"id": i, "comment": f"answer {i}"} for i in range(count)])
+
+
+class _Proposition:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.text = "Die Welt ist alles, was der Fall ist."
+
+
+@pytest.fixture
+def client():
+    return _LimitedClient()
+
+
+@pytest.fixture
+def router(client, tmp_path):
+    # 2000 is the llm_max_tokens preference default
+    agent = LLMAgent(client, max_tokens=2000, cache=AgentCache(tmp_path / "cache.sqlite3"))
+    return AgentRouter(agent)
+
+
+def test_default_batch_fits_the_output_limit(router, client):
+    propositions = [_Proposition(f"1.{i}") for i in range(20)]
+
+    responses = router.perform_batch(AgentAction.COMMENT, propositions)
+
+    assert [r.content for r in responses[:4]] == [f"answer {i}" for i in range(4)]
+    assert len(responses) == 20
+    # 8192 // 2000 answers per request
+    assert client.requests == [8000] * 5
+
+
+def test_requested_batch_size_is_clamped(router, client):
+    router.perform_batch(AgentAction.COMMENT, [_Proposition(str(i)) for i in range(9)], batch_size=50)
+
+    assert max(client.requests) <= client.max_output_tokens
+    assert len(client.requests) == 3
+
+
+def test_smaller_batch_size_is_kept(router, client):
+    router.perform_batch(AgentAction.COMMENT, [_Proposition(str(i)) for i in range(6)], batch_size=2)
+
+    assert client.requests == [4000] * 3
+
+
+def test_limit_is_read_through_the_cache_wrapper(router):
+    assert router._llm_agent._max_output_tokens == 8192
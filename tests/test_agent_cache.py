@@ -0,0 +1,93 @@
+"""AgentCache background writer, its lifetime and purging."""
+from __future__ import annotations
+
+import gc
+import logging
+import sqlite3
+
+from tractatus_agents import cache as cache_module
+from tractatus_agents.cache import AgentCache
+
+
+def test_failed_writes_are_logged_and_counted(tmp_path, monkeypatch, caplog):
+    cache = AgentCache(tmp_path / "agent_cache.sqlite3")
+
+    def locked(conn, rows):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(cache._writer, "write_batch", locked)
+    with caplog.at_level(logging.WARNING, logger="tractatus_agents.cache"):
+        cache.store("comment", "p1", "one")
+        cache.store("comment", "p2", "two")
+        cache.flush()
+
+    assert cache.failed_writes == 2
+    assert "database is locked" in caplog.text
+    # The in-memory tier still answers
+    assert cache.lookup("comment", "p1") == "one"
+
+
+def test_flush_persists_stores(tmp_path):
+    path = tmp_path / "agent_cache.sqlite3"
+    cache = AgentCache(path)
+    cache.store("comment", "prompt", "content")
+    cache.flush()
+
+    assert cache.failed_writes == 0
+    assert AgentCache(path).lookup("comment", "prompt") == "content"
+
+
+def test_purge_drops_rows_with_legacy_keys(tmp_path):
+    path = tmp_path / "agent_cache.sqlite3"
+    cache = AgentCache(path)
+    cache.store("comment", "prompt", "content")
+    cache.flush()
+    # A row keyed by the former SHA-256 hex digest
+    cache._connect().execute(
+        "INSERT INTO agent_cache (prompt_hash, action, prompt, content) VALUES (?, ?, ?, ?)",
+        ("f" * 64, "comment", "old", "stale"),
+    )
+
+    assert cache.purge() == 1
+    rows = cache._connect().execute("SELECT length(prompt_hash) FROM agent_cache").fetchall()
+    assert rows == [(32,)]
+    assert cache.lookup("comment", "prompt") == "content"
+
+
+def test_close_writes_pending_stores_and_stops_the_writer(tmp_path):
+    path = tmp_path / "agent_cache.sqlite3"
+    cache = AgentCache(path)
+    cache.store("comment", "prompt", "content")
+
+    cache.close()
+    cache.close()
+
+    assert not cache._writer.thread.is_alive()
+    assert cache not in cache_module._OPEN_CACHES
+    assert AgentCache(path).lookup("comment", "prompt") == "content"
+
+
+def test_dropped_cache_is_collected_and_its_writer_stops(tmp_path):
+    path = tmp_path / "agent_cache.sqlite3"
+    cache = AgentCache(path)
+    cache.store("comment", "prompt", "content")
+    thread = cache._writer.thread
+
+    del cache
+    gc.collect()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    # Stores queued before the cache was dropped are still written
+    assert AgentCache(path).lookup("comment", "prompt") == "content"
+
+
+def test_exit_hook_flushes_open_caches(tmp_path):
+    path = tmp_path / "agent_cache.sqlite3"
+    cache = AgentCache(path)
+    cache.store("comment", "prompt", "content")
+
+    cache_module._flush_open_caches()
+
+    row = sqlite3.connect(path).execute("SELECT content FROM agent_cache").fetchone()
+    assert row == ("content",)
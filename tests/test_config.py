@@ -0,0 +1,101 @@
+"""TrcliConfig: deferred preference writes, the exit-time flush and atomic saves."""
+from __future__ import annotations
+
+import gc
+import os
+
+import orjson
+import pytest
+
+import tractatus_config
+from tractatus_config import TrcliConfig
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    return tmp_path / "trclirc"
+
+
+def _saved(path) -> dict:
+    return orjson.loads(path.read_bytes())
+
+
+def test_set_waits_for_flush(config_file):
+    config = TrcliConfig(config_file)
+
+    assert config.set("lang", "de")
+    assert config.set("display_length", 80)
+    assert not config_file.exists()
+
+    config.flush()
+    assert _saved(config_file)["lang"] == "de"
+    assert _saved(config_file)["display_length"] == 80
+    assert TrcliConfig(config_file).get("lang") == "de"
+
+
+def test_flush_without_changes_does_not_write(config_file):
+    TrcliConfig(config_file).flush()
+    assert not config_file.exists()
+
+
+def test_reset_is_deferred_too(config_file):
+    config = TrcliConfig(config_file)
+    config.set("lang", "de")
+    config.flush()
+
+    config.reset("lang")
+    assert _saved(config_file)["lang"] == "de"
+    config.flush()
+    assert _saved(config_file)["lang"] == "en"
+
+
+def test_exit_hook_flushes_unsaved_instances(config_file):
+    config = TrcliConfig(config_file)
+    config.set("lang", "fr")
+    assert config in tractatus_config._UNSAVED
+
+    tractatus_config._flush_unsaved()
+
+    assert _saved(config_file)["lang"] == "fr"
+    assert config not in tractatus_config._UNSAVED
+
+
+def test_exit_hook_does_not_keep_instances_alive(config_file):
+    config = TrcliConfig(config_file)
+    config.set("lang", "fr")
+    before = len(tractatus_config._UNSAVED)
+
+    del config
+    gc.collect()
+
+    assert len(tractatus_config._UNSAVED) == before - 1
+
+
+def test_save_leaves_no_temporary_file(config_file):
+    config = TrcliConfig(config_file)
+    config.set("lang", "de")
+    config.flush()
+
+    assert [p.name for p in config_file.parent.iterdir()] == [config_file.name]
+
+
+def test_failed_replace_keeps_the_previous_file(config_file, monkeypatch, capsys):
+    config = TrcliConfig(config_file)
+    config.set("lang", "de")
+    config.flush()
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    config.set("lang", "fr")
+    config.flush()
+
+    assert _saved(config_file)["lang"] == "de"
+    assert [p.name for p in config_file.parent.iterdir()] == [config_file.name]
+    assert "Could not save config" in capsys.readouterr().out
+    # The change stays pending for a later flush
+    assert config in tractatus_config._UNSAVED
+    monkeypatch.undo()
+    config.flush()
+    assert _saved(config_file)["lang"] == "fr"
@@ -0,0 +1,95 @@
+"""Bulk ingest: parent ids, levels and id order match the original ingest."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from tractatus_orm import ingest
+from tractatus_orm.database import Base
+from tractatus_orm.models import Proposition
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _baseline_parent(name: str, names: set[str]) -> str | None:
+    """Parent rule of the original per-row ingest: longest existing proper prefix."""
+    if "." not in name:
+        return None
+    for length in range(len(name) - 1, 0, -1):
+        if name[:length] in names:
+            return name[:length]
+    return None
+
+
+def _baseline_level(name: str, names: set[str]) -> int:
+    level = 1
+    parent = _baseline_parent(name, names)
+    while parent is not None:
+        level += 1
+        parent = _baseline_parent(parent, names)
+    return level
+
+
+def _check_against_baseline(propositions: list[Proposition]) -> None:
+    names = {p.name for p in propositions}
+    by_id = {p.id: p for p in propositions}
+    for p in propositions:
+        parent = by_id[p.parent_id].name if p.parent_id is not None else None
+        assert parent == _baseline_parent(p.name, names), p.name
+        assert p.level == _baseline_level(p.name, names), p.name
+
+    # Ids follow document order, which next/previous navigation relies on
+    ordered = sorted(propositions, key=lambda p: p.sort_order)
+    assert [p.id for p in ordered] == sorted(p.id for p in propositions)
+
+
+@pytest.fixture
+def text_db(tmp_path, monkeypatch):
+    """Point ingest_text at an empty database of its own."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'ingest.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(ingest, "SessionLocal", factory)
+    monkeypatch.setattr(ingest, "init_db", lambda: None)
+    monkeypatch.setattr(ingest, "optimize_search_index", lambda: None)
+    yield factory
+    engine.dispose()
+
+
+def test_text_ingest_matches_baseline_hierarchy(text_db):
+    count = ingest.ingest_text(REPO_ROOT / "tractatus-raw.txt")
+
+    with text_db() as session:
+        propositions = list(session.scalars(select(Proposition)))
+    assert count == len(propositions) > 500
+    _check_against_baseline(propositions)
+
+
+def test_xml_ingest_matches_baseline_hierarchy(session, corpus):
+    propositions = list(session.scalars(select(Proposition)))
+
+    assert len(propositions) == corpus
+    _check_against_baseline(propositions)
+
+
+def test_insert_hierarchy_takes_ids_from_the_database(text_db):
+    rows = [
+        {"name": "1", "text": "a", "level": 1, "sort_order": 0},
+        {"name": "1.1", "text": "b", "level": 2, "sort_order": 1},
+        {"name": "2", "text": "c", "level": 1, "sort_order": 2},
+    ]
+    parents = {"1": None, "1.1": "1", "2": None}
+
+    with text_db() as session:
+        # Rows that already exist push the new ids past them
+        session.add(Proposition(id=40, name="0", text="", level=1, sort_order=0))
+        session.flush()
+        ids = ingest.insert_hierarchy(session, rows, parents)
+        session.commit()
+
+        assert ids == {"1": 41, "1.1": 42, "2": 43}
+        assert session.get(Proposition, 42).parent_id == 41
+        assert ingest.insert_hierarchy(session, [], {}) == {}
@@ -0,0 +1,55 @@
+"""Token-budget packing of batched LLM requests."""
+from __future__ import annotations
+
+import asyncio
+from array import array
+
+from tractatus_agents import llm_openai
+from tractatus_agents.cache import AgentCache
+from tractatus_agents.llm import LLMAgent, pack_by_tokens
+
+
+def test_empty_input_yields_no_groups():
+    assert pack_by_tokens([], 100) == []
+    assert pack_by_tokens(array("I"), 100) == []
+
+
+def test_single_prompt_over_budget_forms_its_own_group():
+    assert pack_by_tokens([500], 100) == [range(0, 1)]
+
+
+def test_oversized_prompt_between_small_ones():
+    assert pack_by_tokens([30, 30, 500, 30], 100) == [range(0, 2), range(2, 3), range(3, 4)]
+
+
+def test_groups_fill_up_to_the_budget_inclusive():
+    assert pack_by_tokens([40, 60, 50, 50, 1], 100) == [range(0, 2), range(2, 4), range(4, 5)]
+
+
+def test_max_items_caps_group_length():
+    assert pack_by_tokens([1] * 5, 100, max_items=2) == [range(0, 2), range(2, 4), range(4, 5)]
+
+
+def test_groups_cover_every_item_once():
+    sizes = [7, 120, 3, 3, 95, 0, 64, 64, 64]
+    groups = pack_by_tokens(sizes, 128)
+
+    assert [i for group in groups for i in group] == list(range(len(sizes)))
+    for group in groups:
+        assert len(group) == 1 or sum(sizes[i] for i in group) <= 128
+
+
+def test_prompts_are_tokenized_only_when_packed(tmp_path, monkeypatch):
+    counted = []
+    monkeypatch.setattr(llm_openai, "count_tokens", lambda text: counted.append(text) or 10)
+    agent = LLMAgent(cache=AgentCache(tmp_path / "cache.sqlite3"))
+
+    responses = asyncio.run(agent.abatch([("comment", "1: a"), ("comment", "2: b")]))
+    assert len(responses) == 2
+    assert counted == []
+
+    batch = agent.prepare_batch([("comment", "1: a"), ("comment", "2: b"), ("comment", "3: c")])
+    assert batch.groups(20) == [range(0, 2), range(2, 3)]
+    assert batch.groups(10) == [range(0, 1), range(1, 2), range(2, 3)]
+    # Counted once, on the first groups() call
+    assert len(counted) == 3
@@ -0,0 +1,95 @@
+"""CachingLLMClient: key namespacing, cache bypass and one-time purge."""
+from __future__ import annotations
+
+import pytest
+
+from tractatus_agents.cache import AgentCache
+from tractatus_agents.llm_cache import CachingLLMClient
+
+
+class _CountingClient:
+    """Backend stub answering with the model name and a call counter."""
+
+    def __init__(self, model: str = "model-a") -> None:
+        self.model = model
+        self.calls = 0
+
+    def complete(self, prompt=None, *, system=None, user=None, max_tokens=None) -> str:
+        self.calls += 1
+        return f"{self.model}:{self.calls}"
+
+
+class _OtherClient(_CountingClient):
+    pass
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return AgentCache(tmp_path / "agent_cache.sqlite3")
+
+
+def test_identical_requests_hit_the_cache(cache):
+    inner = _CountingClient()
+    client = CachingLLMClient(inner, cache)
+
+    assert client.fetch(system="s", user="u", max_tokens=100) == ("model-a:1", False)
+    assert client.fetch(system="s", user="u", max_tokens=100) == ("model-a:1", True)
+    assert inner.calls == 1
+
+
+def test_every_request_field_is_part_of_the_key(cache):
+    inner = _CountingClient()
+    client = CachingLLMClient(inner, cache)
+
+    client.complete(system="s", user="u", max_tokens=100)
+    client.complete(system="s", user="u", max_tokens=200)
+    client.complete(system="t", user="u", max_tokens=100)
+    client.complete(system="s", user="v", max_tokens=100)
+    client.complete("u", max_tokens=100)
+    assert inner.calls == 5
+
+
+def test_backends_and_models_do_not_share_entries(cache):
+    first = CachingLLMClient(_CountingClient("model-a"), cache)
+    other_model = CachingLLMClient(_CountingClient("model-b"), cache)
+    other_backend = CachingLLMClient(_OtherClient("model-a"), cache)
+
+    assert len({first.namespace, other_model.namespace, other_backend.namespace}) == 3
+    assert first.complete(user="u") == "model-a:1"
+    assert other_model.complete(user="u") == "model-b:1"
+    assert other_backend.fetch(user="u") == ("model-a:1", False)
+    assert other_backend.inner.calls == 1
+
+
+def test_refresh_bypasses_and_replaces_the_entry(cache):
+    inner = _CountingClient()
+    client = CachingLLMClient(inner, cache)
+
+    client.complete(user="u")
+    assert client.fetch(user="u", refresh=True) == ("model-a:2", False)
+    assert client.fetch(user="u") == ("model-a:2", True)
+    assert inner.calls == 2
+
+
+def test_entries_survive_a_new_cache_instance(tmp_path):
+    path = tmp_path / "agent_cache.sqlite3"
+    writer = AgentCache(path)
+    CachingLLMClient(_CountingClient(), writer).complete(user="u")
+    # Stores reach SQLite asynchronously
+    writer.flush()
+
+    inner = _CountingClient()
+    assert CachingLLMClient(inner, AgentCache(path)).fetch(user="u") == ("model-a:1", True)
+    assert inner.calls == 0
+
+
+def test_purge_runs_once_per_cache(cache, monkeypatch):
+    purges = []
+    monkeypatch.setattr(cache, "purge", lambda **limits: purges.append(limits) or 0)
+
+    CachingLLMClient(_CountingClient(), cache)
+    CachingLLMClient(_CountingClient("model-b"), cache)
+
+    assert purges == [
+        {"max_age": CachingLLMClient.DEFAULT_TTL, "max_entries": CachingLLMClient.DEFAULT_MAX_ENTRIES}
+    ]
@@ -0,0 +1,79 @@
+"""Stateless navigation in the web API and the shared service."""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+
+@pytest.fixture
+def client(corpus):
+    from app import app
+
+    return app.test_client()
+
+
+def _proposition_id(client, name: str) -> int:
+    return client.post("/api/get", json={"key": name}).get_json()["data"]["id"]
+
+
+def test_service_without_tracking_keeps_no_current(session):
+    from tractatus_service import TractatusService
+
+    service = TractatusService(session, track_current=False)
+    first = service.get("1.1")
+    assert service.current is None
+
+    following = service.next(proposition_id=first["id"])
+    assert following["name"] == "1.11"
+    assert service.parent(proposition_id=following["id"])["name"] == "1.1"
+    assert service.current is None
+
+
+def test_tracking_service_still_moves_current(session):
+    from tractatus_service import TractatusService
+
+    service = TractatusService(session)
+    service.get("1.1")
+    assert service.next()["name"] == "1.11"
+    assert service.current.name == "1.11"
+    assert service.parent()["name"] == "1.1"
+
+
+def test_navigation_requires_an_id(client):
+    assert client.get("/api/next").get_json() == {"success": False, "error": "No current node."}
+    assert client.get("/api/next?id=abc").get_json()["error"] == "Invalid id: abc"
+    assert client.post("/api/next").status_code == 405
+
+
+def test_concurrent_navigation_does_not_race(client):
+    from app import app
+
+    start = _proposition_id(client, "1")
+    ids = range(start, start + 200)
+
+    def next_of(proposition_id: int) -> int:
+        response = app.test_client().get(f"/api/next?id={proposition_id}")
+        return response.get_json()["data"]["id"]
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(next_of, ids))
+    assert results == [proposition_id + 1 for proposition_id in ids]
+
+
+def test_etag_replay_is_bound_to_the_requested_id(client):
+    first = _proposition_id(client, "1.1")
+    second = _proposition_id(client, "2")
+
+    response = client.get(f"/api/children?id={first}")
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "private, max-age=60"
+    etag = response.headers["ETag"]
+
+    replay = client.get(f"/api/children?id={first}", headers={"If-None-Match": etag})
+    assert replay.status_code == 304
+
+    other = client.get(f"/api/children?id={second}", headers={"If-None-Match": etag})
+    assert other.status_code == 200
+    children = other.get_json()["data"]["children"]
+    assert children and all(child["name"].startswith("2.") for child in children)
@@ -0,0 +1,63 @@
+"""OpenAI backend: Idempotency-Key per logical call."""
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from tractatus_agents import llm_openai
+
+_COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-4o-mini",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "Antwort"},
+            "finish_reason": "stop",
+        }
+    ],
+}
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """Idempotency keys of every HTTP attempt, failing each call's first attempt."""
+    from openai import OpenAI
+
+    keys: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        keys.append(request.headers["Idempotency-Key"])
+        if len(keys) % 2:
+            # Retryable server error, retried almost immediately
+            return httpx.Response(500, headers={"retry-after-ms": "1"}, json={})
+        return httpx.Response(200, json=_COMPLETION)
+
+    client = OpenAI(
+        api_key="test",
+        max_retries=1,
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setattr(llm_openai, "_default_client", lambda api_key: client)
+    return keys
+
+
+def test_retries_reuse_the_key_of_their_call(sent):
+    client = llm_openai.OpenAILLMClient()
+
+    assert client.complete(system="s", user="u", max_tokens=100) == "Antwort"
+    assert len(sent) == 2
+    assert sent[0] == sent[1]
+
+
+def test_identical_calls_send_different_keys(sent):
+    client = llm_openai.OpenAILLMClient()
+
+    client.complete(system="s", user="u", max_tokens=100)
+    client.complete(system="s", user="u", max_tokens=100)
+
+    assert len(sent) == 4
+    assert sent[0] != sent[2]
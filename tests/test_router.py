@@ -0,0 +1,48 @@
+"""CLI action tokens: the precomputed prefix map and its ambiguity rules."""
+from __future__ import annotations
+
+import pytest
+
+from tractatus_agents.router import _PREFIX_MAP, AgentAction
+
+
+@pytest.mark.parametrize("prefix", ["c", "co", "com"])
+def test_shared_prefixes_are_not_mapped(prefix):
+    assert prefix not in _PREFIX_MAP
+    with pytest.raises(ValueError, match="Unknown LLM action"):
+        AgentAction.from_cli_token(prefix)
+
+
+@pytest.mark.parametrize(
+    "token, action",
+    [
+        ("comm", AgentAction.COMMENT),
+        ("comp", AgentAction.COMPARISON),
+        ("s", AgentAction.SYNTHESIZE),
+        ("w", AgentAction.WEBSEARCH),
+        ("r", AgentAction.REFERENCE),
+    ],
+)
+def test_unambiguous_prefixes_resolve(token, action):
+    assert _PREFIX_MAP[token] is action
+    assert AgentAction.from_cli_token(token.upper()) is action
+
+
+def test_every_full_name_is_mapped():
+    for action in AgentAction:
+        assert _PREFIX_MAP[action.value] is action
+
+
+def test_tokens_extending_a_full_name_still_match():
+    assert AgentAction.from_cli_token(" Comments ") is AgentAction.COMMENT
+    assert AgentAction.from_cli_token("comparisons") is AgentAction.COMPARISON
+
+
+@pytest.mark.parametrize("token", [None, ""])
+def test_missing_token_defaults_to_comment(token):
+    assert AgentAction.from_cli_token(token) is AgentAction.COMMENT
+
+
+def test_unknown_token_lists_the_actions():
+    with pytest.raises(ValueError, match="comment, comparison"):
+        AgentAction.from_cli_token("summarize")
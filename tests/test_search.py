@@ -0,0 +1,64 @@
+"""Full-text search over the FTS5 index and its LIKE fallback."""
+from __future__ import annotations
+
+from sqlalchemy.exc import OperationalError
+
+from tractatus_orm.models import Proposition
+from tractatus_service import TractatusService
+
+
+def _base_texts(session, result: dict) -> list[str]:
+    """German base texts of the hits (the rendered text follows the display language)."""
+    return [session.get(Proposition, p["id"]).text.lower() for p in result["results"]]
+
+
+def test_fulltext_matches_every_word_as_prefix(session):
+    service = TractatusService(session)
+
+    result = service.search("Welt Tatsache")
+
+    assert result["count"] > 0
+    for text in _base_texts(session, result):
+        assert "welt" in text and "tatsache" in text
+
+
+def test_fulltext_ignores_query_syntax(session):
+    service = TractatusService(session)
+
+    # Quotes and operators are matched literally instead of raising
+    assert "error" not in service.search('Welt" OR "')
+    assert "error" not in service.search("NEAR(")
+
+
+def test_substring_fallback_when_fulltext_finds_nothing(session):
+    service = TractatusService(session)
+
+    # FTS5 matches word prefixes only; "atsach" sits inside "Tatsache"
+    assert service._search_fulltext("atsach") == []
+    result = service.search("atsach")
+
+    assert result["count"] > 0
+    assert all("atsach" in text for text in _base_texts(session, result))
+
+
+def test_like_fallback_without_fts_index(session, monkeypatch):
+    service = TractatusService(session)
+    indexed = service.search("Welt")
+
+    monkeypatch.setattr(type(session), "scalars", _failing_fts(type(session).scalars))
+    result = service.search("Welt")
+
+    # The substring scan finds at least every word-prefix hit
+    assert {p["id"] for p in result["results"]} >= {p["id"] for p in indexed["results"]}
+    assert all("welt" in text for text in _base_texts(session, result))
+
+
+def _failing_fts(scalars):
+    """Wrap Session.scalars so that queries against the FTS table fail."""
+
+    def wrapper(self, statement, *args, **kwargs):
+        if "tractatus_fts" in str(statement):
+            raise OperationalError(str(statement), {}, Exception("no such table: tractatus_fts"))
+        return scalars(self, statement, *args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,60 @@
+"""Streamed /api/tree responses and the shared render memo."""
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture
+def client(corpus):
+    from app import app
+
+    return app.test_client()
+
+
+@pytest.fixture
+def service(client):
+    from app import get_service
+
+    service = get_service()
+    service.invalidate_memo()
+    return service
+
+
+def _proposition_id(client, name: str) -> int:
+    return client.post("/api/get", json={"key": name}).get_json()["data"]["id"]
+
+
+def test_second_tree_request_is_a_memo_hit(client, service, monkeypatch):
+    root = _proposition_id(client, "2.01")
+    first = client.post(f"/api/tree?id={root}")
+    assert first.status_code == 200
+    nodes = first.get_json()["data"]["tree"]
+    assert nodes[0]["name"] == "2.01" and len(nodes) > 1
+
+    def walk(*args, **kwargs):
+        raise AssertionError("tree was rendered again")
+
+    monkeypatch.setattr(service, "_iter_tree_data", walk)
+    second = client.post(f"/api/tree?id={root}")
+
+    assert second.get_json() == first.get_json()
+
+
+def test_tree_and_iter_tree_share_the_memo(client, service):
+    root = _proposition_id(client, "3.1")
+    streamed = client.post(f"/api/tree?id={root}").get_json()["data"]
+
+    rendered = service.tree(proposition_id=root)
+    assert rendered["tree"] == streamed["tree"]
+    assert service.tree(proposition_id=root) is rendered
+
+
+def test_abandoned_stream_is_not_memoized(client, service):
+    root = _proposition_id(client, "4.1")
+    result = service.iter_tree(proposition_id=root)
+    next(result["tree"])
+    result["tree"].close()
+
+    again = service.iter_tree(proposition_id=root)
+    # A miss yields a fresh generator rather than an iterator over a list
+    assert hasattr(again["tree"], "gi_frame")
@@ -7,16 +7,37 @@ configured LLM backend when identical prompts are requested.
 
 from __future__ import annotations
 
+import atexit
 import hashlib
+import logging
+import queue
 import sqlite3
 import tempfile
 import threading
+import time
+import weakref
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
 
 class AgentCache:
-    """Persist LLM responses for reuse across CLI and web sessions."""
+    """Persist LLM responses for reuse across CLI and web sessions.
+
+    Recently used entries are also kept in a bounded in-process LRU so repeat
+    hits skip SQLite entirely. Writes are handed to a background thread that
+    commits them in batches, keeping SQLite commits off the request path.
+    close() stops the thread; so does collecting a cache that was never
+    closed, once its queued writes are done.
+
+    Attributes:
+        failed_writes: Number of stored entries the writer could not persist
+    """
+
+    # Maximum number of responses held in the in-memory LRU tier
+    _MAX = 1024
 
     _CREATE_TABLE = """
     CREATE TABLE IF NOT EXISTS agent_cache (
@@ -28,59 +49,290 @@ class AgentCache:
     )
     """
 
+    # Supports purging by age and per-action statistics without a table scan
+    _CREATE_INDEX = """
+    CREATE INDEX IF NOT EXISTS idx_agent_cache_action_created
+    ON agent_cache(action, created_at)
+    """
+
+    # Rows keyed by the former 64-hex-char SHA-256 digests; _hash_key() can
+    # never produce those keys again
+    _PURGE_LEGACY = "DELETE FROM agent_cache WHERE length(prompt_hash) != 32"
+
+    _PURGE_EXPIRED = "DELETE FROM agent_cache WHERE created_at < datetime('now', ?)"
+
+    _PURGE_OVERFLOW = """
+    DELETE FROM agent_cache WHERE prompt_hash IN (
+        SELECT prompt_hash FROM agent_cache ORDER BY created_at DESC LIMIT -1 OFFSET ?
+    )
+    """
+
+    _SELECT = "SELECT content FROM agent_cache WHERE prompt_hash = ?"
+
     def __init__(self, path: str | Path | None = None) -> None:
         temp_dir = Path(tempfile.gettempdir())
         self.path = Path(path) if path is not None else temp_dir / "tractatus_agent_cache.sqlite3"
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self._lock = threading.Lock()
+        self._tls = threading.local()
+        self._mem: OrderedDict[str, str] = OrderedDict()
+        self._mem_lock = threading.Lock()
+        self._purge_lock = threading.Lock()
+        self._purged = False
         self._initialise()
+        self._writer = _BatchWriter(self.path, self._lock)
+        # Stops the thread if the cache is dropped without close(); the
+        # callback references only the writer, so the cache stays collectable
+        self._finalizer = weakref.finalize(self, self._writer.stop)
+        self._finalizer.atexit = False
+        _OPEN_CACHES.add(self)
+
+    @property
+    def failed_writes(self) -> int:
+        """Number of stored entries the writer could not persist."""
+        return self._writer.failed_writes
 
     def lookup(self, action: str, prompt: str) -> Optional[str]:
         """Return cached response text for the supplied action + prompt."""
 
         cache_key = self._hash_key(action, prompt)
-        with self._lock:
-            with self._connect() as conn:
-                row = conn.execute(
-                    "SELECT content FROM agent_cache WHERE prompt_hash = ?",
-                    (cache_key,),
-                ).fetchone()
+        with self._mem_lock:
+            content = self._mem.get(cache_key)
+            if content is not None:
+                self._mem.move_to_end(cache_key)
+                return content
+
+        # WAL readers never block on the writer, so no lock is needed here
+        row = self._connect().execute(self._SELECT, (cache_key,)).fetchone()
         if row:
+            self._remember(cache_key, row[0])
             return row[0]
         return None
 
     def store(self, action: str, prompt: str, content: str) -> None:
-        """Persist the generated content for future reuse."""
+        """Persist the generated content for future reuse.
+
+        The entry is visible to lookup() immediately via the in-memory tier;
+        the SQLite write happens asynchronously (see flush()).
+        """
 
         cache_key = self._hash_key(action, prompt)
+        self._remember(cache_key, content)
+        self._writer.queue.put((cache_key, action, prompt, content))
+
+    def purge(self, max_age: float | None = None, max_entries: int | None = None) -> int:
+        """Delete expired entries and trim the cache to a maximum size.
+
+        Rows left behind by the former SHA-256 cache keys are always deleted,
+        since no lookup can reach them.
+
+        Args:
+            max_age: Drop entries older than this many seconds
+            max_entries: Keep at most this many of the newest entries
+
+        Returns:
+            Number of rows deleted.
+        """
+
+        self.flush()
+        conn = self._connect()
+        deleted = 0
         with self._lock:
-            with self._connect() as conn:
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO agent_cache
-                    (prompt_hash, action, prompt, content)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (cache_key, action, prompt, content),
-                )
-                conn.commit()
+            deleted += conn.execute(self._PURGE_LEGACY).rowcount
+            if max_age is not None:
+                deleted += conn.execute(
+                    self._PURGE_EXPIRED, (f"-{int(max_age)} seconds",)
+                ).rowcount
+            if max_entries is not None:
+                deleted += conn.execute(self._PURGE_OVERFLOW, (max_entries,)).rowcount
+        if deleted:
+            # The LRU tier may still hold purged rows
+            with self._mem_lock:
+                self._mem.clear()
+        return deleted
+
+    def purge_once(self, max_age: float | None = None, max_entries: int | None = None) -> int:
+        """Run purge() on the first call for this cache; later calls do nothing.
+
+        Clients wrapping the cache are rebuilt whenever the LLM preferences
+        change, so purging on every construction would rescan the table each
+        time. Once per cache (i.e. per process) is enough.
+
+        Returns:
+            Number of rows deleted (always 0 after the first call).
+        """
+
+        with self._purge_lock:
+            if self._purged:
+                return 0
+            self._purged = True
+        return self.purge(max_age=max_age, max_entries=max_entries)
+
+    def flush(self) -> None:
+        """Block until every queued store has been written to SQLite."""
+
+        self._writer.queue.join()
+
+    def close(self) -> None:
+        """Write the queued stores, then stop the writer thread.
+
+        The cache must not be used afterwards. Calling close() again does
+        nothing.
+        """
+
+        if self._finalizer.detach() is None:
+            return
+        self._writer.stop()
+        self._writer.thread.join()
+        _OPEN_CACHES.discard(self)
+        conn = getattr(self._tls, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._tls.conn = None
+
+    def _remember(self, cache_key: str, content: str) -> None:
+        """Insert into the in-memory LRU, evicting the oldest entry when full."""
+
+        with self._mem_lock:
+            self._mem[cache_key] = content
+            self._mem.move_to_end(cache_key)
+            if len(self._mem) > self._MAX:
+                self._mem.popitem(last=False)
 
     def _initialise(self) -> None:
         with self._lock:
-            with self._connect() as conn:
-                conn.execute(self._CREATE_TABLE)
-                conn.commit()
+            conn = self._connect()
+            conn.execute(self._CREATE_TABLE)
+            conn.execute(self._CREATE_INDEX)
 
     def _connect(self) -> sqlite3.Connection:
-        return sqlite3.connect(self.path, check_same_thread=False)
+        """Return this thread's connection, opening and tuning it on first use.
+
+        Connections run in autocommit mode (``isolation_level=None``) with WAL
+        journaling, so every statement commits on its own and readers proceed
+        concurrently with the single writer.
+        """
+
+        conn = getattr(self._tls, "conn", None)
+        if conn is None:
+            conn = _open_connection(self.path)
+            self._tls.conn = conn
+        return conn
 
     @staticmethod
     def _hash_key(action: str, prompt: str) -> str:
-        digest = hashlib.sha256()
-        digest.update(action.encode("utf-8"))
-        digest.update(b"\0")
-        digest.update(prompt.encode("utf-8"))
-        return digest.hexdigest()
+        # 128-bit BLAKE2b: faster than SHA-256 on long prompts and ample for a
+        # non-adversarial cache key (32 hex chars). Rows stored under the
+        # former SHA-256 keys (64 hex chars) are orphaned by the switch and
+        # are deleted by purge().
+        material = f"{action}\0{prompt}".encode("utf-8")
+        return hashlib.blake2b(material, digest_size=16).hexdigest()
+
+
+# Completions are often multi-KB; larger pages keep them on fewer pages
+_PAGE_SIZE = 8192
+
+
+def _open_connection(path: Path) -> sqlite3.Connection:
+    """Open and tune a connection to the cache database (see AgentCache._connect)."""
+
+    conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    # Only takes effect on a fresh file, so it must precede the WAL
+    # switch (the first write); existing caches keep their page size
+    conn.execute(f"PRAGMA page_size={_PAGE_SIZE}")
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+
+
+class _BatchWriter:
+    """Background thread committing an AgentCache's stores in batches.
+
+    Kept apart from AgentCache so the running thread holds no reference to
+    the cache itself.
+    """
+
+    # How long the writer waits to coalesce further stores into one transaction
+    _BATCH_WINDOW = 0.05
+    # Upper bound on rows written per transaction
+    _BATCH_MAX = 256
+
+    _INSERT = """
+    INSERT OR REPLACE INTO agent_cache
+    (prompt_hash, action, prompt, content)
+    VALUES (?, ?, ?, ?)
+    """
+
+    def __init__(self, path: Path, lock: threading.Lock) -> None:
+        self.path = path
+        # Shared with the cache's purge(), which must not interleave a batch
+        self.lock = lock
+        self.failed_writes = 0
+        # Stores to write; None asks the thread to stop
+        self.queue: queue.Queue[tuple[str, str, str, str] | None] = queue.Queue()
+        self.thread = threading.Thread(target=self._run, name="agent-cache-writer", daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """Let the thread finish the stores queued so far, then exit."""
+
+        self.queue.put(None)
+
+    def _run(self) -> None:
+        """Drain the store queue, committing each batch in one transaction."""
+
+        conn = _open_connection(self.path)
+        stopping = False
+        while not stopping:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + self._BATCH_WINDOW
+            while len(batch) < self._BATCH_MAX and batch[-1] is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            if batch[-1] is None:
+                stopping = True
+            rows = [row for row in batch if row is not None]
+            try:
+                if rows:
+                    self.write_batch(conn, rows)
+            except sqlite3.Error as exc:
+                # Counted before task_done(), so it is settled once flush() returns
+                self.failed_writes += len(rows)
+                logger.warning(
+                    "could not persist %d agent cache entries: %s", len(rows), exc
+                )
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+        conn.close()
+
+    def write_batch(self, conn: sqlite3.Connection, rows: list[tuple[str, str, str, str]]) -> None:
+        # INSERT OR REPLACE is idempotent, so batching may reorder stores safely
+        with self.lock:
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(self._INSERT, rows)
+            except sqlite3.Error:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+
+# Caches that may still have queued stores. A single exit hook flushes them;
+# weak references leave discarded caches free to be collected
+_OPEN_CACHES: "weakref.WeakSet[AgentCache]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_caches() -> None:
+    for cache in list(_OPEN_CACHES):
+        cache.flush()
 
 
 _DEFAULT_CACHE: AgentCache | None = None
@@ -0,0 +1,44 @@
+"""Process-wide HTTP connection pool shared by the hosted LLM clients.
+
+Agent routers are rebuilt whenever LLM preferences change, and each rebuild
+creates fresh SDK clients. Handing them one shared ``httpx.Client`` keeps
+keep-alive connections (and their TLS sessions) warm across those rebuilds
+instead of paying a new handshake per client.
+
+HTTP/2 is negotiated with the hosted APIs when the optional ``h2`` package
+(``httpx[http2]``) is installed: concurrent requests from the web workers
+then share multiplexed streams on a few connections. Local plain-HTTP
+endpoints such as Ollama stay on HTTP/1.1 either way.
+"""
+from __future__ import annotations
+
+import atexit
+import functools
+import importlib.util
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import httpx
+
+# Sized for the web app's worker threads plus batch fan-out
+_MAX_CONNECTIONS = 64
+_MAX_KEEPALIVE = 32
+_TIMEOUT = 60.0
+
+# httpx refuses http2=True without h2, so it is only requested when present
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+@functools.lru_cache(maxsize=1)
+def get_http_client() -> httpx.Client:
+    """Return the shared synchronous HTTP client, creating it on first use."""
+
+    import httpx
+
+    client = httpx.Client(
+        limits=httpx.Limits(max_connections=_MAX_CONNECTIONS, max_keepalive_connections=_MAX_KEEPALIVE),
+        timeout=_TIMEOUT,
+        http2=_HTTP2,
+    )
+    atexit.register(client.close)
+    return client
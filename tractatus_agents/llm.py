@@ -1,10 +1,27 @@
 """Lightweight LLM abstraction used by the CLI agent commands."""
 from __future__ import annotations
 
+import asyncio
+import bisect
+import hashlib
+import itertools
+import json
+import random
+import re
+import sys
+from array import array
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Protocol
 
-from .cache import AgentCache, get_default_cache
+try:  # POSIX only; checkpoint appends are unlocked elsewhere
+    import fcntl
+except ImportError:  # pragma: no cover - platform dependent
+    fcntl = None
+
+from .cache import AgentCache
+from .llm_cache import CachingLLMClient, SemanticCachingLLMClient
 from .prompts import build_prompt_pair
 
 
@@ -29,17 +46,113 @@ class LLMClient(Protocol):
             max_tokens: Maximum tokens in the response
 
         Either 'prompt' or both 'system'/'user' must be provided.
+
+        Backends may additionally provide an awaitable ``acomplete`` with the
+        same signature; ``LLMAgent.abatch`` uses it when present and otherwise
+        runs ``complete`` in a worker thread. Likewise an optional ``stream``
+        method yields the text in chunks as it is generated; backends without
+        it are streamed as a single chunk.
         """
 
 
-@dataclass(slots=True)
 class LLMResponse:
-    """Structured response returned to the CLI after an agent invocation."""
+    """Structured response returned to the CLI after an agent invocation.
+
+    A plain slotted class: batches create one per item, and responses are
+    never compared or hashed, so dataclass-generated methods buy nothing.
+    """
+
+    # system and user are kept apart so every response shares the interned
+    # SYSTEM_PROMPT instead of holding its own copy of the joined prompt
+    __slots__ = ("action", "content", "system", "user", "cached")
+
+    def __init__(
+        self,
+        action: str,
+        content: str,
+        system: str,
+        user: str,
+        cached: bool = False,
+    ) -> None:
+        self.action = action
+        self.content = content
+        self.system = system
+        self.user = user
+        self.cached = cached
+
+    @property
+    def prompt(self) -> str:
+        """The full prompt as sent: system and user text joined."""
+        return f"{self.system}\n\n{self.user}"
+
+
+@dataclass(slots=True, frozen=True)
+class LLMRequest:
+    """One fully prepared completion request."""
 
     action: str
-    content: str
-    prompt: str
-    cached: bool = False
+    system: str
+    user: str
+    max_tokens: int | None
+
+
+@dataclass(slots=True)
+class LLMBatch:
+    """Column-oriented set of prepared requests.
+
+    Parallel lists instead of one object per request; ``groups()`` splits
+    the batch by token budget with a single cumulative-sum pass. The prompt
+    token counts it needs are computed on its first call, so batches that
+    are never packed (``LLMAgent.abatch``) skip tokenizing entirely.
+    """
+
+    actions: list[str]
+    systems: list[str]
+    users: list[str]
+    max_tokens: int | None
+    n_tokens: array | None = None
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+    def request(self, index: int) -> LLMRequest:
+        """Materialize request ``index`` as an LLMRequest."""
+        return LLMRequest(
+            self.actions[index], self.systems[index], self.users[index], self.max_tokens
+        )
+
+    def groups(self, budget: int) -> list[range]:
+        """Split the batch into consecutive runs whose token sum fits budget."""
+        if self.n_tokens is None:
+            from .llm_openai import count_tokens
+
+            self.n_tokens = array("l", (count_tokens(user) for user in self.users))
+        return pack_by_tokens(self.n_tokens, budget)
+
+
+def pack_by_tokens(
+    n_tokens: array | list[int], budget: int, max_items: int | None = None
+) -> list[range]:
+    """Greedily split consecutive items into runs totalling at most budget tokens.
+
+    Split points are found by binary search over the cumulative sums, so the
+    per-item work happens in C (``itertools.accumulate``) rather than in a
+    Python loop. An item larger than the budget forms a run on its own, and
+    ``max_items`` optionally caps the length of every run.
+    """
+    cumulative = list(itertools.accumulate(n_tokens))
+    groups: list[range] = []
+    start = 0
+    total = len(cumulative)
+    while start < total:
+        base = cumulative[start - 1] if start else 0
+        end = bisect.bisect_right(cumulative, base + budget, lo=start)
+        end = max(end, start + 1)
+        if max_items is not None:
+            end = min(end, start + max_items)
+        groups.append(range(start, end))
+        start = end
+    return groups
 
 
 class EchoLLMClient:
@@ -70,20 +183,98 @@ class EchoLLMClient:
             f"{prompt_display}"
         )
 
+    async def acomplete(
+        self,
+        prompt: str | None = None,
+        *,
+        system: str | None = None,
+        user: str | None = None,
+        max_tokens: int | None = None,
+    ) -> str:
+        return self.complete(prompt, system=system, user=user, max_tokens=max_tokens)
+
+    def stream(
+        self,
+        prompt: str | None = None,
+        *,
+        system: str | None = None,
+        user: str | None = None,
+        max_tokens: int | None = None,
+    ) -> Iterator[str]:
+        yield self.complete(prompt, system=system, user=user, max_tokens=max_tokens)
+
+
+def _output_limit(client: object) -> int | None:
+    """Return the max_output_tokens declared by client or a client it wraps."""
+    while client is not None:
+        limit = getattr(client, "max_output_tokens", None)
+        if limit:
+            return limit
+        # Caching decorators keep the backend in .inner (exact) or .exact (semantic)
+        client = getattr(client, "inner", None) or getattr(client, "exact", None)
+    return None
+
+
+def _is_rate_limited(exc: BaseException) -> bool:
+    """Return True if exc (or the error it wraps) is an HTTP 429 from a provider."""
+    for error in (exc, exc.__cause__):
+        if error is None:
+            continue
+        if type(error).__name__ == "RateLimitError":
+            return True
+        if getattr(error, "status_code", None) == 429:
+            return True
+    return False
+
 
 class LLMAgent:
     """Encapsulates prompt engineering for the different CLI agent actions."""
 
+    # Response labels for the prompt actions accepted by abatch()
+    _ACTION_LABELS = {
+        "comment": "Comment",
+        "comparison": "Comparison",
+        "synthesize": "Synthesize",
+        "websearch": "Websearch",
+        "reference": "Reference",
+    }
+    # Separator placed before each item of a packed batch_comment() request
+    _BATCH_MARKER = "\n---\n<ID {}>\n"
+    _BATCH_MARKER_RE = re.compile(r"<ID (\d+)>")
+    # Approximate token cost of one marker
+    _BATCH_MARKER_TOKENS = 8
+    # Models often wrap JSON answers in a Markdown code fence
+    _CODE_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$")
+    # Retry policy for rate-limited batch requests (exponential backoff)
+    _MAX_RETRIES = 5
+    _BACKOFF_BASE = 1.0
+    # Output limit assumed for backends that do not declare max_output_tokens
+    _DEFAULT_MAX_OUTPUT_TOKENS = 4096
+    # Completion budget the backends use when max_tokens is None
+    _DEFAULT_RESPONSE_TOKENS = 2000
+
     def __init__(
         self,
         client: LLMClient | None = None,
         *,
         max_tokens: int | None = 500,
         cache: AgentCache | None = None,
+        semantic_cache: bool = False,
+        semantic_threshold: float = SemanticCachingLLMClient.DEFAULT_THRESHOLD,
     ) -> None:
-        self._client = client or EchoLLMClient()
+        client = client or EchoLLMClient()
+        self._max_output_tokens = _output_limit(client) or self._DEFAULT_MAX_OUTPUT_TOKENS
+        if not isinstance(client, (CachingLLMClient, SemanticCachingLLMClient)):
+            # Identical requests are answered from the response cache
+            client = CachingLLMClient(client, cache)
+            if semantic_cache:
+                # Paraphrased requests may reuse a similar earlier answer
+                try:
+                    client = SemanticCachingLLMClient(client, threshold=semantic_threshold)
+                except RuntimeError as exc:
+                    print(f"Warning: {exc} Using exact-match caching only.")
+        self._client = client
         self._max_tokens = max_tokens
-        self._cache = cache or get_default_cache()
 
     def comment(
         self,
@@ -91,11 +282,153 @@ class LLMAgent:
         language: str | None = None,
         *,
         user_input: str | None = None,
+        use_cache: bool = True,
     ) -> LLMResponse:
         prompt_pair = build_prompt_pair(
             "comment", payload, language=language, user_input=user_input
         )
-        return self._ask("Comment", prompt_pair)
+        return self._ask("Comment", prompt_pair, use_cache=use_cache)
+
+    def batch_comment(
+        self,
+        items: list[str],
+        language: str | None = None,
+        *,
+        max_tokens_per_request: int = 6000,
+        max_items_per_request: int | None = None,
+    ) -> list[LLMResponse]:
+        """Comment on many propositions with as few requests as possible.
+
+        Items are packed greedily into requests whose payload stays within
+        ``max_tokens_per_request``; the model answers each packed request with
+        a JSON array keyed by item ID. Items missing from an answer are
+        commented on individually.
+
+        A packed request asks for one answer budget per item, so the number
+        of items per request is also bounded by the backend's output limit
+        divided by that budget.
+
+        Args:
+            items: Formatted propositions, e.g. ``"1.1: Die Welt ist ..."``
+            language: Optional language code for the responses
+            max_tokens_per_request: Prompt token budget of one packed request
+            max_items_per_request: Cap on the items in one request; defaults
+                to (and is clamped at) the number of answers that fit into
+                the backend's output limit
+
+        Returns:
+            One LLMResponse per item, in input order.
+        """
+        from .llm_openai import count_tokens
+
+        results: list[LLMResponse | None] = [None] * len(items)
+        sizes = array("l", (count_tokens(item) + self._BATCH_MARKER_TOKENS for item in items))
+        answer_tokens = self._max_tokens or self._DEFAULT_RESPONSE_TOKENS
+        items_limit = max(1, self._max_output_tokens // answer_tokens)
+        if max_items_per_request is not None:
+            items_limit = min(items_limit, max_items_per_request)
+        for group in pack_by_tokens(sizes, max_tokens_per_request, items_limit):
+            if len(group) == 1:
+                results[group[0]] = self.comment(items[group[0]], language=language)
+                continue
+
+            payload = "".join(
+                self._BATCH_MARKER.format(local_id) + items[index].strip()
+                for local_id, index in enumerate(group)
+            )
+            prompt_pair = build_prompt_pair("comment_batch", payload, language=language)
+            # The output budget covers one answer per packed item
+            max_tokens = min(answer_tokens * len(group), self._max_output_tokens)
+            response = self._ask("Comment", prompt_pair, max_tokens=max_tokens)
+            answers = self._parse_batch(response.content)
+            for local_id, index in enumerate(group):
+                answer = answers.get(local_id)
+                if answer:
+                    results[index] = LLMResponse(
+                        action="Comment",
+                        content=answer,
+                        system=response.system,
+                        user=response.user,
+                        cached=response.cached,
+                    )
+                else:
+                    results[index] = self.comment(items[index], language=language)
+        return results
+
+    def prepare_batch(
+        self, specs: list[tuple[str, str]], language: str | None = None
+    ) -> LLMBatch:
+        """Build prompts for ``(action, payload)`` pairs as an LLMBatch."""
+        actions: list[str] = []
+        systems: list[str] = []
+        users: list[str] = []
+        for action, payload in specs:
+            prompt_pair = build_prompt_pair(action, payload, language=language)
+            actions.append(self._ACTION_LABELS.get(action.lower(), "Comment"))
+            systems.append(prompt_pair["system"])
+            users.append(prompt_pair["user"])
+        return LLMBatch(actions, systems, users, self._max_tokens)
+
+    def _parse_batch(self, content: str) -> dict[int, str]:
+        """Map item IDs to answers from a packed response.
+
+        Expects the requested JSON array; falls back to splitting on the
+        ``<ID k>`` markers when the model answered in free text.
+        """
+        text = self._CODE_FENCE_RE.sub("", content.strip())
+        try:
+            data = json.loads(text)
+        except ValueError:
+            data = None
+
+        answers: dict[int, str] = {}
+        if isinstance(data, list):
+            for entry in data:
+                if isinstance(entry, dict) and "id" in entry and "comment" in entry:
+                    try:
+                        answers[int(entry["id"])] = str(entry["comment"]).strip()
+                    except (TypeError, ValueError):
+                        continue
+        elif isinstance(data, dict):
+            for key, value in data.items():
+                if str(key).isdigit():
+                    answers[int(key)] = str(value).strip()
+        else:
+            parts = self._BATCH_MARKER_RE.split(content)
+            # parts = [preamble, id, text, id, text, ...]
+            for raw_id, answer in zip(parts[1::2], parts[2::2]):
+                answers[int(raw_id)] = answer.strip().strip("-").strip()
+        return answers
+
+    def stream_comment(
+        self,
+        payload: str,
+        language: str | None = None,
+        *,
+        user_input: str | None = None,
+    ) -> Iterator[LLMResponse]:
+        """Like comment(), but yield the response as it is generated.
+
+        Each yielded LLMResponse carries the content received so far; the
+        last one holds the complete text.
+        """
+        prompt_pair = build_prompt_pair(
+            "comment", payload, language=language, user_input=user_input
+        )
+        content = ""
+        for chunk, cached in self._client.stream_cached(
+            system=prompt_pair["system"],
+            user=prompt_pair["user"],
+            max_tokens=self._max_tokens,
+        ):
+            content += chunk
+            yield LLMResponse(
+                action="Comment",
+                content=content,
+                system=prompt_pair["system"],
+                user=prompt_pair["user"],
+                cached=cached,
+            )
 
     def compare(
         self,
@@ -103,11 +436,12 @@ class LLMAgent:
         language: str | None = None,
         *,
         user_input: str | None = None,
+        use_cache: bool = True,
     ) -> LLMResponse:
         prompt_pair = build_prompt_pair(
             "comparison", payload, language=language, user_input=user_input
         )
-        return self._ask("Comparison", prompt_pair)
+        return self._ask("Comparison", prompt_pair, use_cache=use_cache)
 
     def synthesize(
         self,
@@ -115,11 +449,12 @@ class LLMAgent:
         language: str | None = None,
         *,
         user_input: str | None = None,
+        use_cache: bool = True,
     ) -> LLMResponse:
         prompt_pair = build_prompt_pair(
             "synthesize", payload, language=language, user_input=user_input
         )
-        return self._ask("Synthesize", prompt_pair)
+        return self._ask("Synthesize", prompt_pair, use_cache=use_cache)
 
     def websearch(
         self,
@@ -127,11 +462,12 @@ class LLMAgent:
         language: str | None = None,
         *,
         user_input: str | None = None,
+        use_cache: bool = True,
     ) -> LLMResponse:
         prompt_pair = build_prompt_pair(
             "websearch", payload, language=language, user_input=user_input
         )
-        return self._ask("Websearch", prompt_pair)
+        return self._ask("Websearch", prompt_pair, use_cache=use_cache)
 
     def reference(
         self,
@@ -139,24 +475,133 @@ class LLMAgent:
         language: str | None = None,
         *,
         user_input: str | None = None,
+        use_cache: bool = True,
     ) -> LLMResponse:
         prompt_pair = build_prompt_pair(
             "reference", payload, language=language, user_input=user_input
         )
-        return self._ask("Reference", prompt_pair)
-
-    def _ask(self, action: str, prompt_pair: dict[str, str]) -> LLMResponse:
-        """Ask the LLM using system + user prompt pair."""
-        full_prompt = f"{prompt_pair['system']}\n\n{prompt_pair['user']}"
+        return self._ask("Reference", prompt_pair, use_cache=use_cache)
 
-        cached_content = self._cache.lookup(action, full_prompt)
-        if cached_content is not None:
-            return LLMResponse(action=action, content=cached_content, prompt=full_prompt, cached=True)
+    def _ask(
+        self,
+        action: str,
+        prompt_pair: Mapping[str, str],
+        *,
+        max_tokens: int | None = None,
+        use_cache: bool = True,
+    ) -> LLMResponse:
+        """Ask the LLM using system + user prompt pair.
 
-        content = self._client.complete(
+        With ``use_cache=False`` the backend is always called; its answer
+        still replaces the cached one.
+        """
+        content, cached = self._client.fetch(
             system=prompt_pair["system"],
             user=prompt_pair["user"],
-            max_tokens=self._max_tokens,
+            max_tokens=max_tokens or self._max_tokens,
+            refresh=not use_cache,
+        )
+        return LLMResponse(
+            action=action,
+            content=content,
+            system=prompt_pair["system"],
+            user=prompt_pair["user"],
+            cached=cached,
+        )
+
+    async def abatch(
+        self,
+        actions: list[tuple[str, str]],
+        language: str | None = None,
+        *,
+        concurrency: int = 8,
+        checkpoint: str | Path | None = None,
+    ) -> list[LLMResponse]:
+        """Run several agent actions concurrently.
+
+        Args:
+            actions: ``(action, payload)`` pairs, e.g. ``("comment", "1: Die Welt ...")``
+            language: Optional language code applied to every prompt
+            concurrency: Maximum number of requests in flight at once
+            checkpoint: Optional JSONL file. Every finished response is appended
+                as soon as it arrives, and pairs already recorded there are not
+                requested again, so an interrupted batch resumes where it stopped.
+
+        Returns:
+            One LLMResponse per input pair, in input order.
+        """
+        gate = asyncio.Semaphore(concurrency)
+        checkpoint = Path(checkpoint) if checkpoint is not None else None
+        done = self._load_checkpoint(checkpoint) if checkpoint is not None else {}
+        keys = [self._checkpoint_key(action, payload, language) for action, payload in actions]
+        pending = [index for index, key in enumerate(keys) if key not in done]
+        batch = self.prepare_batch([actions[index] for index in pending], language)
+
+        async def run(position: int) -> None:
+            async with gate:
+                response = await self._aask(batch.request(position))
+            key = keys[pending[position]]
+            done[key] = response
+            if checkpoint is not None:
+                self._append_checkpoint(checkpoint, key, response)
+
+        await asyncio.gather(*(run(position) for position in range(len(batch))))
+        return [done[key] for key in keys]
+
+    @staticmethod
+    def _checkpoint_key(action: str, payload: str, language: str | None) -> str:
+        material = f"{action}|{language or ''}|{payload}".encode("utf-8")
+        return hashlib.blake2b(material, digest_size=16).hexdigest()
+
+    @staticmethod
+    def _load_checkpoint(path: Path) -> dict[str, LLMResponse]:
+        """Read finished responses from a checkpoint file, if it exists."""
+        done: dict[str, LLMResponse] = {}
+        if not path.exists():
+            return done
+        with path.open(encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    record = json.loads(line)
+                    response = LLMResponse(**record["r"])
+                    # Share one system string across the loaded responses
+                    response.system = sys.intern(response.system)
+                    done[record["k"]] = response
+                except (ValueError, KeyError, TypeError):
+                    # A crash mid-write can leave a truncated last line
+                    continue
+        return done
+
+    @staticmethod
+    def _append_checkpoint(path: Path, key: str, response: LLMResponse) -> None:
+        record = {name: getattr(response, name) for name in LLMResponse.__slots__}
+        line = json.dumps({"k": key, "r": record}, ensure_ascii=False) + "\n"
+        with path.open("a", encoding="utf-8") as handle:
+            if fcntl is not None:
+                # Other processes may resume from the same file
+                fcntl.flock(handle, fcntl.LOCK_EX)
+            handle.write(line)
+
+    async def _aask(self, request: LLMRequest) -> LLMResponse:
+        """Async counterpart of _ask(), retrying rate-limited requests."""
+        for attempt in range(self._MAX_RETRIES + 1):
+            try:
+                content, cached = await self._client.afetch(
+                    system=request.system,
+                    user=request.user,
+                    max_tokens=request.max_tokens,
+                )
+                break
+            except Exception as exc:
+                if attempt == self._MAX_RETRIES or not _is_rate_limited(exc):
+                    raise
+                # Full jitter keeps concurrent retries from re-colliding
+                await asyncio.sleep(random.uniform(0, self._BACKOFF_BASE * 2**attempt))
+
+        return LLMResponse(
+            action=request.action,
+            content=content,
+            system=request.system,
+            user=request.user,
+            cached=cached,
         )
-        self._cache.store(action, full_prompt, content)
-        return LLMResponse(action=action, content=content, prompt=full_prompt)
@@ -6,6 +6,8 @@ system prompts and configurable token limits.
 
 Environment Variables:
     ANTHROPIC_API_KEY: Required API key for Anthropic Claude access
+    ANTHROPIC_RPM: Requests per minute allowed by the account (default: 50)
+    ANTHROPIC_TPM: Tokens per minute allowed by the account (default: 80000)
 
 Supported Models:
     - claude-3-5-sonnet-20241022 (default): Most capable model for complex reasoning
@@ -19,10 +21,26 @@ Usage:
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
 
-from anthropic import Anthropic
-
+from .http_pool import get_http_client
 from .llm import LLMClient
+from .ratelimit import estimate_tokens, get_limiter
+
+# The SDK is imported on first use: importing it costs hundreds of
+# milliseconds, and most CLI sessions never reach this backend
+if TYPE_CHECKING:
+    from anthropic import AsyncAnthropic
+
+
+# Largest completion (max_tokens) each supported model accepts
+_MAX_OUTPUT_TOKENS = {
+    "claude-3-5-sonnet-20241022": 8192,
+    "claude-3-5-haiku-20241022": 8192,
+    "claude-3-opus-20240229": 4096,
+}
+_DEFAULT_MAX_OUTPUT_TOKENS = 4096
 
 
 class AnthropicLLMClient(LLMClient):
@@ -34,14 +52,24 @@ class AnthropicLLMClient(LLMClient):
 
     Attributes:
         client: Anthropic API client instance
+        aclient: Async Anthropic client, created on first use by acomplete()
         model: Model identifier (e.g., "claude-3-5-sonnet-20241022")
+        max_output_tokens: Largest max_tokens the model accepts
+        cache_system: Whether the system prompt is marked for prompt caching
     """
 
-    def __init__(self, model: str = "claude-3-5-sonnet-20241022") -> None:
+    def __init__(
+        self,
+        model: str = "claude-3-5-sonnet-20241022",
+        *,
+        cache_system: bool = True,
+    ) -> None:
         """Initialize the Anthropic client with API credentials.
 
         Args:
             model: Claude model identifier. Defaults to Claude 3.5 Sonnet.
+            cache_system: Mark the system prompt with ``cache_control`` so the
+                shared prefix is served from Anthropic's prompt cache.
 
         Raises:
             RuntimeError: If ANTHROPIC_API_KEY environment variable is not set
@@ -55,8 +83,30 @@ class AnthropicLLMClient(LLMClient):
             raise RuntimeError(
                 "Missing ANTHROPIC_API_KEY. Export it before launching the CLI or web app."
             )
-        self.client = Anthropic(api_key=key)
+        self._api_key = key
+        from anthropic import Anthropic
+
+        # Reuse the process-wide connection pool across client instances
+        self.client = Anthropic(api_key=key, http_client=get_http_client())
+        self._aclient: AsyncAnthropic | None = None
         self.model = model
+        self.max_output_tokens = _MAX_OUTPUT_TOKENS.get(model, _DEFAULT_MAX_OUTPUT_TOKENS)
+        self.cache_system = cache_system
+        # Shared by all Anthropic clients: the limits apply per account
+        self._limiter = get_limiter(
+            "anthropic",
+            int(os.getenv("ANTHROPIC_RPM", "50")),
+            int(os.getenv("ANTHROPIC_TPM", "80000")),
+        )
+
+    @property
+    def aclient(self) -> AsyncAnthropic:
+        """Async API client, created lazily so sync-only callers never open it."""
+        if self._aclient is None:
+            from anthropic import AsyncAnthropic
+
+            self._aclient = AsyncAnthropic(api_key=self._api_key)
+        return self._aclient
 
     def complete(
         self,
@@ -91,6 +141,47 @@ class AnthropicLLMClient(LLMClient):
                 max_tokens=1500
             )
         """
+        # Call Anthropic Messages API once the account's rate budget allows
+        self._limiter.acquire_sync(estimate_tokens(system, user or prompt, max_tokens or 2000))
+        response = self.client.messages.create(**self._build_params(prompt, system, user, max_tokens))
+        return self._extract_text(response)
+
+    def stream(
+        self,
+        prompt: str | None = None,
+        *,
+        system: str | None = None,
+        user: str | None = None,
+        max_tokens: int | None = None,
+    ) -> Iterator[str]:
+        """Yield the completion incrementally via the Messages streaming API."""
+        self._limiter.acquire_sync(estimate_tokens(system, user or prompt, max_tokens or 2000))
+        with self.client.messages.stream(**self._build_params(prompt, system, user, max_tokens)) as s:
+            yield from s.text_stream
+
+    async def acomplete(
+        self,
+        prompt: str | None = None,
+        *,
+        system: str | None = None,
+        user: str | None = None,
+        max_tokens: int | None = None,
+    ) -> str:
+        """Awaitable variant of complete() using the async Anthropic client."""
+        await self._limiter.acquire(estimate_tokens(system, user or prompt, max_tokens or 2000))
+        response = await self.aclient.messages.create(
+            **self._build_params(prompt, system, user, max_tokens)
+        )
+        return self._extract_text(response)
+
+    def _build_params(
+        self,
+        prompt: str | None,
+        system: str | None,
+        user: str | None,
+        max_tokens: int | None,
+    ) -> dict:
+        """Build Messages API request parameters."""
         # Build messages array for Anthropic API
         messages = []
 
@@ -114,16 +205,26 @@ class AnthropicLLMClient(LLMClient):
             "max_tokens": token_limit,
         }
 
-        # Add system prompt if provided (Anthropic uses separate system parameter)
+        # Add system prompt if provided (Anthropic uses separate system parameter).
+        # The system prompt is the same constant for every agent action, so it
+        # is marked as a cacheable prefix; Anthropic ignores the marker while
+        # the prefix is below the model's minimum cacheable length.
         if system:
-            api_params["system"] = system
-
-        # Call Anthropic Messages API
-        response = self.client.messages.create(**api_params)
-
-        # Extract text from response
-        # Anthropic returns content as a list of content blocks
-        if response.content and len(response.content) > 0:
-            return response.content[0].text.strip()
-
-        return ""
+            if self.cache_system:
+                api_params["system"] = [
+                    {"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}
+                ]
+            else:
+                api_params["system"] = system
+        return api_params
+
+    @staticmethod
+    def _extract_text(response) -> str:
+        # Anthropic returns content as a list of content blocks; long answers
+        # may span several text blocks, so all of them are joined
+        blocks = response.content
+        if not blocks:
+            return ""
+        if len(blocks) == 1 and blocks[0].type == "text":
+            return blocks[0].text.strip()
+        return "".join(block.text for block in blocks if block.type == "text").strip()
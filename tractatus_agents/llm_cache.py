@@ -0,0 +1,459 @@
+"""Exact-match response cache for LLM clients.
+
+``CachingLLMClient`` wraps any ``LLMClient`` and answers repeated requests
+from the ``AgentCache`` (in-process LRU in front of SQLite) instead of calling
+the provider again. Requests are keyed by the full canonical request: backend,
+model, system prompt, user prompt and token limit.
+
+``SemanticCachingLLMClient`` optionally adds a similarity tier on top, so
+paraphrased requests can reuse an earlier completion.
+"""
+from __future__ import annotations
+
+import asyncio
+import atexit
+import functools
+import tempfile
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import orjson
+
+from .cache import AgentCache, get_default_cache
+
+if TYPE_CHECKING:
+    from .llm import LLMClient
+
+
+class CachingLLMClient:
+    """LLMClient decorator that memoizes completions for identical requests.
+
+    Attributes:
+        inner: The wrapped backend client
+        cache: Response store shared with other agents in the process
+        namespace: Backend/model identifier prefixed to every cache key
+    """
+
+    # Entries older than this are purged when the first client on a cache is
+    # created (7 days)
+    DEFAULT_TTL = 7 * 24 * 3600
+    # Upper bound on stored responses
+    DEFAULT_MAX_ENTRIES = 10_000
+
+    def __init__(
+        self,
+        inner: LLMClient,
+        cache: AgentCache | None = None,
+        *,
+        ttl: float | None = DEFAULT_TTL,
+        max_entries: int | None = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        """Wrap inner with a response cache.
+
+        Args:
+            inner: Backend client performing the actual completions
+            cache: Response store; defaults to the process-wide AgentCache
+            ttl: Maximum age of reused responses in seconds (None keeps them forever)
+            max_entries: Maximum number of stored responses (None for unbounded)
+        """
+        self.inner = inner
+        self.cache = cache or get_default_cache()
+        # Identifies the backend in cache keys, so switching provider or
+        # model never replays another model's answer
+        self.namespace = f"{type(inner).__name__}:{getattr(inner, 'model', '')}"
+        if ttl is not None or max_entries is not None:
+            self.cache.purge_once(max_age=ttl, max_entries=max_entries)
+
+    def complete(
+        self,
+        prompt: str | None = None,
+        *,
+        system: str | None = None,
+        user: str | None = None,
+        max_tokens: int | None = None,
+    ) -> str:
+        """Return the cached completion, calling the wrapped client on a miss."""
+        return self.fetch(prompt, system=system, user=user, max_tokens=max_tokens)[0]
+
+    async def acomplete(
+        self,
+        prompt: str | None = None,
+        *,
+        system: str | None = None,
+        user: str | None = None,
+        max_tokens: int | None = None,
+    ) -> str:
+        """Awaitable variant of complete()."""
+        result = await self.afetch(prompt, system=system, user=user, max_tokens=max_tokens)
+        return result[0]
+
+    def stream(
+        self,
+        prompt: str | None = None,
+        *,
+        system: str | None = None,
+        user: str | None = None,
+        max_tokens: int | None = None,
+    ) -> Iterator[str]:
+        """Yield the completion in chunks; a cache hit arrives as one chunk."""
+        for chunk, _cached in self.stream_cached(
+            prompt, system=system, user=user, max_tokens=max_tokens
+        ):
+            yield chunk
+
+    def stream_cached(
+        self,
+        prompt: str | None = None,
+        *,
+        system: str | None = None,
+        user: str | None = None,
+        max_tokens: int | None = None,
+    ) -> Iterator[tuple[str, bool]]:
+        """Like stream(), yielding ``(chunk, cached)`` pairs.
+
+        Streamed misses are stored once the backend has finished.
+        """
+        key = self._request_key(prompt, system, user, max_tokens)
+        content = self.cache.lookup(self.namespace, key)
+        if content is not None:
+            yield content, True
+            return
+
+        stream = getattr(self.inner, "stream", None)
+        if stream is None:
+            content = self.inner.complete(prompt, system=system, user=user, max_tokens=max_tokens)
+            yield content, False
+        else:
+            parts: list[str] = []
+            for chunk in stream(prompt, system=system, user=user, max_tokens=max_tokens):
+                parts.append(chunk)
+                yield chunk, False
+            # Match complete(), which returns stripped text
+            content = "".join(parts).strip()
+        self.cache.store(self.namespace, key, content)
+
+    def lookup(
+        self,
+        prompt: str | None = None,
+        *,
+        system: str | None = None,
+        user: str | None = None,
+        max_tokens: int | None = None,
+    ) -> str | None:
+        """Return the cached completion for this exact request, or None."""
+        return self.cache.lookup(self.namespace, self._request_key(prompt, system, user, max_tokens))
+
+    def fetch(
+        self,
+        prompt: str | None = None,
+        *,
+        system: str | None = None,
+        user: str | None = None,
+        max_tokens: int | None = None,
+        refresh: bool = False,
+    ) -> tuple[str, bool]:
+        """Like complete(), but also report whether the cache answered.
+
+        Args:
+            refresh: Skip the lookup and call the backend, replacing any
+                cached completion with the fresh one
+
+        Returns:
+            ``(content, cached)`` tuple
+        """
+        key = self._request_key(prompt, system, user, max_tokens)
+        if not refresh:
+            content = self.cache.lookup(self.namespace, key)
+            if content is not None:
+                return content, True
+
+        content = self.inner.complete(prompt, system=system, user=user, max_tokens=max_tokens)
+        self.cache.store(self.namespace, key, content)
+        return content, False
+
+    async def afetch(
+        self,
+        prompt: str | None = None,
+        *,
+        system: str | None = None,
+        user: str | None = None,
+        max_tokens: int | None = None,
+    ) -> tuple[str, bool]:
+        """Awaitable variant of fetch()."""
+        key = self._request_key(prompt, system, user, max_tokens)
+        content = self.cache.lookup(self.namespace, key)
+        if content is not None:
+            return content, True
+
+        acomplete = getattr(self.inner, "acomplete", None)
+        if acomplete is None:
+            # Synchronous-only backend: keep the event loop free
+            content = await asyncio.to_thread(
+                self.inner.complete, prompt, system=system, user=user, max_tokens=max_tokens
+            )
+        else:
+            content = await acomplete(prompt, system=system, user=user, max_tokens=max_tokens)
+        self.cache.store(self.namespace, key, content)
+        return content, False
+
+    @staticmethod
+    def _request_key(
+        prompt: str | None,
+        system: str | None,
+        user: str | None,
+        max_tokens: int | None,
+    ) -> str:
+        """Canonical serialization of a request; AgentCache hashes it with BLAKE2b."""
+        return orjson.dumps(
+            {"p": prompt, "s": system, "u": user, "mt": max_tokens},
+            option=orjson.OPT_SORT_KEYS,
+        ).decode("utf-8")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_encoder(model_name: str):
+    """Load a sentence-transformers model once per process."""
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(model_name)
+
+
+class SemanticCachingLLMClient:
+    """Second cache tier answering paraphrased requests.
+
+    User prompts are embedded with a small sentence-transformers model and
+    searched in a FAISS inner-product index over normalized vectors (cosine
+    similarity). A stored completion is reused when its prompt is at least
+    ``threshold`` similar and was produced with the same backend, system
+    prompt and token limit. Exact repeats are still answered by the wrapped
+    ``CachingLLMClient`` first.
+
+    Requires the optional ``faiss-cpu`` and ``sentence-transformers`` packages.
+    """
+
+    DEFAULT_MODEL = "all-MiniLM-L6-v2"
+    DEFAULT_THRESHOLD = 0.95
+    # Neighbours inspected per lookup, so entries from other contexts
+    # (system prompt, token limit) cannot hide a matching one
+    _SEARCH_K = 4
+
+    def __init__(
+        self,
+        exact: CachingLLMClient,
+        *,
+        threshold: float = DEFAULT_THRESHOLD,
+        model_name: str = DEFAULT_MODEL,
+        path: str | Path | None = None,
+    ) -> None:
+        """Wrap an exact-match cache with similarity lookups.
+
+        Args:
+            exact: Exact-match caching client that performs the real calls
+            threshold: Minimum cosine similarity for a semantic hit
+            model_name: sentence-transformers model used for embeddings
+            path: Index file; its entries are stored next to it as JSON
+
+        Raises:
+            RuntimeError: If faiss or sentence-transformers is not installed
+        """
+        try:
+            import faiss
+            import numpy
+
+            encoder = _load_encoder(model_name)
+        except ImportError as exc:
+            raise RuntimeError(
+                "Semantic caching requires the 'faiss-cpu' and 'sentence-transformers' packages."
+            ) from exc
+
+        self.exact = exact
+        self.threshold = threshold
+        self._faiss = faiss
+        self._numpy = numpy
+        self._encoder = encoder
+        self._lock = threading.Lock()
+
+        temp_dir = Path(tempfile.gettempdir())
+        self.path = Path(path) if path is not None else temp_dir / "tractatus_semantic_cache.faiss"
+        self._entries_path = self.path.with_suffix(".bin")
+        # Parallel to the index rows: (context key, completion)
+        self._entries: list[tuple[str, str]] = []
+        self._index = None
+        self._dirty = False
+        self._load()
+        atexit.register(self.save)
+
+    def complete(
+        self,
+        prompt: str | None = None,
+        *,
+        system: str | None = None,
+        user: str | None = None,
+        max_tokens: int | None = None,
+    ) -> str:
+        """Return a cached or similar completion, calling the backend otherwise."""
+        return self.fetch(prompt, system=system, user=user, max_tokens=max_tokens)[0]
+
+    async def acomplete(
+        self,
+        prompt: str | None = None,
+        *,
+        system: str | None = None,
+        user: str | None = None,
+        max_tokens: int | None = None,
+    ) -> str:
+        """Awaitable variant of complete()."""
+        result = await self.afetch(prompt, system=system, user=user, max_tokens=max_tokens)
+        return result[0]
+
+    def fetch(
+        self,
+        prompt: str | None = None,
+        *,
+        system: str | None = None,
+        user: str | None = None,
+        max_tokens: int | None = None,
+        refresh: bool = False,
+    ) -> tuple[str, bool]:
+        """Like complete(), but also report whether a cache tier answered.
+
+        With ``refresh`` both tiers are skipped and the fresh completion is
+        added to them.
+        """
+        if not refresh:
+            content = self.exact.lookup(prompt, system=system, user=user, max_tokens=max_tokens)
+            if content is not None:
+                return content, True
+
+        context = self._context_key(system, max_tokens)
+        vector = self._embed(user or prompt or "")
+        if not refresh:
+            content = self._search(vector, context)
+            if content is not None:
+                return content, True
+
+        content, cached = self.exact.fetch(
+            prompt, system=system, user=user, max_tokens=max_tokens, refresh=refresh
+        )
+        self._add(vector, context, content)
+        return content, cached
+
+    async def afetch(
+        self,
+        prompt: str | None = None,
+        *,
+        system: str | None = None,
+        user: str | None = None,
+        max_tokens: int | None = None,
+    ) -> tuple[str, bool]:
+        """Awaitable variant of fetch()."""
+        content = self.exact.lookup(prompt, system=system, user=user, max_tokens=max_tokens)
+        if content is not None:
+            return content, True
+
+        context = self._context_key(system, max_tokens)
+        # Encoding is CPU-bound; keep it off the event loop
+        vector = await asyncio.to_thread(self._embed, user or prompt or "")
+        content = self._search(vector, context)
+        if content is not None:
+            return content, True
+
+        content, cached = await self.exact.afetch(
+            prompt, system=system, user=user, max_tokens=max_tokens
+        )
+        self._add(vector, context, content)
+        return content, cached
+
+    def stream(
+        self,
+        prompt: str | None = None,
+        *,
+        system: str | None = None,
+        user: str | None = None,
+        max_tokens: int | None = None,
+    ) -> Iterator[str]:
+        """Yield the completion in chunks; cache hits arrive as one chunk."""
+        for chunk, _cached in self.stream_cached(
+            prompt, system=system, user=user, max_tokens=max_tokens
+        ):
+            yield chunk
+
+    def stream_cached(
+        self,
+        prompt: str | None = None,
+        *,
+        system: str | None = None,
+        user: str | None = None,
+        max_tokens: int | None = None,
+    ) -> Iterator[tuple[str, bool]]:
+        """Like stream(), yielding ``(chunk, cached)`` pairs."""
+        content = self.exact.lookup(prompt, system=system, user=user, max_tokens=max_tokens)
+        if content is not None:
+            yield content, True
+            return
+
+        context = self._context_key(system, max_tokens)
+        vector = self._embed(user or prompt or "")
+        content = self._search(vector, context)
+        if content is not None:
+            yield content, True
+            return
+
+        parts: list[str] = []
+        for chunk, cached in self.exact.stream_cached(
+            prompt, system=system, user=user, max_tokens=max_tokens
+        ):
+            parts.append(chunk)
+            yield chunk, cached
+        self._add(vector, context, "".join(parts).strip())
+
+    def save(self) -> None:
+        """Persist the index and its entries if they changed."""
+        with self._lock:
+            if not self._dirty or self._index is None:
+                return
+            self._faiss.write_index(self._index, str(self.path))
+            self._entries_path.write_bytes(orjson.dumps(self._entries))
+            self._dirty = False
+
+    def _load(self) -> None:
+        if self.path.exists() and self._entries_path.exists():
+            try:
+                index = self._faiss.read_index(str(self.path))
+                entries = [tuple(e) for e in orjson.loads(self._entries_path.read_bytes())]
+            except (OSError, RuntimeError, ValueError):
+                return
+            if index.ntotal == len(entries):
+                self._index = index
+                self._entries = entries
+
+    def _embed(self, text: str):
+        vector = self._encoder.encode([text], normalize_embeddings=True)
+        return self._numpy.asarray(vector, dtype="float32")
+
+    def _search(self, vector, context: str) -> str | None:
+        with self._lock:
+            if self._index is None or self._index.ntotal == 0:
+                return None
+            scores, rows = self._index.search(vector, min(self._SEARCH_K, self._index.ntotal))
+            for score, row in zip(scores[0], rows[0]):
+                if score < self.threshold:
+                    break
+                entry_context, content = self._entries[row]
+                if entry_context == context:
+                    return content
+        return None
+
+    def _add(self, vector, context: str, content: str) -> None:
+        with self._lock:
+            if self._index is None:
+                self._index = self._faiss.IndexFlatIP(vector.shape[1])
+            self._index.add(vector)
+            self._entries.append((context, content))
+            self._dirty = True
+
+    def _context_key(self, system: str | None, max_tokens: int | None) -> str:
+        # The backend namespace keeps different models' answers apart
+        return orjson.dumps([self.exact.namespace, system, max_tokens]).decode("utf-8")
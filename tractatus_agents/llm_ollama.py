@@ -35,11 +35,55 @@ Advantages:
 """
 from __future__ import annotations
 
+import functools
 import os
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
 
-import ollama
-
+from .http_pool import get_http_client
 from .llm import LLMClient
+from .prompts import system_message
+
+# The SDK is imported on first use, keeping `import tractatus_agents` and
+# CLI startup free of its import cost
+if TYPE_CHECKING:
+    import ollama
+
+
+@functools.lru_cache(maxsize=None)
+def _client_for(host: str) -> ollama.Client:
+    """Return the shared Ollama client (and its connection pool) for host."""
+    import ollama
+
+    return ollama.Client(host=host)
+
+
+# Hosts that already answered a connectivity probe in this process
+_PROBED: set[str] = set()
+# The probe only needs to tell "server up" from "nothing listening"
+_PROBE_TIMEOUT = 0.5
+
+
+def _probe(host: str) -> None:
+    """Check that an Ollama server answers at host, at most once per process.
+
+    Raises:
+        Exception: Whatever the HTTP request raised if the server is unreachable
+    """
+    if host in _PROBED:
+        return
+    # Mirror the ollama client's host parsing: a bare "host[:port]" means
+    # http on port 11434, an explicit scheme keeps its default port
+    url = host
+    if "://" not in host:
+        parts = urlsplit(f"http://{host}")
+        url = f"http://{parts.hostname}:{parts.port or 11434}{parts.path}"
+    response = get_http_client().get(
+        f"{url.rstrip('/')}/api/version", timeout=_PROBE_TIMEOUT
+    )
+    response.raise_for_status()
+    _PROBED.add(host)
 
 
 class OllamaLLMClient(LLMClient):
@@ -51,20 +95,29 @@ class OllamaLLMClient(LLMClient):
 
     Attributes:
         client: Ollama client instance
+        aclient: Async Ollama client, created on first use by acomplete()
         model: Model identifier (e.g., "llama3.2", "mistral")
         host: Ollama server URL (default: http://localhost:11434)
+        max_output_tokens: Largest num_predict requested from the server
     """
 
+    # Local models stop being coherent long before num_predict runs out, and
+    # the default context (num_ctx) is only a few thousand tokens
+    max_output_tokens = 4096
+
     def __init__(
         self,
         model: str | None = None,
         host: str | None = None,
+        *,
+        verify: bool = False,
     ) -> None:
         """Initialize the Ollama client for local model inference.
 
         Args:
             model: Model identifier. Defaults to OLLAMA_MODEL env var or "llama3.2"
             host: Ollama server URL. Defaults to OLLAMA_HOST env var or local server
+            verify: Also list the server's models (slower, full model listing)
 
         Raises:
             RuntimeError: If Ollama server is not running or model is not available
@@ -80,16 +133,17 @@ class OllamaLLMClient(LLMClient):
         # Get host from parameter, env var, or default
         self.host = host or os.getenv("OLLAMA_HOST", "http://localhost:11434")
 
-        # Create Ollama client with custom host if specified
-        if self.host != "http://localhost:11434":
-            self.client = ollama.Client(host=self.host)
-        else:
-            self.client = ollama.Client()
+        # One client per host is shared by all instances, so rebuilding the
+        # agent router keeps the existing keep-alive connections
+        self.client = _client_for(self.host)
+        self._aclient: ollama.AsyncClient | None = None
 
-        # Verify Ollama is running and model is available
+        # Verify Ollama is running: a cheap /api/version request, remembered
+        # per host so rebuilt clients do not probe again
         try:
-            # Try to list models to verify connection
-            self.client.list()
+            _probe(self.host)
+            if verify:
+                self.client.list()
         except Exception as e:
             raise RuntimeError(
                 f"Cannot connect to Ollama server at {self.host}. "
@@ -134,30 +188,7 @@ class OllamaLLMClient(LLMClient):
             Ollama's max_tokens is controlled via the 'num_predict' option.
             Default is typically 128, but we use 2000 to match other providers.
         """
-        # Build messages array for Ollama chat API
-        messages = []
-
-        # Add system message if provided
-        if system:
-            messages.append({"role": "system", "content": system})
-
-        # Add user message
-        if user:
-            messages.append({"role": "user", "content": user})
-        elif prompt:
-            messages.append({"role": "user", "content": prompt})
-        else:
-            raise ValueError("Either 'prompt' or 'user' must be provided.")
-
-        # Build Ollama options
-        options = {}
-        if max_tokens:
-            # Ollama uses 'num_predict' instead of 'max_tokens'
-            options["num_predict"] = max_tokens
-        else:
-            # Default to 2000 for quality philosophical analysis
-            options["num_predict"] = 2000
-
+        messages, options = self._build_request(prompt, system, user, max_tokens)
         try:
             # Call Ollama chat API
             response = self.client.chat(
@@ -165,27 +196,106 @@ class OllamaLLMClient(LLMClient):
                 messages=messages,
                 options=options,
             )
+        except Exception as e:
+            raise self._translate_error(e) from e
+        return self._extract_content(response)
 
-            # Extract and return the message content
-            if response and "message" in response:
-                content = response["message"].get("content", "")
-                return content.strip()
-
-            return ""
+    def stream(
+        self,
+        prompt: str | None = None,
+        *,
+        system: str | None = None,
+        user: str | None = None,
+        max_tokens: int | None = None,
+    ) -> Iterator[str]:
+        """Yield the completion incrementally as the local model generates it."""
+        messages, options = self._build_request(prompt, system, user, max_tokens)
+        try:
+            for part in self.client.chat(
+                model=self.model,
+                messages=messages,
+                options=options,
+                stream=True,
+            ):
+                content = part["message"]["content"]
+                if content:
+                    yield content
+        except Exception as e:
+            raise self._translate_error(e) from e
 
+    async def acomplete(
+        self,
+        prompt: str | None = None,
+        *,
+        system: str | None = None,
+        user: str | None = None,
+        max_tokens: int | None = None,
+    ) -> str:
+        """Awaitable variant of complete() using ``ollama.AsyncClient``."""
+        messages, options = self._build_request(prompt, system, user, max_tokens)
+        try:
+            response = await self.aclient.chat(
+                model=self.model,
+                messages=messages,
+                options=options,
+            )
         except Exception as e:
-            # Provide helpful error messages for common issues
-            error_msg = str(e).lower()
-
-            if "model" in error_msg and "not found" in error_msg:
-                raise RuntimeError(
-                    f"Model '{self.model}' not found. "
-                    f"Pull it with: ollama pull {self.model}"
-                )
-            elif "connection" in error_msg or "refused" in error_msg:
-                raise RuntimeError(
-                    f"Cannot connect to Ollama at {self.host}. "
-                    "Ensure Ollama is running with 'ollama serve'."
-                )
-            else:
-                raise RuntimeError(f"Ollama generation failed: {e}")
+            raise self._translate_error(e) from e
+        return self._extract_content(response)
+
+    @property
+    def aclient(self) -> ollama.AsyncClient:
+        """Async Ollama client, created lazily on first use."""
+        if self._aclient is None:
+            import ollama
+
+            self._aclient = ollama.AsyncClient(host=self.host)
+        return self._aclient
+
+    @staticmethod
+    def _build_request(
+        prompt: str | None,
+        system: str | None,
+        user: str | None,
+        max_tokens: int | None,
+    ) -> tuple[list[dict[str, str]], dict[str, int]]:
+        """Build the chat messages and generation options."""
+        # Build messages array for Ollama chat API: optional system message
+        # followed by the user message
+        content = user or prompt
+        if not content:
+            raise ValueError("Either 'prompt' or 'user' must be provided.")
+        user_message = {"role": "user", "content": content}
+        messages = [system_message(system), user_message] if system else [user_message]
+
+        # Ollama uses 'num_predict' instead of 'max_tokens'; default to 2000
+        # for quality philosophical analysis
+        options = {"num_predict": max_tokens or 2000}
+        return messages, options
+
+    @staticmethod
+    def _extract_content(response) -> str:
+        # Extract and return the message content
+        if response and "message" in response:
+            content = response["message"].get("content", "")
+            return content.strip()
+
+        return ""
+
+    def _translate_error(self, e: Exception) -> RuntimeError:
+        """Map Ollama failures to RuntimeErrors with actionable messages."""
+        # Provide helpful error messages for common issues
+        error_msg = str(e).lower()
+
+        if "model" in error_msg and "not found" in error_msg:
+            return RuntimeError(
+                f"Model '{self.model}' not found. "
+                f"Pull it with: ollama pull {self.model}"
+            )
+        elif "connection" in error_msg or "refused" in error_msg:
+            return RuntimeError(
+                f"Cannot connect to Ollama at {self.host}. "
+                "Ensure Ollama is running with 'ollama serve'."
+            )
+        else:
+            return RuntimeError(f"Ollama generation failed: {e}")
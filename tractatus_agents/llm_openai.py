@@ -6,6 +6,8 @@ supporting system prompts and configurable token limits.
 
 Environment Variables:
     OPENAI_API_KEY: Required API key for OpenAI API access
+    OPENAI_RPM: Requests per minute allowed by the account (default: 500)
+    OPENAI_TPM: Tokens per minute allowed by the account (default: 200000)
 
 Supported Models:
     - gpt-4o-mini (default): Cost-effective model for most tasks
@@ -18,11 +20,87 @@ Usage:
 """
 from __future__ import annotations
 
+import functools
 import os
+import uuid
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
 
-from openai import OpenAI
-
+from .http_pool import get_http_client
 from .llm import LLMClient
+from .prompts import SYSTEM_PROMPT, system_message
+from .ratelimit import get_limiter
+
+# The SDK is imported on first use: importing it costs hundreds of
+# milliseconds, and most CLI sessions never reach this backend
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
+
+__all__ = ["OpenAILLMClient", "count_tokens"]
+
+
+# Context window (prompt + completion tokens) of the supported models
+_CONTEXT_WINDOWS = {
+    "gpt-4o-mini": 128_000,
+    "gpt-4o": 128_000,
+    "gpt-4-turbo": 128_000,
+}
+_DEFAULT_CONTEXT_WINDOW = 128_000
+# Largest completion (max_tokens) each supported model accepts
+_MAX_OUTPUT_TOKENS = {
+    "gpt-4o-mini": 16_384,
+    "gpt-4o": 16_384,
+    "gpt-4-turbo": 4_096,
+}
+_DEFAULT_MAX_OUTPUT_TOKENS = 4_096
+# Per-message framing tokens added by the chat format
+_MESSAGE_OVERHEAD = 4
+
+
+@functools.lru_cache(maxsize=8)
+def _enc(model: str):
+    """Return the tiktoken encoding for model, or None without tiktoken.
+
+    Loading an encoding takes tens of milliseconds, so each is built once.
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Unknown (e.g. newer) model name: use the GPT-4o family encoding
+        return tiktoken.get_encoding("o200k_base")
+
+
+def count_tokens(text: str, model: str = "gpt-4o-mini") -> int:
+    """Count the tokens text occupies for model.
+
+    Uses tiktoken when installed, otherwise estimates ~4 characters per token.
+    """
+    encoding = _enc(model)
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text))
+
+
+@functools.lru_cache(maxsize=8)
+def _system_prompt_tokens(model: str) -> int:
+    """Token count of the shared SYSTEM_PROMPT, encoded once per model."""
+    return count_tokens(SYSTEM_PROMPT, model)
+
+
+@functools.lru_cache(maxsize=1)
+def _default_client(api_key: str) -> OpenAI:
+    """Return the process-wide OpenAI client for api_key.
+
+    Agent routers are rebuilt on every LLM preference change; reusing one
+    SDK client avoids re-creating its configuration and connection state.
+    """
+    from openai import OpenAI
+
+    return OpenAI(api_key=api_key, http_client=get_http_client())
 
 
 class OpenAILLMClient(LLMClient):
@@ -34,7 +112,9 @@ class OpenAILLMClient(LLMClient):
 
     Attributes:
         client: OpenAI API client instance
+        aclient: Async OpenAI client, created on first use by acomplete()
         model: Model identifier (e.g., "gpt-4o-mini")
+        max_output_tokens: Largest max_tokens the model accepts
     """
 
     def __init__(self, model: str = "gpt-4o-mini") -> None:
@@ -55,8 +135,26 @@ class OpenAILLMClient(LLMClient):
             raise RuntimeError(
                 "Missing OPENAI_API_KEY. Export it before launching the CLI or web app."
             )
-        self.client = OpenAI(api_key=key)
+        self._api_key = key
+        self.client = _default_client(key)
+        self._aclient: AsyncOpenAI | None = None
         self.model = model
+        self.max_output_tokens = _MAX_OUTPUT_TOKENS.get(model, _DEFAULT_MAX_OUTPUT_TOKENS)
+        # Shared by all OpenAI clients: the limits apply per account
+        self._limiter = get_limiter(
+            "openai",
+            int(os.getenv("OPENAI_RPM", "500")),
+            int(os.getenv("OPENAI_TPM", "200000")),
+        )
+
+    @property
+    def aclient(self) -> AsyncOpenAI:
+        """Async API client, created lazily so sync-only callers never open it."""
+        if self._aclient is None:
+            from openai import AsyncOpenAI
+
+            self._aclient = AsyncOpenAI(api_key=self._api_key)
+        return self._aclient
 
     def complete(
         self,
@@ -91,24 +189,114 @@ class OpenAILLMClient(LLMClient):
                 max_tokens=1500
             )
         """
-        messages = []
-
-        # Support both legacy single-prompt and new system+user format
-        if system or user:
-            if system:
-                messages.append({"role": "system", "content": system})
-            if user:
-                messages.append({"role": "user", "content": user})
-        elif prompt:
-            messages.append({"role": "user", "content": prompt})
-        else:
-            raise ValueError("Either 'prompt' or both 'system'/'user' must be provided.")
-
         # Call OpenAI Chat Completions API
         # Default to 2000 tokens for quality philosophical analysis (prevents truncation)
+        self._limiter.acquire_sync(self._request_tokens(prompt, system, user, max_tokens))
         response = self.client.chat.completions.create(
             model=self.model,
-            messages=messages,
+            messages=self._build_messages(prompt, system, user),
+            max_tokens=max_tokens if max_tokens else 2000,
+            extra_headers=self._idempotency_headers(),
+        )
+        return response.choices[0].message.content.strip()
+
+    async def acomplete(
+        self,
+        prompt: str | None = None,
+        *,
+        system: str | None = None,
+        user: str | None = None,
+        max_tokens: int | None = None,
+    ) -> str:
+        """Awaitable variant of complete() using the async OpenAI client."""
+        await self._limiter.acquire(self._request_tokens(prompt, system, user, max_tokens))
+        response = await self.aclient.chat.completions.create(
+            model=self.model,
+            messages=self._build_messages(prompt, system, user),
             max_tokens=max_tokens if max_tokens else 2000,
+            extra_headers=self._idempotency_headers(),
         )
         return response.choices[0].message.content.strip()
+
+    def stream(
+        self,
+        prompt: str | None = None,
+        *,
+        system: str | None = None,
+        user: str | None = None,
+        max_tokens: int | None = None,
+    ) -> Iterator[str]:
+        """Yield the completion incrementally as OpenAI streams it."""
+        self._limiter.acquire_sync(self._request_tokens(prompt, system, user, max_tokens))
+        chunks = self.client.chat.completions.create(
+            model=self.model,
+            messages=self._build_messages(prompt, system, user),
+            max_tokens=max_tokens if max_tokens else 2000,
+            stream=True,
+        )
+        for chunk in chunks:
+            # Some chunks (e.g. usage reports) carry no choices
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    def count_tokens(self, text: str) -> int:
+        """Count the tokens text occupies for this client's model."""
+        return count_tokens(text, self.model)
+
+    def _request_tokens(
+        self,
+        prompt: str | None,
+        system: str | None,
+        user: str | None,
+        max_tokens: int | None,
+    ) -> int:
+        """Total token budget of a request, checked against the context window.
+
+        Raises:
+            ValueError: If prompt plus completion budget exceed the model's
+                context window (rejected locally instead of after a round-trip)
+        """
+        prompt_tokens = _MESSAGE_OVERHEAD
+        if system:
+            # The default system prompt is identical on every request
+            if system is SYSTEM_PROMPT:
+                prompt_tokens += _system_prompt_tokens(self.model) + _MESSAGE_OVERHEAD
+            else:
+                prompt_tokens += self.count_tokens(system) + _MESSAGE_OVERHEAD
+        content = user or prompt
+        if content:
+            prompt_tokens += self.count_tokens(content) + _MESSAGE_OVERHEAD
+        total = prompt_tokens + (max_tokens or 2000)
+        window = _CONTEXT_WINDOWS.get(self.model, _DEFAULT_CONTEXT_WINDOW)
+        if total > window:
+            raise ValueError(
+                f"Request needs ~{total} tokens ({prompt_tokens} prompt + "
+                f"{max_tokens or 2000} completion) but {self.model} allows {window}."
+            )
+        return total
+
+    @staticmethod
+    def _idempotency_headers() -> dict[str, str]:
+        """Idempotency-Key header for one logical completion call.
+
+        The key is random per call and the SDK sends the same headers on each
+        of its retries, so when a retry replays a request that already reached
+        the server (e.g. after a client-side timeout), OpenAI can deduplicate
+        it instead of generating and billing it twice. Separate calls with
+        identical contents (e.g. a deliberate regenerate) get separate keys.
+        """
+        return {"Idempotency-Key": uuid.uuid4().hex}
+
+    @staticmethod
+    def _build_messages(
+        prompt: str | None, system: str | None, user: str | None
+    ) -> list[dict[str, str]]:
+        # Support both legacy single-prompt and new system+user format
+        if system and user:
+            return [system_message(system), {"role": "user", "content": user}]
+        if system:
+            return [system_message(system)]
+        content = user or prompt
+        if not content:
+            raise ValueError("Either 'prompt' or both 'system'/'user' must be provided.")
+        return [{"role": "user", "content": content}]
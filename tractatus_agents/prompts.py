@@ -1,7 +1,13 @@
 """Prompt engineering for Tractatus agent responses."""
 from __future__ import annotations
 
-SYSTEM_PROMPT = (
+import sys
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+from types import MappingProxyType
+
+# Interned: every prompt pair and LLMResponse references this one object
+SYSTEM_PROMPT = sys.intern(
     "You are a philosophical commentary assistant for the Tractatus corpus. "
     "Treat propositions below 7 as belonging to Ludwig Wittgenstein's original "
     "*Tractatus Logico-Philosophicus*. Propositions numbered 7 or above are "
@@ -12,6 +18,58 @@ SYSTEM_PROMPT = (
     "Engage deeply with the text's internal logic and implications."
 )
 
+# Chat message for the default system prompt, shared by every request that
+# uses it (chat-style backends only read their messages)
+SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+
+def system_message(system: str) -> dict[str, str]:
+    """Return the chat message for a system prompt, reusing SYSTEM_MESSAGE."""
+    if system is SYSTEM_PROMPT:
+        return SYSTEM_MESSAGE
+    return {"role": "system", "content": system}
+
+
+# Action-specific user instructions (read-only: the builders below bake them in)
+_ACTION_PROMPTS: Mapping[str, str] = MappingProxyType({
+    "comment": (
+        "Interpret the following proposition as a self-contained statement. "
+        "Explain its internal logic, sense, and philosophical implication "
+        "within the appropriate Tractatus context described above:"
+    ),
+    "comparison": (
+        "Compare the following propositions with close attention to their "
+        "logical forms and philosophical emphases. How do their structures "
+        "and implications differ or align within the combined Tractatus framework:"
+    ),
+    "synthesize": (
+        "Analyze the following collection of propositions as a cohesive unit. "
+        "Identify the overarching themes, hierarchical relationships, and logical "
+        "structure that connects them. Extract the unified philosophical vector "
+        "of meaning that emerges from this complex of statements, treating them "
+        "as parts of a larger argumentative or conceptual whole:"
+    ),
+    "websearch": (
+        "Suggest web-search queries and summarize potential online resources "
+        "that provide historical, biographical, or interpretive context for "
+        "understanding these propositions:"
+    ),
+    "reference": (
+        "List relevant philosophical references, academic sources, and "
+        "scholarly interpretations that expand on or challenge the meaning "
+        "of these propositions:"
+    ),
+    # Several propositions answered in one request (LLMAgent.batch_comment)
+    "comment_batch": (
+        "Interpret each of the following propositions as a self-contained statement. "
+        "Explain its internal logic, sense, and philosophical implication "
+        "within the appropriate Tractatus context described above. "
+        "The propositions are introduced by markers such as <ID 0>. "
+        'Return the results as a JSON array of objects {"id": <ID number>, '
+        '"comment": "<commentary>"}, one per proposition, and nothing else:'
+    ),
+})
+
 
 def build_prompt_pair(
     action: str,
@@ -19,7 +77,7 @@ def build_prompt_pair(
     context: str | None = None,
     language: str | None = None,
     user_input: str | None = None,
-) -> dict[str, str]:
+) -> Mapping[str, str]:
     """
     Build (system, user) prompt pair for the given action and payload.
 
@@ -31,56 +89,55 @@ def build_prompt_pair(
         user_input: Optional user request appended to the prompt
 
     Returns:
-        Dictionary with 'system' and 'user' keys for LLM consumption.
+        Read-only mapping with 'system' and 'user' keys for LLM consumption.
+        Repeated calls with the same arguments share one cached mapping.
     """
-    # Optional context hint
-    ctx_block = f"\n\nContext:\n{context.strip()}" if context else ""
-
-    # Language instruction for German output
-    lang_instruction = ""
-    if language and language.lower() == "de":
-        lang_instruction = "\n\n(Please respond in German.)"
-
-    # Action-specific user instructions
-    action_prompts = {
-        "comment": (
-            "Interpret the following proposition as a self-contained statement. "
-            "Explain its internal logic, sense, and philosophical implication "
-            "within the appropriate Tractatus context described above:"
-        ),
-        "comparison": (
-            "Compare the following propositions with close attention to their "
-            "logical forms and philosophical emphases. How do their structures "
-            "and implications differ or align within the combined Tractatus framework:"
-        ),
-        "synthesize": (
-            "Analyze the following collection of propositions as a cohesive unit. "
-            "Identify the overarching themes, hierarchical relationships, and logical "
-            "structure that connects them. Extract the unified philosophical vector "
-            "of meaning that emerges from this complex of statements, treating them "
-            "as parts of a larger argumentative or conceptual whole:"
-        ),
-        "websearch": (
-            "Suggest web-search queries and summarize potential online resources "
-            "that provide historical, biographical, or interpretive context for "
-            "understanding these propositions:"
-        ),
-        "reference": (
-            "List relevant philosophical references, academic sources, and "
-            "scholarly interpretations that expand on or challenge the meaning "
-            "of these propositions:"
-        ),
-    }
-
-    user_instruction = action_prompts.get(action.lower(), action_prompts["comment"])
-
-    extra_request = ""
-    if user_input:
-        extra_request = f"\n\nAdditional request:\n{user_input.strip()}"
-
-    return {
-        "system": SYSTEM_PROMPT,
-        "user": (
-            f"{user_instruction}\n\n{payload.strip()}{ctx_block}{lang_instruction}{extra_request}"
-        ),
-    }
+    return _build_prompt_pair(action, payload, context, language, user_input)
+
+
+# Suffix appended to the user prompt when German output is requested
+_GERMAN_SUFFIX = "\n\n(Please respond in German.)"
+
+PromptBuilder = Callable[[str, "str | None", "str | None"], str]
+
+
+def _specialize(instruction: str, lang_suffix: str) -> PromptBuilder:
+    """Return a user-prompt builder with instruction and language baked in."""
+    prefix = f"{instruction}\n\n"
+
+    def build(payload: str, context: str | None, user_input: str | None) -> str:
+        # strip() only inspects the ends and returns the same object when
+        # there is nothing to trim, so pre-stripped payloads cost nothing here
+        user = prefix + payload.strip()
+        if context:
+            user += f"\n\nContext:\n{context.strip()}"
+        user += lang_suffix
+        if user_input:
+            user += f"\n\nAdditional request:\n{user_input.strip()}"
+        return user
+
+    return build
+
+
+# One specialized builder per (action, language) combination, built at import
+# so assembling a prompt involves no instruction lookup or language branching
+_DISPATCH: dict[tuple[str, str | None], PromptBuilder] = {
+    (action, language): _specialize(instruction, _GERMAN_SUFFIX if language else "")
+    for action, instruction in _ACTION_PROMPTS.items()
+    for language in (None, "de")
+}
+
+
+@lru_cache(maxsize=4096)
+def _build_prompt_pair(
+    action: str,
+    payload: str,
+    context: str | None,
+    language: str | None,
+    user_input: str | None,
+) -> Mapping[str, str]:
+    """Memoized worker for build_prompt_pair()."""
+    # Only German changes the prompt; unknown actions fall back to "comment"
+    lang_key = "de" if language and language.lower() == "de" else None
+    builder = _DISPATCH.get((action.lower(), lang_key)) or _DISPATCH["comment", lang_key]
+    return MappingProxyType({"system": SYSTEM_PROMPT, "user": builder(payload, context, user_input)})
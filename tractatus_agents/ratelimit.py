@@ -0,0 +1,100 @@
+"""Client-side rate limiting for hosted LLM providers.
+
+Batch fan-out (``LLMAgent.abatch``) can issue requests far faster than a
+provider account allows. Instead of letting the API answer with HTTP 429 and
+retrying, each hosted client first draws from a token bucket sized to the
+account's requests-per-minute and tokens-per-minute limits.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+import time
+
+
+def estimate_tokens(system: str | None, user: str | None, max_tokens: int | None) -> int:
+    """Rough request size in tokens: ~4 characters per prompt token plus the output budget."""
+    prompt_chars = len(system or "") + len(user or "")
+    return prompt_chars // 4 + (max_tokens or 0)
+
+
+class AsyncTokenBucket:
+    """Token bucket limiting requests and tokens per minute.
+
+    Both buckets refill continuously. The state is guarded by a thread lock
+    rather than asyncio primitives, so one bucket can be shared by threads
+    and by successive event loops (each ``asyncio.run`` creates a new one).
+    """
+
+    _INTERVAL = 60.0
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int | None = None) -> None:
+        """Create a bucket.
+
+        Args:
+            requests_per_minute: Request capacity refilled every minute
+            tokens_per_minute: Token capacity refilled every minute (None for unlimited)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute or 0)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until one request carrying ``tokens`` tokens may be sent."""
+        while True:
+            wait = self._try_acquire(tokens)
+            if wait == 0:
+                return
+            await asyncio.sleep(wait)
+
+    def acquire_sync(self, tokens: int = 0) -> None:
+        """Blocking variant of acquire() for synchronous callers."""
+        while True:
+            wait = self._try_acquire(tokens)
+            if wait == 0:
+                return
+            time.sleep(wait)
+
+    def _try_acquire(self, tokens: int) -> float:
+        """Take capacity if available; otherwise return seconds to wait."""
+        if self.tokens_per_minute:
+            # A request larger than the whole bucket would never fit
+            tokens = min(tokens, self.tokens_per_minute)
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._updated = now
+            self._requests = min(
+                self.requests_per_minute,
+                self._requests + elapsed * self.requests_per_minute / self._INTERVAL,
+            )
+            wait = self._deficit(self._requests, 1, self.requests_per_minute)
+            if self.tokens_per_minute:
+                self._tokens = min(
+                    self.tokens_per_minute,
+                    self._tokens + elapsed * self.tokens_per_minute / self._INTERVAL,
+                )
+                wait = max(wait, self._deficit(self._tokens, tokens, self.tokens_per_minute))
+            if wait:
+                return wait
+            self._requests -= 1
+            if self.tokens_per_minute:
+                self._tokens -= tokens
+            return 0.0
+
+    def _deficit(self, available: float, needed: float, per_minute: int) -> float:
+        if available >= needed:
+            return 0.0
+        return (needed - available) * self._INTERVAL / per_minute
+
+
+@functools.lru_cache(maxsize=None)
+def get_limiter(
+    provider: str, requests_per_minute: int, tokens_per_minute: int | None
+) -> AsyncTokenBucket:
+    """Return the process-wide bucket for a provider and limit configuration."""
+    return AsyncTokenBucket(requests_per_minute, tokens_per_minute)
@@ -14,12 +14,15 @@ of LLM backends without affecting the rest of the application.
 """
 from __future__ import annotations
 
-from collections.abc import Iterable
+import re
+from collections.abc import Callable, Iterable
 from enum import Enum
 from typing import Protocol
 
 from .llm import LLMAgent, LLMResponse
 
+__all__ = ["AgentAction", "AgentRouter", "PropositionLike"]
+
 
 class AgentAction(str, Enum):
     """Available LLM-powered analysis actions for philosophical text.
@@ -48,6 +51,7 @@ class AgentAction(str, Enum):
 
         Accepts partial matches and case-insensitive input for user convenience.
         For example, "comp", "COMP", or "comparison" all match COMPARISON.
+        Tokens that extend an action name (e.g. "comments") match it as well.
 
         Args:
             token: User input string (e.g., "comment", "comp", None)
@@ -68,17 +72,46 @@ class AgentAction(str, Enum):
         if not token:
             return cls.COMMENT
 
-        # Try to match against action values (case-insensitive, prefix match)
+        # Unambiguous abbreviations and full names resolve in one lookup
         lowered = token.strip().lower()
-        for action in cls:
-            if lowered.startswith(action.value):
-                return action
+        action = _PREFIX_MAP.get(lowered)
+        if action is not None:
+            return action
+
+        # Otherwise accept tokens that start with a full action name
+        match = _ACTION_RE.match(lowered)
+        if match:
+            return cls[match.lastgroup]
 
         # No match found - raise error with helpful message
         msg = ", ".join(action.value for action in cls)
         raise ValueError(f"Unknown LLM action '{token}'. Expected one of: {msg}")
 
 
+def _build_prefix_map() -> dict[str, AgentAction]:
+    """Map every unambiguous prefix of an action name to its action."""
+    owners: dict[str, set[AgentAction]] = {}
+    for action in AgentAction:
+        for end in range(1, len(action.value) + 1):
+            owners.setdefault(action.value[:end], set()).add(action)
+    prefix_map = {prefix: next(iter(found)) for prefix, found in owners.items() if len(found) == 1}
+    # Full names always win, even if one is a prefix of another
+    prefix_map.update((action.value, action) for action in AgentAction)
+    return prefix_map
+
+
+# Built once at import; "c"/"co"/"com" are ambiguous, "comm"/"comp" are not
+_PREFIX_MAP = _build_prefix_map()
+# Full action names as one alternation, longest first so that no name can
+# shadow a longer one it is a prefix of
+_ACTION_RE = re.compile(
+    "|".join(
+        f"(?P<{action.name}>{re.escape(action.value)})"
+        for action in sorted(AgentAction, key=lambda action: len(action.value), reverse=True)
+    )
+)
+
+
 class PropositionLike(Protocol):
     """Protocol for duck-typed proposition objects.
 
@@ -113,8 +146,11 @@ class AgentRouter:
 
     Attributes:
         _llm_agent: The underlying LLM agent that performs the actual analysis
+        _dispatch: Agent method handling each AgentAction
     """
 
+    __slots__ = ("_llm_agent", "_dispatch")
+
     def __init__(self, llm_agent: LLMAgent | None = None) -> None:
         """Initialize the router with an LLM agent.
 
@@ -122,6 +158,14 @@ class AgentRouter:
             llm_agent: Optional LLMAgent instance. If None, creates a default agent.
         """
         self._llm_agent = llm_agent or LLMAgent()
+        # Bound agent methods per action, so perform() routes with one lookup
+        self._dispatch: dict[AgentAction, Callable[..., LLMResponse]] = {
+            AgentAction.COMMENT: self._llm_agent.comment,
+            AgentAction.COMPARISON: self._llm_agent.compare,
+            AgentAction.SYNTHESIZE: self._llm_agent.synthesize,
+            AgentAction.WEBSEARCH: self._llm_agent.websearch,
+            AgentAction.REFERENCE: self._llm_agent.reference,
+        }
 
     def perform(
         self,
@@ -131,6 +175,7 @@ class AgentRouter:
         payload: str | None = None,
         language: str | None = None,
         user_input: str | None = None,
+        use_cache: bool = True,
     ) -> LLMResponse:
         """Execute an LLM agent action for the specified propositions.
 
@@ -144,12 +189,15 @@ class AgentRouter:
                     Useful when the caller has already formatted the text
             language: Optional language code for analysis ("de", "en", etc.)
             user_input: Optional user-provided prompt to guide the analysis
+            use_cache: Answer identical earlier requests from the response
+                cache. False always calls the backend and refreshes the cache.
 
         Returns:
             LLMResponse containing the AI-generated analysis
 
         Raises:
             ValueError: If neither propositions nor payload is provided
+            ValueError: If propositions is empty and no payload is provided
             ValueError: If action is not recognized (should not happen with enum)
 
         Examples:
@@ -167,22 +215,54 @@ class AgentRouter:
         if payload is None:
             if propositions is None:
                 raise ValueError("Either propositions or payload must be provided.")
-            payload = self._build_payload(propositions)
+            # Materialize once, and reject an empty selection before it costs
+            # an LLM round-trip on an empty prompt
+            proposition_list = list(propositions)
+            if not proposition_list:
+                raise ValueError("No propositions supplied.")
+            payload = self._build_payload(proposition_list)
 
         # Route to appropriate LLM method based on action type
+        try:
+            method = self._dispatch[action]
+        except KeyError:
+            # Should never happen with proper enum usage
+            raise ValueError(f"Unsupported action: {action}") from None
+        return method(payload, language=language, user_input=user_input, use_cache=use_cache)
+
+    def perform_batch(
+        self,
+        action: AgentAction,
+        propositions: Iterable[PropositionLike],
+        *,
+        batch_size: int | None = None,
+        language: str | None = None,
+    ) -> list[LLMResponse]:
+        """Run an action on each proposition separately, batching where possible.
+
+        Comments are packed up to ``batch_size`` propositions per request (see
+        LLMAgent.batch_comment), so the shared system prompt is sent and
+        prefilled once per batch instead of once per proposition. The model
+        answers with per-proposition sections, which is slightly less free-form
+        than individual requests. Other actions run one request per proposition.
+
+        Args:
+            action: The type of analysis to perform
+            propositions: Propositions to analyze, each on its own
+            batch_size: Maximum number of propositions in one request. By
+                default, and never more than, as many as the backend's output
+                limit leaves a full answer budget for
+            language: Optional language code for analysis ("de", "en", etc.)
+
+        Returns:
+            One LLMResponse per proposition, in input order.
+        """
+        items = [self._build_payload([proposition]) for proposition in propositions]
         if action is AgentAction.COMMENT:
-            return self._llm_agent.comment(payload, language=language, user_input=user_input)
-        if action is AgentAction.COMPARISON:
-            return self._llm_agent.compare(payload, language=language, user_input=user_input)
-        if action is AgentAction.SYNTHESIZE:
-            return self._llm_agent.synthesize(payload, language=language, user_input=user_input)
-        if action is AgentAction.WEBSEARCH:
-            return self._llm_agent.websearch(payload, language=language, user_input=user_input)
-        if action is AgentAction.REFERENCE:
-            return self._llm_agent.reference(payload, language=language, user_input=user_input)
-
-        # Should never reach here with proper enum usage
-        raise ValueError(f"Unsupported action: {action}")
+            return self._llm_agent.batch_comment(
+                items, language=language, max_items_per_request=batch_size
+            )
+        return [self.perform(action, None, payload=item, language=language) for item in items]
 
     @staticmethod
     def _build_payload(propositions: Iterable[PropositionLike]) -> str:
@@ -204,7 +284,6 @@ class AgentRouter:
             Output: "1: Die Welt...\n\n1.1: Die Welt..."
         """
 
-        blocks: list[str] = []
-        for proposition in propositions:
-            blocks.append(f"{proposition.name}: {proposition.text}")
-        return "\n\n".join(blocks)
+        # A list comprehension rather than a generator: str.join materializes
+        # its argument into a sequence anyway
+        return "\n\n".join([f"{p.name}: {p.text}" for p in propositions])
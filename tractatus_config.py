@@ -20,9 +20,67 @@ The configuration is shared between the CLI and web interfaces, providing
 a consistent experience across both modes of interaction.
 """
 
+import atexit
+import functools
 import json
+import os
+import sys
+import weakref
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Callable, Container, Mapping
+
+import orjson
+
+__all__ = ["TrcliConfig"]
+
+# String spellings accepted as True when converting boolean preferences
+_BOOL_TRUE = frozenset({"true", "1", "yes", "on"})
+
+
+def _to_bool(value: str) -> bool:
+    return value.lower() in _BOOL_TRUE
+
+
+def _intern(value: Any) -> Any:
+    """Intern string preference values (language codes, provider names).
+
+    The preference keys are identifier-like source literals, which CPython
+    already interns; values read from the file or typed by the user are not.
+    Interning lets instances that load the same file share one copy of each
+    value instead of holding duplicates.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+# Allowed values of the constrained preferences: ranges (membership is a
+# constant-time bounds check) for numbers, choices for strings
+_LIMITS: dict[str, Container[Any]] = {
+    "display_length": range(1, 1001),
+    "lines_per_output": range(1, 1001),
+    "llm_provider": ("auto", "anthropic", "openai", "ollama"),
+    # Increased range to support longer, more complete responses
+    "llm_max_tokens": range(100, 8001),
+    "tree_max_depth": range(0, 13),
+}
+
+
+def _limit_error(key: str, allowed: Container[Any]) -> str:
+    if isinstance(allowed, range):
+        return f"{key} must be between {allowed.start} and {allowed.stop - 1}"
+    return f"{key} must be one of: {', '.join(allowed)}"
+
+
+# Messages are built once, so validating a good value formats no strings
+_LIMIT_ERRORS = {key: _limit_error(key, allowed) for key, allowed in _LIMITS.items()}
+_VALID = (True, "")
+
+
+@functools.lru_cache(maxsize=8)
+def _load_raw(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a config file; cached per modification time, so treat as read-only."""
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
 
 
 class TrcliConfig:
@@ -43,11 +101,22 @@ class TrcliConfig:
 
     Attributes:
         config_file: Path to the configuration file (~/.trclirc by default)
-        preferences: Dictionary of current preference values
+        preferences: Current preference values; the read-only defaults until
+            a preference is loaded, set or reset (copy-on-write)
+        version: Counter bumped whenever preferences change in this process
     """
 
-    # Default preference values for new installations
-    DEFAULT_PREFERENCES = {
+    __slots__ = (
+        "config_file",
+        "preferences",
+        "_version",
+        "_dirty",
+        "__weakref__",
+    )
+
+    # Default preference values for new installations (read-only, shared by
+    # every instance until it changes a preference)
+    DEFAULT_PREFERENCES: Mapping[str, Any] = MappingProxyType({
         "display_length": 60,      # Characters to show in text previews
         "lines_per_output": 10,    # Max lines for list/tree commands
         "lang": "en",              # Default language (de=German, en=English, etc.)
@@ -55,6 +124,21 @@ class TrcliConfig:
         "llm_model": "default",    # Model name (default=provider's default model)
         "llm_max_tokens": 2000,    # Token budget for AI responses (increased for quality analysis)
         "tree_max_depth": 0,       # Tree depth limit (0=unlimited)
+    })
+
+    # File contents for the defaults, serialized once (first run, reset all)
+    _DEFAULT_JSON = orjson.dumps(dict(DEFAULT_PREFERENCES), option=orjson.OPT_INDENT_2)
+
+    # Converters from user-supplied strings (CLI/web forms) to each
+    # preference's type, derived once from the default values
+    CONVERTERS: dict[str, Callable[[str], Any]] = {
+        key: _to_bool if type(value) is bool else int if type(value) is int else str
+        for key, value in DEFAULT_PREFERENCES.items()
+    }
+
+    # Expected type (from the default value) and allowed values per preference
+    _VALIDATORS: dict[str, tuple[type, Container[Any] | None]] = {
+        key: (type(value), _LIMITS.get(key)) for key, value in DEFAULT_PREFERENCES.items()
     }
 
     def __init__(self, config_file: str | Path | None = None):
@@ -71,11 +155,20 @@ class TrcliConfig:
             config_file = Path.home() / ".trclirc"
 
         self.config_file = Path(config_file)
-        # Start with default values
-        self.preferences = self.DEFAULT_PREFERENCES.copy()
+        # Start with the shared defaults; a private dict is made on first change
+        self.preferences: Mapping[str, Any] = self.DEFAULT_PREFERENCES
+        # Change counter so callers can detect updates without touching the disk
+        self._version = 0
+        # Unsaved changes from set()/reset(), written by flush() or at exit
+        self._dirty = False
         # Override with saved preferences if they exist
         self.load()
 
+    @property
+    def version(self) -> int:
+        """Number of in-process preference changes (set/reset/load) so far."""
+        return self._version
+
     def load(self) -> None:
         """Load user preferences from the configuration file.
 
@@ -85,19 +178,28 @@ class TrcliConfig:
 
         The method is resilient to corruption - errors are logged but don't
         prevent the application from running with default settings.
+
+        Parsed files are cached by modification time, so instances created
+        while the file is unchanged (CLI and web service) share one parse.
         """
 
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, "r") as f:
-                    data = json.load(f)
-                    # Merge saved preferences with defaults (ignores unknown keys)
-                    for key, value in data.items():
-                        if key in self.DEFAULT_PREFERENCES:
-                            self.preferences[key] = value
-            except (json.JSONDecodeError, IOError) as e:
-                # Log error but continue with defaults
-                print(f"Warning: Could not load config from {self.config_file}: {e}")
+        try:
+            mtime_ns = self.config_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return
+
+        try:
+            data = _load_raw(str(self.config_file), mtime_ns)
+        except (json.JSONDecodeError, IOError) as e:
+            # Log error but continue with defaults
+            print(f"Warning: Could not load config from {self.config_file}: {e}")
+            return
+
+        # Merge saved preferences with defaults (ignores unknown keys)
+        for key, value in data.items():
+            if key in self.DEFAULT_PREFERENCES:
+                self._writable()[key] = _intern(value)
+        self._version += 1
 
     def save(self) -> None:
         """Persist current preferences to the configuration file.
@@ -105,14 +207,44 @@ class TrcliConfig:
         Writes the current preferences to ~/.trclirc as formatted JSON.
         If the file doesn't exist, it will be created. Errors during save
         are logged but don't crash the application.
+
+        The file is written to a temporary sibling and then renamed over the
+        original, so a concurrent reader (CLI and web share the file) never
+        sees a partially written config.
         """
+        tmp = self.config_file.with_suffix(f"{self.config_file.suffix}.{os.getpid()}.tmp")
         try:
-            with open(self.config_file, "w") as f:
-                # Pretty-print JSON for human readability
-                json.dump(self.preferences, f, indent=2)
+            # Pretty-print JSON for human readability
+            if self.preferences is self.DEFAULT_PREFERENCES:
+                data = self._DEFAULT_JSON
+            else:
+                data = orjson.dumps(dict(self.preferences), option=orjson.OPT_INDENT_2)
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.config_file)
+            self._dirty = False
+            _UNSAVED.discard(self)
         except IOError as e:
+            try:
+                os.unlink(tmp)
+            except FileNotFoundError:
+                pass
             print(f"Error: Could not save config to {self.config_file}: {e}")
 
+    def flush(self) -> None:
+        """Write pending preference changes to disk, if there are any.
+
+        set() and reset() only mark the configuration dirty; dirty instances
+        that are still alive are flushed automatically at interpreter exit,
+        and callers that need the file updated immediately (e.g. for another
+        process) call it directly.
+        """
+        if self._dirty:
+            self.save()
+
     def get(self, key: str, default: Any = None) -> Any:
         """Retrieve a preference value by key.
 
@@ -130,7 +262,7 @@ class TrcliConfig:
         return self.preferences.get(key, default)
 
     def set(self, key: str, value: Any) -> bool:
-        """Update a preference value and save to disk.
+        """Update a preference value; it is written to disk by flush().
 
         Args:
             key: Preference name (must be in DEFAULT_PREFERENCES)
@@ -151,17 +283,23 @@ class TrcliConfig:
         if key not in self.DEFAULT_PREFERENCES:
             return False
 
-        # Update in-memory preferences
-        self.preferences[key] = value
-        # Persist to disk
-        self.save()
+        # Update in-memory preferences; consecutive changes share one write
+        self._writable()[key] = _intern(value)
+        self._version += 1
+        self._mark_dirty()
         return True
 
-    def list_preferences(self) -> dict[str, Any]:
-        """Return all current preferences."""
-        return self.preferences.copy()
+    def list_preferences(self) -> Mapping[str, Any]:
+        """Return all current preferences as a read-only live view.
+
+        No copy is made; copy it with dict() to keep a snapshot or to modify it.
+        """
+        if isinstance(self.preferences, MappingProxyType):
+            return self.preferences
+        return MappingProxyType(self.preferences)
 
-    def validate_preference(self, key: str, value: Any) -> tuple[bool, str]:
+    @staticmethod
+    def validate_preference(key: str, value: Any) -> tuple[bool, str]:
         """Validate a preference key and value before setting.
 
         Performs two levels of validation:
@@ -193,50 +331,70 @@ class TrcliConfig:
             is_valid, msg = config.validate_preference("display_length", 5000)
             # -> (False, "display_length must be between 1 and 1000")
         """
-        # Check if key exists
-        if key not in self.DEFAULT_PREFERENCES:
+        try:
+            return _validate_cached(key, value)
+        except TypeError:
+            # Unhashable values (lists, dicts) cannot key the cache
+            return TrcliConfig._validate(key, value)
+
+    @staticmethod
+    def _validate(key: str, value: Any) -> tuple[bool, str]:
+        """Uncached implementation of validate_preference()."""
+        # One table lookup yields the expected type and the allowed values
+        try:
+            expected_type, allowed = TrcliConfig._VALIDATORS[key]
+        except KeyError:
             return False, f"Unknown preference: {key}"
 
-        # Get expected type from default value
-        default_value = self.DEFAULT_PREFERENCES[key]
-        expected_type = type(default_value)
-
         # Type checking - ensure value is correct type
         if not isinstance(value, expected_type):
             return False, f"{key} must be {expected_type.__name__}, got {type(value).__name__}"
 
-        # Range validation for numeric preferences
-        if key == "display_length":
-            if not (1 <= value <= 1000):
-                return False, "display_length must be between 1 and 1000"
-        elif key == "lines_per_output":
-            if not (1 <= value <= 1000):
-                return False, "lines_per_output must be between 1 and 1000"
-        elif key == "llm_provider":
-            valid_providers = ["auto", "anthropic", "openai", "ollama"]
-            if value not in valid_providers:
-                return False, f"llm_provider must be one of: {', '.join(valid_providers)}"
-        elif key == "llm_max_tokens":
-            # Increased range to support longer, more complete responses
-            if not (100 <= value <= 8000):
-                return False, "llm_max_tokens must be between 100 and 8000"
-        elif key == "tree_max_depth":
-            if not (0 <= value <= 12):
-                return False, "tree_max_depth must be between 0 and 12"
-        # Note: "lang" and "llm_model" (strings) have no range validation
-
-        return True, ""
+        # Range/choice validation; "lang" and "llm_model" accept any string
+        if allowed is not None and value not in allowed:
+            return False, _LIMIT_ERRORS[key]
+
+        return _VALID
 
     def reset(self, key: str | None = None) -> bool:
         """Reset preference(s) to default. If key is None, reset all."""
         if key is None:
-            self.preferences = self.DEFAULT_PREFERENCES.copy()
-            self.save()
+            self.preferences = self.DEFAULT_PREFERENCES
+            self._version += 1
+            self._mark_dirty()
             return True
 
         if key not in self.DEFAULT_PREFERENCES:
             return False
 
-        self.preferences[key] = self.DEFAULT_PREFERENCES[key]
-        self.save()
+        self._writable()[key] = self.DEFAULT_PREFERENCES[key]
+        self._version += 1
+        self._mark_dirty()
         return True
+
+    def _mark_dirty(self) -> None:
+        """Record an unsaved change, so flush() (or exit) writes it out."""
+        self._dirty = True
+        _UNSAVED.add(self)
+
+    def _writable(self) -> dict[str, Any]:
+        """Return the preferences as a private dict, copying the defaults once."""
+        if isinstance(self.preferences, MappingProxyType):
+            self.preferences = dict(self.preferences)
+        return self.preferences
+
+
+# Instances with unsaved changes. A single exit hook flushes them; weak
+# references leave discarded instances free to be collected
+_UNSAVED: "weakref.WeakSet[TrcliConfig]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_unsaved() -> None:
+    for config in list(_UNSAVED):
+        config.flush()
+
+
+# Validation sees the same few (key, value) pairs over and over; typed=True
+# keeps e.g. True and 1 apart, since they fail the type check differently
+_validate_cached = functools.lru_cache(maxsize=128, typed=True)(TrcliConfig._validate)
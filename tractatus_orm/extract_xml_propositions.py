@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from pathlib import Path
 import xml.etree.ElementTree as ET
 
 @dataclass
@@ -14,23 +15,46 @@ class PropositionEntry:
     translations: list[TranslationEntry]
 
 
+# XML tag -> (language code, source description), in output order
+_TAG_META = (
+    ("german", "de", "German original"),
+    ("ogden", "en-ogden", "Ogden/Ramsey 1922"),
+    ("pears_mcguinness", "en-pmc", "Pears/McGuinness 1961"),
+)
+
+
 def extract_xml_propositions(file_path: str | Path) -> list[PropositionEntry]:
-    tree = ET.parse(file_path)
-    root = tree.getroot()
-    entries: list[PropositionEntry] = []
+    entries: list[PropositionEntry | None] = []
+    # Slots reserved for the propositions that are still open
+    pending: list[int] = []
+
+    # Stream the document instead of building the whole tree first; each
+    # proposition is released as soon as it has been read. Propositions nest,
+    # so a slot is reserved at the start tag to keep document order while the
+    # entry itself is only built once the end tag has been seen.
+    for event, prop in ET.iterparse(file_path, events=("start", "end")):
+        if prop.tag != "proposition":
+            continue
+        if event == "start":
+            pending.append(len(entries))
+            entries.append(None)
+            continue
 
-    for prop in root.findall(".//proposition"):
         name = prop.get("id")
         level = int(prop.get("depth", "1"))
 
+        # One pass over the children rather than a findtext() scan per tag;
+        # the first occurrence of a tag wins, as with findtext()
+        texts: dict[str, str] = {}
+        for child in prop:
+            texts.setdefault(child.tag, child.text or "")
+
         translations: list[TranslationEntry] = []
-        if german := (prop.findtext("german") or "").strip():
-            translations.append(TranslationEntry("de", german, "German original"))
-        if ogden := (prop.findtext("ogden") or "").strip():
-            translations.append(TranslationEntry("en-ogden", ogden, "Ogden/Ramsey 1922"))
-        if pmc := (prop.findtext("pears_mcguinness") or "").strip():
-            translations.append(TranslationEntry("en-pmc", pmc, "Pears/McGuinness 1961"))
-
-        entries.append(PropositionEntry(name, level, translations))
+        for tag, lang, source in _TAG_META:
+            if text := texts.get(tag, "").strip():
+                translations.append(TranslationEntry(lang, text, source))
+
+        entries[pending.pop()] = PropositionEntry(name, level, translations)
+        prop.clear()
 
     return entries
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 
-from .database import SessionLocal, init_db
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+from .database import SessionLocal, init_db, optimize_search_index
 from .models import Proposition
-from .text_cleaner import extract_raw_propositions
+from .text_cleaner import extract_raw_propositions_soa
+
+__all__ = ["ingest_text", "insert_hierarchy"]
 
 
-def _find_parent_by_longest_prefix(name: str, lookup: dict[str, Proposition]) -> str | None:
+def _find_parent_by_longest_prefix(name: str, lookup: dict[str, int]) -> str | None:
     """
     Find parent using longest matching prefix algorithm.
 
@@ -31,12 +38,15 @@ def _find_parent_by_longest_prefix(name: str, lookup: dict[str, Proposition]) ->
     - Parent of '2.01' is '2' (longest prefix that exists)
     - Parent of '2' is None (no prefix)
     """
-    if "." not in name:
+    dot = name.find(".")
+    if dot < 0:
         return None
 
     # Try progressively shorter prefixes by removing characters from the end
-    # For "2.0121", try: "2.012", "2.01", "2.0", "2"
-    for length in range(len(name) - 1, 0, -1):
+    # For "2.0121", try: "2.012", "2.01", "2.0", "2". The prefix ending in
+    # the dot itself ("2.") is never a name and is skipped. A plain
+    # rsplit(".") would be wrong here: the digits after the dot nest too.
+    for length in chain(range(len(name) - 1, dot + 1, -1), range(dot, 0, -1)):
         candidate = name[:length]
         if candidate in lookup:
             return candidate
@@ -44,70 +54,109 @@ def _find_parent_by_longest_prefix(name: str, lookup: dict[str, Proposition]) ->
     return None
 
 
-def _calculate_level(name: str, lookup: dict[str, Proposition], parent_map: dict[str, str | None]) -> int:
-    """
-    Calculate hierarchical level by traversing parent chain.
+def insert_hierarchy(
+    session: Session, rows: list[dict], parents: dict[str, str | None]
+) -> dict[str, int]:
+    """Bulk-insert proposition rows and link them to their parents.
 
-    Level = distance from root + 1
-    Examples:
-    - '1' → level 1
-    - '1.1' → level 2 (parent: 1)
-    - '1.11' → level 3 (parent: 1.1 → parent: 1)
-    - '1.111' → level 4 (parent: 1.11 → parent: 1.1 → parent: 1)
-    """
-    level = 1
-    current = name
+    Primary keys are left to the database: the rows go out as one
+    ``INSERT ... RETURNING id, name`` in the order given (document order,
+    which next/previous navigation relies on), then parent_id is filled in
+    by one bulk UPDATE keyed on those ids. Concurrent ingests therefore
+    cannot collide on ids, and PostgreSQL SERIAL sequences stay in step.
+
+    Inserting parents first (level by level) would make parent ids known at
+    insert time and save the UPDATE, but the database would then number the
+    rows by depth rather than in document order, breaking id-based
+    next/previous; choosing the ids up front is what MAX(id)+1 did.
 
-    while parent_map.get(current) is not None:
-        current = parent_map[current]
-        level += 1
+    Args:
+        session: Session the rows are written in (the caller commits)
+        rows: Proposition column values (name, text, level, sort_order),
+              without id or parent_id
+        parents: Parent name (or None for roots) of every row's name
 
-    return level
+    Returns:
+        Mapping of proposition name to its new id
+    """
+    if not rows:
+        return {}
+
+    stmt = insert(Proposition).returning(
+        Proposition.id, Proposition.name, sort_by_parameter_order=True
+    )
+    ids = {name: new_id for new_id, name in session.execute(stmt, rows)}
+
+    links = [
+        {"id": ids[name], "parent_id": ids[parent_name]}
+        for name, parent_name in parents.items()
+        if parent_name is not None
+    ]
+    if links:
+        # ORM bulk UPDATE by primary key: a single executemany
+        session.execute(update(Proposition), links)
+    return ids
+
+
+@lru_cache(maxsize=8)
+def _cached_extract(
+    path: str, mtime_ns: int, language: str
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Parse a raw text file once per (path, modification time, language).
+
+    The mtime is part of the key, so editing the file invalidates the entry.
+    Names and texts come back as parallel tuples, so the cached result cannot
+    be mutated by callers and no object is created per proposition.
+    """
+    names, texts = extract_raw_propositions_soa(Path(path), language=language)
+    return tuple(names), tuple(texts)
 
 
 def ingest_text(file_path: str | Path, language: str = "german") -> int:
+    """Load the propositions of a plain-text Tractatus file into the database.
+
+    Hierarchy (parents and levels) is resolved entirely in Python; the
+    database then sees one transaction holding a bulk INSERT, a bulk parent
+    UPDATE (see insert_hierarchy) and the commit. No ORM objects are created.
+
+    Args:
+        file_path: Path to the raw text file
+        language: Language section of the file to read
+
+    Returns:
+        Number of propositions ingested
+    """
     init_db()
-    session = SessionLocal()
-    lookup: dict[str, Proposition] = {}
 
+    # Re-running on an unchanged file reuses the parsed entries. A missing
+    # file surfaces as FileNotFoundError from the stat() call
     file_path = Path(file_path)
-    if not file_path.exists():
-        raise FileNotFoundError(file_path)
-
-    entries = extract_raw_propositions(file_path, language=language)
-
-    # Phase 1: Create all propositions
-    for idx, entry in enumerate(entries):
-        # Use temporary level (will be recalculated after hierarchy is established)
-        proposition = Proposition(
-            name=entry.name,
-            text=entry.text,
-            level=1,  # Placeholder, will be updated
-            sort_order=idx,
-        )
-        lookup[entry.name] = proposition
-        session.add(proposition)
-
-    session.flush()
-
-    # Phase 2: Establish parent-child relationships using longest prefix matching
-    parent_map: dict[str, str | None] = {}
-
-    for name, proposition in lookup.items():
-        parent_name = _find_parent_by_longest_prefix(name, lookup)
-        parent_map[name] = parent_name
-
-        if parent_name is not None:
-            parent = lookup[parent_name]
-            proposition.parent = parent
-
-    # Phase 3: Recalculate levels based on actual parent chain
-    for name, proposition in lookup.items():
-        proposition.level = _calculate_level(name, lookup, parent_map)
-
-    session.commit()
-    session.close()
-    return len(lookup)
+    names, texts = _cached_extract(str(file_path), file_path.stat().st_mtime_ns, language)
+
+    # Phase 1: Resolve parents and levels in one pass. A parent's name is a
+    # proper prefix of its child's, so visiting names shortest first
+    # guarantees every candidate parent has been seen (and has its level)
+    # by the time a child needs it.
+    levels: dict[str, int] = {}
+    parents: dict[str, str | None] = {}
+    for name in sorted(names, key=len):
+        parent_name = _find_parent_by_longest_prefix(name, levels)
+        levels[name] = 1 if parent_name is None else levels[parent_name] + 1
+        parents[name] = parent_name
+
+    # Rows stay in document order, so ids and sort_order follow the text
+    rows = [
+        {"name": name, "text": text, "level": levels[name], "sort_order": idx}
+        for idx, (name, text) in enumerate(zip(names, texts))
+    ]
+
+    # Phase 2: Insert the rows and link parents; ids come from the database
+    with SessionLocal() as session:
+        ids = insert_hierarchy(session, rows, parents)
+        session.commit()
+    optimize_search_index()
+
+    return len(ids)
 
 
 def main() -> None:
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
 from .database import SessionLocal, init_db
 from .models import Proposition
 
@@ -23,7 +26,13 @@ def explore(root_name: str = "1") -> None:
     init_db()
     session = SessionLocal()
     try:
-        root = session.query(Proposition).filter_by(name=root_name).first()
+        # Load the whole subtree eagerly: one SELECT per tree level rather
+        # than one per node as print_tree() descends through .children
+        root = session.scalars(
+            select(Proposition)
+            .options(selectinload(Proposition.children, recursion_depth=-1))
+            .filter_by(name=root_name)
+        ).first()
         if root is None:
             raise ValueError(f"Proposition '{root_name}' not found.")
         print_tree(root)
@@ -62,11 +62,15 @@ class Proposition(Base):
     text: Mapped[str] = mapped_column(Text, nullable=False)
 
     # Hierarchy metadata
+    # sort_order is indexed because children are always loaded ordered by it
     level: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    sort_order: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    sort_order: Mapped[int | None] = mapped_column(Integer, nullable=True, index=True)
 
     # Self-referential foreign key for tree structure
-    parent_id: Mapped[int | None] = mapped_column(ForeignKey("tractatus.id"), nullable=True)
+    # Indexed: every children load filters on it
+    parent_id: Mapped[int | None] = mapped_column(
+        ForeignKey("tractatus.id"), nullable=True, index=True
+    )
 
     # Recursive parent relationship (many-to-one)
     parent: Mapped["Proposition"] = relationship(
@@ -84,10 +88,14 @@ class Proposition(Base):
     )
 
     # Translations and alternative versions
+    # Loaded with "selectin": rendering nearly always reads translations, and
+    # this fetches them for every proposition of a query (or children
+    # collection) in one IN-query instead of one SELECT per proposition
     translations: Mapped[list["Translation"]] = relationship(
         "Translation",
         back_populates="proposition",
         cascade="all, delete-orphan",  # Delete translations when proposition is deleted
+        lazy="selectin",
     )
 
     def __repr__(self) -> str:  # pragma: no cover - debugging helper
@@ -106,13 +114,19 @@ class Proposition(Base):
         Example:
             Proposition "1.1" -> "1.1"
             Proposition "2.0121" -> "2.01.2.1" (if parent chain differs)
+
+        Note:
+            The result is memoized on the instance and built from the parent's
+            own memoized path, so rendering a whole tree follows (and lazy-loads)
+            each parent link once instead of once per descendant. Propositions
+            are not re-parented after ingest, so the cache cannot go stale.
         """
-        node: Proposition | None = self
-        lineage: list[str] = []
-        while node is not None:
-            lineage.insert(0, node.name)
-            node = node.parent
-        return ".".join(lineage)
+        cached: str | None = getattr(self, "_path_cache", None)
+        if cached is None:
+            parent = self.parent
+            cached = self.name if parent is None else f"{parent.path()}.{self.name}"
+            self._path_cache = cached
+        return cached
 
     def __str__(self) -> str:  # pragma: no cover - debugging helper
         """User-friendly string representation for display."""
@@ -177,7 +191,8 @@ class Translation(Base):
     source: Mapped[str | None] = mapped_column(String, nullable=True)
 
     # Foreign key to proposition
-    tractatus_id: Mapped[int | None] = mapped_column(ForeignKey("tractatus.id"))
+    # Indexed: translations are always looked up by their proposition
+    tractatus_id: Mapped[int | None] = mapped_column(ForeignKey("tractatus.id"), index=True)
 
     # Variant type: "translation" (official) or "alternative" (user-contributed)
     variant_type: Mapped[str] = mapped_column(
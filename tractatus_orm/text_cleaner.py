@@ -10,7 +10,7 @@ import re
 PROPOSITION_RE = re.compile(r"^(\d+(?:\.\d+)*)\s+(.*)")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PropositionEntry:
     """Structured representation of a Tractatus proposition."""
 
@@ -18,16 +18,23 @@ class PropositionEntry:
     text: str
 
 
-def _is_page_marker(line: str) -> bool:
-    return line.isdigit() and int(line) > 7
+# Translation table that deletes soft hyphens
+_DROP_SOFT_HYPHENS = str.maketrans("", "", "\xad")
 
 
 def _clean_line(line: str) -> str:
-    return re.sub(r"\s+", " ", line.replace("\xad", "").strip())
+    # split() with no separator drops leading/trailing whitespace and splits
+    # on runs of it, so joining with single spaces collapses whitespace the
+    # way re.sub(r"\s+", " ", ...) plus strip() did, without the regex engine
+    return " ".join(line.translate(_DROP_SOFT_HYPHENS).split())
 
 
-def extract_german_propositions(raw_path: Path) -> list[PropositionEntry]:
-    """Extract Tractatus propositions from the German section of the raw text."""
+def _german_first_texts(raw_path: Path) -> dict[str, str]:
+    """Map each proposition name in the German section to its raw text.
+
+    Only the first occurrence of a name is kept; the dict preserves
+    document order.
+    """
 
     raw_text = raw_path.read_text(encoding="utf-8")
     marker = "Logisch-Philosophische Abhandlung"
@@ -36,30 +43,65 @@ def extract_german_propositions(raw_path: Path) -> list[PropositionEntry]:
 
     german_section = raw_text.split(marker, 1)[1]
 
-    entries: list[PropositionEntry] = []
-    seen: set[str] = set()
+    # setdefault() checks for and records a name in one hash operation
+    first_text: dict[str, str] = {}
+    # Bound methods looked up once rather than on every line
+    match_line = PROPOSITION_RE.match
+    remember = first_text.setdefault
     for raw_line in german_section.splitlines():
         line = raw_line.strip()
-        if not line or _is_page_marker(line):
+        # Every proposition line starts with a digit; rejecting the rest here
+        # keeps most prose lines away from the regex engine
+        if not line or not line[0].isdigit():
             continue
-        match = PROPOSITION_RE.match(line)
-        if not match:
+        # Page markers: bare page numbers (above the seven main propositions)
+        if line.isdigit() and int(line) > 7:
             continue
-        name, text = match.groups()
-        if name in seen:
-            continue
-        seen.add(name)
-        entries.append(PropositionEntry(name=name, text=_clean_line(text)))
+        match = match_line(line)
+        if match:
+            name, text = match.groups()
+            remember(name, text)
 
-    if not entries:
+    if not first_text:
         raise ValueError("Failed to extract German propositions")
 
-    return entries
+    return first_text
 
 
-def extract_raw_propositions(raw_path: Path, language: str = "german") -> list[PropositionEntry]:
-    language = language.lower()
-    if language != "german":
+def extract_german_propositions(raw_path: Path) -> list[PropositionEntry]:
+    """Extract Tractatus propositions from the German section of the raw text."""
+
+    return [
+        PropositionEntry(name=name, text=_clean_line(text))
+        for name, text in _german_first_texts(raw_path).items()
+    ]
+
+
+def extract_german_propositions_soa(raw_path: Path) -> tuple[list[str], list[str]]:
+    """Extract the German propositions as parallel lists of names and texts.
+
+    Same result as extract_german_propositions(), without allocating an
+    entry object per proposition; names[i] belongs to texts[i].
+    """
+
+    first_text = _german_first_texts(raw_path)
+    return list(first_text), [_clean_line(text) for text in first_text.values()]
+
+
+def _require_supported(language: str) -> None:
+    if language.lower() != "german":
         raise ValueError("Only German extraction is supported at present")
+
+
+def extract_raw_propositions(raw_path: Path, language: str = "german") -> list[PropositionEntry]:
+    _require_supported(language)
     return extract_german_propositions(raw_path)
 
+
+def extract_raw_propositions_soa(
+    raw_path: Path, language: str = "german"
+) -> tuple[list[str], list[str]]:
+    """Parallel-list counterpart of extract_raw_propositions() (names, texts)."""
+    _require_supported(language)
+    return extract_german_propositions_soa(raw_path)
+
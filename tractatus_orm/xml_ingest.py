@@ -1,15 +1,19 @@
-from html import unescape
+from collections.abc import Iterator
 from pathlib import Path
 import xml.etree.ElementTree as ET
 
-from .database import SessionLocal, init_db
-from .models import Proposition, Translation
+from sqlalchemy import insert
+
+from .database import SessionLocal, init_db, optimize_search_index
+from .ingest import insert_hierarchy
+from .models import Translation
 
 
 # Mapping from XML tag name to (language code, default source description).
 # The default source can be overridden by a "source" attribute on the XML
 # element itself, which enables new material (such as the continuation text)
-# to annotate its provenance without requiring code changes.
+# to annotate its provenance without requiring code changes. Tag names in the
+# XML must match these keys exactly (lowercase).
 TRANSLATION_TAGS = {
     "german": ("de", "German original"),
     "ogden": ("en-ogden", "Ogden/Ramsey 1922"),
@@ -20,156 +24,198 @@ TRANSLATION_TAGS = {
 
 # Subset of HTML entities that commonly appear in the XML source files. The
 # default XML parser in the standard library only recognises the XML predefined
-# entities (such as &amp; and &quot;), so we register the additional ones we rely on
-# here to avoid parse errors.
+# entities (such as &amp; and &quot;), so the additional ones we rely on are
+# declared to the parser (see _iterparse) to avoid parse errors.
 HTML_ENTITY_MAP = {
     "mdash": "—",
     "ndash": "–",
 }
 
+# Internal DTD subset declaring HTML_ENTITY_MAP as character references. The
+# source files have no DOCTYPE of their own, and a parser only consults
+# entity declarations from one, so this is fed ahead of the document and
+# expat then expands the entities in element text itself. (Expat does not
+# check the DOCTYPE name against the root element.)
+_ENTITY_DECLARATIONS = (
+    "<!DOCTYPE tractatus ["
+    + "".join(f'<!ENTITY {name} "&#{ord(char)};">' for name, char in HTML_ENTITY_MAP.items())
+    + "]>"
+).encode("ascii")
 
-def _find_parent_by_longest_prefix(name: str, lookup: dict[str, Proposition]) -> str | None:
-    """
-    Find parent using longest matching prefix algorithm.
-
-    This properly handles Wittgenstein's hierarchical numbering where:
-    - 2.01 is parent of 2.011, 2.012 (not just sibling)
-    - 2.012 is parent of 2.0121 (not just sibling)
-
-    Algorithm: Find the longest string that is a proper prefix of 'name'
-    and exists in the lookup table.
-
-    For a name like '2.0121':
-    1. Try all prefixes by removing characters from the end
-    2. '2.012' (remove '1') → exists? YES → return
-    3. If not found, '2.01' (remove '21') → exists? check
-    4. Then '2.0' → check
-    5. Finally '2' → check (must exist if name has '.' prefix)
-
-    Examples:
-    - Parent of '2.0121' is '2.012' (longest prefix that exists)
-    - Parent of '2.012' is '2.01' (longest prefix that exists)
-    - Parent of '2.01' is '2' (longest prefix that exists)
-    - Parent of '2' is None (no prefix)
-    """
-    if "." not in name:
-        return None
-
-    # Try progressively shorter prefixes by removing characters from the end
-    # For "2.0121", try: "2.012", "2.01", "2.0", "2"
-    for length in range(len(name) - 1, 0, -1):
-        candidate = name[:length]
-        if candidate in lookup:
-            return candidate
+# Bytes read from the XML file per parser feed
+_READ_SIZE = 1 << 16
 
-    return None
 
+def _iterparse(file_path: str | Path, events: tuple[str, ...]) -> Iterator[tuple[str, ET.Element]]:
+    """Like ``ET.iterparse(file_path, events)``, with HTML_ENTITY_MAP declared.
 
-def _calculate_level(name: str, lookup: dict[str, Proposition], parent_map: dict[str, str | None]) -> int:
+    The file is read as binary chunks into a pull parser, so the document is
+    never held in memory as a whole.
     """
-    Calculate hierarchical level by traversing parent chain.
-
-    Level = distance from root + 1
-    Examples:
-    - '1' → level 1
-    - '1.1' → level 2 (parent: 1)
-    - '1.11' → level 3 (parent: 1.1 → parent: 1)
-    - '1.111' → level 4 (parent: 1.11 → parent: 1.1 → parent: 1)
+    parser = ET.XMLPullParser(events=events)
+    with open(file_path, "rb") as handle:
+        # The declarations must come after the XML declaration, if any, so
+        # read until it is known whether there is one and where it ends
+        head = b""
+        while chunk := handle.read(_READ_SIZE):
+            head += chunk
+            start = head.lstrip(b"\xef\xbb\xbf")[:5]
+            if not b"<?xml".startswith(start) or b"?>" in head:
+                break
+        is_declared = head.lstrip(b"\xef\xbb\xbf").startswith(b"<?xml")
+        split = head.find(b"?>") + 2 if is_declared else 0
+        parser.feed(head[:split])
+        parser.feed(_ENTITY_DECLARATIONS)
+        parser.feed(head[split:])
+        yield from parser.read_events()
+        while chunk := handle.read(_READ_SIZE):
+            parser.feed(chunk)
+            yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
+
+
+def _assign_hierarchy(names: list[str]) -> dict[str, tuple[str | None, int]]:
     """
-    level = 1
-    current = name
+    Resolve every proposition's parent and level in one sorted pass.
+
+    The parent of a name is the longest other name that is a proper prefix of
+    it, which handles Wittgenstein's numbering where 2.01 is the parent of
+    2.011 and 2.012, and 2.012 the parent of 2.0121. Names without a dot
+    ("1", "2") are roots.
+
+    In lexicographic order every name that lies between a prefix and a name
+    extending it also starts with that prefix. A stack of the names on the
+    current prefix chain therefore always has the longest existing prefix on
+    top once the entries that are not prefixes have been popped, so each name
+    costs O(1) amortized stack work after the O(N log N) sort.
 
-    while parent_map.get(current) is not None:
-        current = parent_map[current]
-        level += 1
+    Level = distance from root + 1, e.g. '1' → 1, '1.1' → 2, '1.11' → 3.
 
-    return level
+    Returns:
+        Mapping of name to (parent name or None, level)
+    """
+    hierarchy: dict[str, tuple[str | None, int]] = {}
+    stack: list[str] = []
+    for name in sorted(names):
+        while stack and not name.startswith(stack[-1]):
+            stack.pop()
+        parent = stack[-1] if stack and "." in name else None
+        level = 1 if parent is None else hierarchy[parent][1] + 1
+        hierarchy[name] = (parent, level)
+        stack.append(name)
+    return hierarchy
 
 
 def _iter_translation_nodes(prop: ET.Element) -> list[tuple[str, str, str]]:
     entries: list[tuple[str, str, str]] = []
+    tags = TRANSLATION_TAGS
     for node in prop:
-        tag = node.tag.strip().lower()
-        if tag not in TRANSLATION_TAGS:
+        # XML tags are case-sensitive and the source files use the lowercase
+        # names of TRANSLATION_TAGS, so the tag is looked up as is
+        meta = tags.get(node.tag)
+        if meta is None:
             continue
         text = (node.text or "").strip()
         if not text:
             continue
-        lang, default_source = TRANSLATION_TAGS[tag]
-        source = node.attrib.get("source", default_source)
-        entries.append((lang, text, source))
+        lang, default_source = meta
+        entries.append((lang, text, node.get("source", default_source)))
     return entries
 
 
 def ingest_multilang_xml(file_path: str | Path) -> int:
+    """Load propositions and their translations from an XML file.
+
+    Rows are built as plain dicts and written in bulk; no ORM objects are
+    created. The database assigns the primary keys (see insert_hierarchy),
+    and the returned ids supply parent_id and tractatus_id.
+
+    Args:
+        file_path: Path to the XML file
+
+    Returns:
+        Number of propositions ingested
+    """
     init_db()
-    session = SessionLocal()
-    lookup: dict[str, Proposition] = {}
-
-    parser = ET.XMLParser()
-    for name, value in HTML_ENTITY_MAP.items():
-        parser.entity[name] = value
-    xml_text = Path(file_path).read_text(encoding="utf-8")
-    xml_text = unescape(xml_text)
-    root = ET.fromstring(xml_text, parser=parser)
-    rows = root.findall(".//proposition")
-
-    # --- Phase 1: Create propositions (with German text as base, placeholder levels) ---
-    for idx, prop in enumerate(rows):
-        name = prop.get("id")
-        if not name:
+    # Proposition rows by name, in document order
+    lookup: dict[str, dict] = {}
+
+    # Translations per proposition, in document order, for Phase 4; the XML
+    # elements themselves are released while parsing
+    pending_translations: list[tuple[str, list[tuple[str, str, str]]]] = []
+    # Propositions that are still open (they nest); None for id-less ones
+    open_props: list[tuple[dict, int] | None] = []
+    idx = 0
+
+    # --- Phase 1: Collect propositions (with German text as base) ---
+    # Stream the document instead of building the whole tree first. Each
+    # proposition is recorded at its start tag, which keeps document order
+    # for sort_order and ids, and gets its text at the end tag, once its
+    # translation children have been parsed. The first event is the document
+    # element itself, which (as with findall(".//proposition")) is never
+    # treated as a proposition.
+    events = _iterparse(file_path, ("start", "end"))
+    _event, root = next(events)
+    for event, prop in events:
+        if prop.tag != "proposition":
             continue
 
-        translations = _iter_translation_nodes(prop)
-        base_text = ""
-        for lang, text, _source in translations:
-            if lang == "de":
-                base_text = text
-                break
-        if not base_text and translations:
-            # Fall back to the first available translation if German text is absent.
-            base_text = translations[0][1]
-
-        proposition = Proposition(
-            name=name,
-            text=base_text,
-            level=1,  # Placeholder, will be updated
-            sort_order=idx,
-        )
-        session.add(proposition)
-        lookup[name] = proposition
-
-    session.flush()
-
-    # --- Phase 2: Establish hierarchy using longest prefix matching ---
-    parent_map: dict[str, str | None] = {}
-
-    for name, proposition in lookup.items():
-        parent_name = _find_parent_by_longest_prefix(name, lookup)
-        parent_map[name] = parent_name
-
-        if parent_name is not None:
-            parent = lookup[parent_name]
-            proposition.parent = parent
-
-    # --- Phase 3: Recalculate levels based on actual parent chain ---
-    for name, proposition in lookup.items():
-        proposition.level = _calculate_level(name, lookup, parent_map)
-
-    session.flush()
-
-    # --- Phase 4: Create translations for each proposition ---
-    for prop in rows:
-        name = prop.get("id")
-        if not name or name not in lookup:
+        if event == "start":
+            name = prop.get("id")
+            if not name:
+                open_props.append(None)
+            else:
+                row = {"name": name, "text": "", "sort_order": idx}
+                lookup[name] = row
+                open_props.append((row, len(pending_translations)))
+                pending_translations.append((name, []))
+            idx += 1
             continue
-        base = lookup[name]
-        for lang, text, src in _iter_translation_nodes(prop):
-            tr = Translation(lang=lang, text=text, source=src, proposition=base)
-            session.add(tr)
 
-    session.commit()
-    session.close()
+        current = open_props.pop()
+        if current is not None:
+            row, slot = current
+            translations = _iter_translation_nodes(prop)
+            base_text = ""
+            for lang, text, _source in translations:
+                if lang == "de":
+                    base_text = text
+                    break
+            if not base_text and translations:
+                # Fall back to the first available translation if German text is absent.
+                base_text = translations[0][1]
+            row["text"] = base_text
+            pending_translations[slot] = (row["name"], translations)
+        # Phase 4 only needs pending_translations, so the element can go.
+        # Once a top-level proposition is done, detach the finished (and
+        # already cleared) elements from the root as well, so the parsed
+        # tree never grows with the document
+        prop.clear()
+        if not open_props:
+            root.clear()
+
+    # --- Phase 2: Establish hierarchy and levels in one sorted pass ---
+    parents: dict[str, str | None] = {}
+    for name, (parent_name, level) in _assign_hierarchy(list(lookup)).items():
+        lookup[name]["level"] = level
+        parents[name] = parent_name
+
+    with SessionLocal() as session:
+        # --- Phase 3: Bulk-insert propositions in document order, link parents ---
+        ids = insert_hierarchy(session, list(lookup.values()), parents)
+
+        # --- Phase 4: Bulk-insert their translations ---
+        translation_rows = [
+            {"lang": lang, "text": text, "source": src, "tractatus_id": ids[name]}
+            for name, translations in pending_translations
+            for lang, text, src in translations
+        ]
+        if translation_rows:
+            session.execute(insert(Translation), translation_rows)
+        session.commit()
+    optimize_search_index()
+
     return len(lookup)
 
 
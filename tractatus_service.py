@@ -21,14 +21,20 @@ Architecture:
 """
 from __future__ import annotations
 
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
+from typing import Any, Callable, Iterator
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, scoped_session
 
 from tractatus_agents import AgentAction, AgentRouter
 from tractatus_agents.llm import LLMAgent
 from tractatus_config import TrcliConfig
+from tractatus_orm.database import SEARCH_TABLE
 from tractatus_orm.models import Proposition, Translation
 
 
@@ -39,57 +45,134 @@ class TractatusService:
     of the Tractatus, with support for translations, search, and AI analysis.
     It maintains a "current proposition" that serves as the navigation context.
 
+    Every operation that works on "the current proposition" also accepts an
+    explicit ``proposition_id``. A service shared between concurrent clients
+    (the web app) is created with ``track_current=False``: it then keeps no
+    navigation state at all and each call names its starting proposition.
+
     Attributes:
         session: SQLAlchemy database session for ORM queries
         config: User configuration with preferences (language, display settings)
         current: Currently selected proposition (navigation context)
     """
 
-    def __init__(self, session: Session, config: TrcliConfig | None = None):
+    # Minimum seconds between stat() calls on the config file when looking
+    # for edits made by other processes (e.g. the CLI)
+    _DISK_CHECK_INTERVAL = 1.0
+
+    # Lifetime (seconds) and capacity of memoized tree/list/translation data.
+    # Writes from any process are picked up through the database version,
+    # checked at most once per _VERSION_CHECK_INTERVAL; the TTL bounds
+    # staleness for edits that do not move it
+    _MEMO_TTL = 120.0
+    _MEMO_MAX = 1024
+    _VERSION_CHECK_INTERVAL = 5.0
+
+    def __init__(
+        self,
+        session: Session | scoped_session[Session],
+        config: TrcliConfig | None = None,
+        *,
+        track_current: bool = True,
+    ):
         """Initialize service with database session and configuration.
 
         Args:
-            session: SQLAlchemy database session for ORM queries
+            session: SQLAlchemy database session (or scoped session registry,
+                    which resolves to a per-thread/request session) for ORM queries
             config: Optional user configuration (defaults to TrcliConfig())
+            track_current: Whether navigation moves the service's current
+                    proposition. Pass False for a service shared between
+                    clients, which must then pass ``proposition_id`` explicitly
         """
         self.session = session
         self.config = config or TrcliConfig()
-        # Current proposition serves as navigation context for operations
-        self.current: Proposition | None = None
+        self._track_current = track_current
+        # Current proposition serves as navigation context for operations.
+        # Only the id is kept so the context survives across request-scoped sessions.
+        self._current_id: int | None = None
+        # Guards the preference bookkeeping and the agent router below, which
+        # worker threads sharing one service would otherwise rebuild or reset
+        # underneath each other. Reentrant: agent_router syncs preferences,
+        # and syncing may invalidate the router
+        self._lock = threading.RLock()
         # Agent router is lazy-loaded on first use to avoid unnecessary initialization
         self._agent_router: AgentRouter | None = None
         self._agent_router_tokens: int | None = None
         self._agent_router_provider: str | None = None
         self._agent_router_model: str | None = None
         self._config_mtime: float | None = self._config_file_mtime()
+        self._seen_version = self.config.version
+        self._next_disk_check = time.monotonic() + self._DISK_CHECK_INTERVAL
+        # Rendered data keyed by (kind, proposition id, display preferences),
+        # in least-recently-used order. Shared by all threads of a worker
+        self._memo: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self._memo_lock = threading.Lock()
+        self._memo_version: tuple | None = None
+        self._next_version_check = 0.0
+
+    @property
+    def current(self) -> Proposition | None:
+        """Currently selected proposition, loaded through the active session."""
+        if self._current_id is None:
+            return None
+        return self.session.get(Proposition, self._current_id)
+
+    @current.setter
+    def current(self, proposition: Proposition | None) -> None:
+        self._current_id = proposition.id if proposition is not None else None
+
+    def _move_to(self, proposition: Proposition) -> None:
+        """Make proposition current, unless this service keeps no navigation state."""
+        if self._track_current:
+            self.current = proposition
+
+    def _context(self, proposition_id: int | None) -> Proposition | dict:
+        """Resolve the proposition an operation starts from.
+
+        An explicit proposition_id wins over the current proposition.
+
+        Returns:
+            The proposition, or an error dict if none could be resolved
+        """
+        if proposition_id is not None:
+            node = self.session.get(Proposition, proposition_id)
+            if node is None:
+                return {"error": f"No record found for id {proposition_id}"}
+            return node
+        node = self.current
+        if node is None:
+            return {"error": "No current node."}
+        return node
 
     @property
     def agent_router(self) -> AgentRouter:
         """Lazy-load agent router on first access."""
-        self.sync_preferences()
-        current_max_tokens = self.config.get("llm_max_tokens")
-        current_provider = self.config.get("llm_provider", "auto")
-        current_model = self.config.get("llm_model", "default")
-
-        # Reconfigure router if any LLM settings changed
-        if (
-            self._agent_router is None
-            or self._agent_router_tokens != current_max_tokens
-            or self._agent_router_provider != current_provider
-            or self._agent_router_model != current_model
-        ):
-            print(
-                "[TractatusService] configuring agent router with "
-                f"provider={current_provider}, model={current_model}, "
-                f"max_tokens={current_max_tokens}"
-            )
-            self._agent_router = self._configure_agent_router(
-                max_tokens=current_max_tokens
-            )
-            self._agent_router_tokens = current_max_tokens
-            self._agent_router_provider = current_provider
-            self._agent_router_model = current_model
-        return self._agent_router
+        with self._lock:
+            self.sync_preferences()
+            current_max_tokens = self.config.get("llm_max_tokens")
+            current_provider = self.config.get("llm_provider", "auto")
+            current_model = self.config.get("llm_model", "default")
+
+            # Reconfigure router if any LLM settings changed
+            if (
+                self._agent_router is None
+                or self._agent_router_tokens != current_max_tokens
+                or self._agent_router_provider != current_provider
+                or self._agent_router_model != current_model
+            ):
+                print(
+                    "[TractatusService] configuring agent router with "
+                    f"provider={current_provider}, model={current_model}, "
+                    f"max_tokens={current_max_tokens}"
+                )
+                self._agent_router = self._configure_agent_router(
+                    max_tokens=current_max_tokens
+                )
+                self._agent_router_tokens = current_max_tokens
+                self._agent_router_provider = current_provider
+                self._agent_router_model = current_model
+            return self._agent_router
 
     def get(self, key: str) -> dict | None:
         """Navigate to a proposition by name or database ID.
@@ -123,7 +206,7 @@ class TractatusService:
             chosen = self.session.get(Proposition, value)
             if not chosen:
                 return {"error": f"No record found for id {value}"}
-            self.current = chosen
+            self._move_to(chosen)
             return self._proposition_to_dict(chosen)
 
         # --- name-first resolution for hierarchical addresses ---
@@ -132,57 +215,62 @@ class TractatusService:
         ).first()
 
         if name_hit:
-            self.current = name_hit
+            self._move_to(name_hit)
             return self._proposition_to_dict(name_hit)
 
         # fallback: id lookup only if name not found and key is numeric
         if key.isdigit():
             id_hit = self.session.get(Proposition, int(key))
             if id_hit:
-                self.current = id_hit
+                self._move_to(id_hit)
                 return self._proposition_to_dict(id_hit)
 
         return {"error": f"No proposition found for '{key}'."}
 
-    def parent(self) -> dict | None:
-        """Get parent of current proposition."""
-        if not self.current or not self.current.parent_id:
+    def parent(self, proposition_id: int | None = None) -> dict | None:
+        """Get parent of the given (or current) proposition."""
+        node = self._context(proposition_id)
+        if isinstance(node, dict):
+            return node
+        if not node.parent_id:
             return {"error": "No parent."}
-        parent = self.session.get(Proposition, self.current.parent_id)
+        parent = self.session.get(Proposition, node.parent_id)
         if parent:
-            self.current = parent
+            self._move_to(parent)
             return self._proposition_to_dict(parent)
         return {"error": "Parent not found."}
 
-    def next(self) -> dict | None:
+    def next(self, proposition_id: int | None = None) -> dict | None:
         """Go to next proposition by id."""
-        return self._navigate_adjacent(1)
+        return self._navigate_adjacent(1, proposition_id)
 
-    def previous(self) -> dict | None:
+    def previous(self, proposition_id: int | None = None) -> dict | None:
         """Go to previous proposition by id."""
-        return self._navigate_adjacent(-1)
+        return self._navigate_adjacent(-1, proposition_id)
 
-    def _navigate_adjacent(self, offset: int) -> dict | None:
+    def _navigate_adjacent(self, offset: int, proposition_id: int | None = None) -> dict | None:
         """Navigate to adjacent proposition."""
-        if not self.current:
-            return {"error": "No current node."}
+        node = self._context(proposition_id)
+        if isinstance(node, dict):
+            return node
 
-        next_id = self.current.id + offset
+        next_id = node.id + offset
         next_prop = self.session.get(Proposition, next_id)
         if not next_prop:
             direction = "next" if offset > 0 else "previous"
             return {"error": f"No {direction} proposition."}
 
-        self.current = next_prop
+        self._move_to(next_prop)
         return self._proposition_to_dict(next_prop)
 
-    def children(self) -> dict | None:
-        """List children of current proposition."""
-        if not self.current:
-            return {"error": "No current node."}
+    def children(self, proposition_id: int | None = None) -> dict | None:
+        """List children of the given (or current) proposition."""
+        node = self._context(proposition_id)
+        if isinstance(node, dict):
+            return node
 
         children = sorted(
-            self.current.children,
+            node.children,
             key=lambda child: self._sort_key(child.name),
         )
         if not children:
@@ -192,19 +280,15 @@ class TractatusService:
             "children": [self._proposition_to_dict(child) for child in children]
         }
 
-    def list(self, target: str | None = None) -> dict | None:
-        """List children for target or current node."""
-        if target:
-            node = self.session.scalars(
-                select(Proposition).where(Proposition.name == target)
-            ).first()
-            if not node:
-                return {"error": f"No proposition found for '{target}'."}
-            self.current = node
-        elif not self.current:
-            return {"error": "No current node."}
+    def list(self, target: str | None = None, proposition_id: int | None = None) -> dict | None:
+        """List children for target or the given (or current) node."""
+        node = self._tree_root(target, proposition_id)
+        if isinstance(node, dict):
+            return node
 
-        node = self.current
+        return self._memoized(("list", node.id), lambda: self._render_list(node))
+
+    def _render_list(self, node: Proposition) -> dict:
         children = sorted(node.children, key=lambda child: self._sort_key(child.name))
         if not children:
             return {"children": []}
@@ -214,34 +298,96 @@ class TractatusService:
             "children": [self._proposition_to_dict(child) for child in children],
         }
 
-    def tree(self, target: str | None = None) -> dict | None:
-        """Get tree for target or current node."""
+    def tree(self, target: str | None = None, proposition_id: int | None = None) -> dict | None:
+        """Get tree for target or the given (or current) node."""
+        node = self._tree_root(target, proposition_id)
+        if isinstance(node, dict):
+            return node
+
+        max_depth = self.config.get("tree_max_depth") or None
+        return self._memoized(
+            ("tree", node.id, max_depth),
+            lambda: {
+                "current": self._proposition_to_dict(node),
+                "tree": self._render_tree_data(node, max_depth=max_depth),
+            },
+        )
+
+    def iter_tree(self, target: str | None = None, proposition_id: int | None = None) -> dict | None:
+        """Get tree for target or current node, yielding nodes lazily.
+
+        Same shape as tree(), except that ``tree`` is an iterator producing
+        the nodes in depth-first order, so callers can stream large subtrees
+        without holding the whole rendering in memory. A memoized rendering
+        is reused when one is available, and a tree streamed to the end is
+        memoized for the next call (tree() and iter_tree() share entries).
+        """
+        node = self._tree_root(target, proposition_id)
+        if isinstance(node, dict):
+            return node
+
+        max_depth = self.config.get("tree_max_depth") or None
+        key = ("tree", node.id, max_depth)
+        cached = self._memo_get(key)
+        if cached is not None:
+            return {"current": cached["current"], "tree": iter(cached["tree"])}
+        current = self._proposition_to_dict(node)
+        return {
+            "current": current,
+            "tree": self._memoize_streamed(
+                key, current, self._iter_attached(node, max_depth)
+            ),
+        }
+
+    def _memoize_streamed(self, key: tuple, current: dict, nodes: Iterator[dict]) -> Iterator[dict]:
+        """Pass tree nodes through, memoizing the full tree once they run out.
+
+        A stream abandoned part-way (e.g. a dropped client) stores nothing.
+        """
+        collected = []
+        for item in nodes:
+            collected.append(item)
+            yield item
+        self._memo_put(key, {"current": current, "tree": collected})
+
+    def _iter_attached(self, node: Proposition, max_depth: int | None) -> Iterator[dict]:
+        """Like _iter_tree_data(), but first re-attach node to the current session.
+
+        A web response is streamed after the request's session has been
+        removed; the scoped registry hands the stream a fresh session, and
+        the children can only be loaded once node belongs to it.
+        """
+        if node not in self.session:
+            node = self.session.merge(node, load=False)
+        yield from self._iter_tree_data(node, max_depth=max_depth)
+
+    def _tree_root(self, target: str | None, proposition_id: int | None = None) -> Proposition | dict:
+        """Resolve a named target (making it current) or the starting proposition.
+
+        Returns an error dict on failure.
+        """
         if target:
             node = self.session.scalars(
                 select(Proposition).where(Proposition.name == target)
             ).first()
             if not node:
                 return {"error": f"No proposition found for '{target}'."}
-            self.current = node
-        elif not self.current:
-            return {"error": "No current node."}
-
-        node = self.current
-        depth_pref = self.config.get("tree_max_depth")
-        max_depth = depth_pref or None
-        return {
-            "current": self._proposition_to_dict(node),
-            "tree": self._render_tree_data(node, max_depth=max_depth),
-        }
+            self._move_to(node)
+            return node
+        return self._context(proposition_id)
 
     def search(self, term: str) -> dict | None:
         """Search propositions by text."""
         if not term:
             return {"error": "Search term required."}
 
-        search_term = f"%{term.strip()}%"
-        stmt = select(Proposition).where(Proposition.text.ilike(search_term))
-        results = list(self.session.scalars(stmt))
+        results = self._search_fulltext(term)
+        if not results:
+            # Substring fallback: also finds matches inside words and works
+            # when the FTS5 index is unavailable
+            search_term = f"%{term.strip()}%"
+            stmt = select(Proposition).where(Proposition.text.ilike(search_term))
+            results = list(self.session.scalars(stmt))
 
         return {
             "query": term,
@@ -249,19 +395,48 @@ class TractatusService:
             "results": [self._proposition_to_dict(p) for p in results],
         }
 
-    def translations(self) -> dict | None:
-        """Get translations of current proposition."""
-        if not self.current:
-            return {"error": "No current node."}
+    def _search_fulltext(self, term: str) -> list[Proposition]:
+        """Return propositions matching every word of term, best matches first.
+
+        Each word is matched as a quoted prefix (``"welt"*``), so user input
+        cannot inject FTS5 query syntax. Ranking uses the index's bm25 score.
+        """
+        words = term.split()
+        if not words:
+            return []
+        query = " ".join('"' + word.replace('"', '""') + '"*' for word in words)
+        stmt = select(Proposition).from_statement(
+            text(
+                f"SELECT tractatus.* FROM {SEARCH_TABLE} "
+                f"JOIN tractatus ON tractatus.id = {SEARCH_TABLE}.rowid "
+                f"WHERE {SEARCH_TABLE} MATCH :query "
+                f"ORDER BY bm25({SEARCH_TABLE})"
+            )
+        )
+        try:
+            return list(self.session.scalars(stmt, {"query": query}))
+        except OperationalError:
+            # No FTS5 index (non-SQLite backend or SQLite without FTS5)
+            self.session.rollback()
+            return []
+
+    def translations(self, proposition_id: int | None = None) -> dict | None:
+        """Get translations of the given (or current) proposition."""
+        node = self._context(proposition_id)
+        if isinstance(node, dict):
+            return node
 
+        return self._memoized(("translations", node.id), lambda: self._render_translations(node))
+
+    def _render_translations(self, node: Proposition) -> dict:
         translations = [
             t
-            for t in self.current.translations
+            for t in node.translations
             if (t.variant_type or "translation") != "alternative"
         ]
 
         return {
-            "proposition": self._proposition_to_dict(self.current),
+            "proposition": self._proposition_to_dict(node),
             "translations": [
                 {
                     "lang": t.lang,
@@ -272,22 +447,23 @@ class TractatusService:
             ],
         }
 
-    def translate(self, lang: str) -> dict | None:
+    def translate(self, lang: str, proposition_id: int | None = None) -> dict | None:
         """Get specific translation."""
-        if not self.current:
-            return {"error": "No current node."}
+        node = self._context(proposition_id)
+        if isinstance(node, dict):
+            return node
 
         if not lang:
             return {"error": "Language code required."}
 
         stmt = select(Translation).where(
-            Translation.tractatus_id == self.current.id,
+            Translation.tractatus_id == node.id,
             Translation.lang == lang,
         )
         t = self.session.scalars(stmt).first()
         if t:
             return {
-                "proposition": self._proposition_to_dict(self.current),
+                "proposition": self._proposition_to_dict(node),
                 "translation": {
                     "lang": t.lang,
                     "text": t.text,
@@ -296,11 +472,12 @@ class TractatusService:
             }
         return {"error": f"No translation found for language: {lang}"}
 
-    def alternatives(self) -> dict | None:
-        """Return alternative text variants for the current proposition."""
+    def alternatives(self, proposition_id: int | None = None) -> dict | None:
+        """Return alternative text variants for the given (or current) proposition."""
 
-        if not self.current:
-            return {"error": "No current node."}
+        node = self._context(proposition_id)
+        if isinstance(node, dict):
+            return node
 
         alternatives = [
             {
@@ -313,13 +490,13 @@ class TractatusService:
                 "updated_at": self._format_timestamp(alt.updated_at),
             }
             for alt in sorted(
-                (t for t in self.current.translations if t.variant_type == "alternative"),
+                (t for t in node.translations if t.variant_type == "alternative"),
                 key=lambda entry: entry.created_at or datetime.min,
             )
         ]
 
         return {
-            "proposition": self._proposition_to_dict(self.current),
+            "proposition": self._proposition_to_dict(node),
             "alternatives": alternatives,
         }
 
@@ -330,11 +507,13 @@ class TractatusService:
         lang: str | None = None,
         editor: str | None = None,
         tags: list[str] | str | None = None,
+        proposition_id: int | None = None,
     ) -> dict | None:
-        """Create a new alternative translation for the current proposition."""
+        """Create a new alternative translation for the given (or current) proposition."""
 
-        if not self.current:
-            return {"error": "No current node."}
+        node = self._context(proposition_id)
+        if isinstance(node, dict):
+            return node
 
         cleaned_text = (text or "").strip()
         if not cleaned_text:
@@ -350,13 +529,15 @@ class TractatusService:
             editor=(editor or "").strip() or None,
             tags=self._serialise_tags(tags),
         )
-        translation.proposition = self.current
+        translation.proposition = node
         self.session.add(translation)
         self.session.commit()
         self.session.refresh(translation)
+        # Translation-aware renderings may now differ
+        self.invalidate_memo()
 
         return {
-            "proposition": self._proposition_to_dict(self.current),
+            "proposition": self._proposition_to_dict(node),
             "alternative": {
                 "id": translation.id,
                 "lang": translation.lang,
@@ -374,6 +555,8 @@ class TractatusService:
         targets: list[str] | None = None,
         language: str | None = None,
         user_input: str | None = None,
+        use_cache: bool = True,
+        proposition_id: int | None = None,
     ) -> dict | None:
         """Invoke an LLM agent to analyze propositions using AI.
 
@@ -393,11 +576,14 @@ class TractatusService:
         Args:
             action: The agent action (comment, comparison, websearch, reference)
             targets: Optional list of proposition names to analyze (e.g., ["1.1", "1.2"])
-                    If not provided, uses the current proposition
+                    If not provided, uses proposition_id or the current proposition
             language: Optional language code ("de" for German, "en" for English)
                      Defaults to user's configured language preference
             user_input: Optional user-supplied prompt to guide the analysis
                        This is included alongside the proposition text
+            use_cache: Reuse the cached response for an identical request.
+                      False forces a fresh completion (which is then cached)
+            proposition_id: Proposition to analyze when no targets are given
 
         Returns:
             Dictionary with:
@@ -427,11 +613,14 @@ class TractatusService:
             propositions = self._resolve_targets(targets)
             if not propositions:
                 return {"error": f"No propositions found for targets: {targets}"}
-        elif self.current:
-            # If no targets specified, use the current navigation context
-            propositions = [self.current]
         else:
-            return {"error": "No target propositions specified and no current node."}
+            # If no targets specified, use the given or current proposition
+            node = self._context(proposition_id)
+            if isinstance(node, dict):
+                if proposition_id is not None:
+                    return node
+                return {"error": "No target propositions specified and no current node."}
+            propositions = [node]
 
         # Build text payload in the requested language
         lang = language or self.config.get("lang")
@@ -444,6 +633,7 @@ class TractatusService:
             payload=payload,
             language=lang,
             user_input=user_input,
+            use_cache=use_cache,
         )
 
         # Return structured response with analysis
@@ -531,6 +721,81 @@ class TractatusService:
             "language": lang.lower()[:2],  # Return the language used
         }
 
+    def _memoized(self, key: tuple, compute: Callable[[], dict]) -> dict:
+        """Return cached rendering for key, computing it on a miss or expiry.
+
+        The key is extended with the display preferences that shape the
+        rendered dictionaries, so preference changes never serve stale text.
+        Callers must treat the returned dictionary as read-only.
+        """
+        value = self._memo_get(key)
+        if value is not None:
+            return value
+
+        value = compute()
+        self._memo_put(key, value)
+        return value
+
+    def _memo_put(self, key: tuple, value: dict) -> None:
+        """Memoize value for key, evicting least recently used entries."""
+        memo_key = self._memo_key(key)
+        with self._memo_lock:
+            self._memo[memo_key] = (time.monotonic() + self._MEMO_TTL, value)
+            self._memo.move_to_end(memo_key)
+            # Evict least recently used entries beyond capacity
+            while len(self._memo) > self._MEMO_MAX:
+                self._memo.popitem(last=False)
+
+    def _memo_get(self, key: tuple) -> dict | None:
+        """Return the unexpired memoized rendering for key, if any."""
+        self._check_data_version()
+        memo_key = self._memo_key(key)
+        with self._memo_lock:
+            entry = self._memo.get(memo_key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._memo[memo_key]
+                return None
+            self._memo.move_to_end(memo_key)
+            return entry[1]
+
+    def _check_data_version(self) -> None:
+        """Drop the memo if the database changed, in this or another process.
+
+        The version is the highest proposition and translation id. Rows are
+        only appended (ingest, new alternatives), so every such write moves
+        it. The database is asked at most once per _VERSION_CHECK_INTERVAL.
+        """
+        now = time.monotonic()
+        with self._memo_lock:
+            if now < self._next_version_check:
+                return
+            self._next_version_check = now + self._VERSION_CHECK_INTERVAL
+
+        version = tuple(
+            self.session.execute(
+                select(
+                    select(func.max(Proposition.id)).scalar_subquery(),
+                    select(func.max(Translation.id)).scalar_subquery(),
+                )
+            ).one()
+        )
+        with self._memo_lock:
+            if version != self._memo_version:
+                self._memo.clear()
+                self._memo_version = version
+
+    def _memo_key(self, key: tuple) -> tuple:
+        return (*key, self.config.get("lang"), self.config.get("display_length"))
+
+    def invalidate_memo(self) -> None:
+        """Drop all memoized tree/list/translation renderings."""
+        with self._memo_lock:
+            self._memo.clear()
+            # Re-read the database version on the next lookup
+            self._next_version_check = 0.0
+
     @staticmethod
     def _serialise_tags(tags: list[str] | str | None) -> str | None:
         """Normalise tag input to a comma-separated string."""
@@ -567,13 +832,21 @@ class TractatusService:
             return None
 
     def _render_tree_data(
+        self,
+        node: Proposition,
+        max_depth: int | None = None,
+    ) -> list[dict]:
+        """Render tree as structured data (see _iter_tree_data)."""
+        return list(self._iter_tree_data(node, max_depth=max_depth))
+
+    def _iter_tree_data(
         self,
         node: Proposition,
         depth: int = 0,
         max_depth: int | None = None,
         _visited: set[int] | None = None,
-    ) -> list[dict]:
-        """Render tree as structured data, protecting against cyclic relations.
+    ) -> Iterator[dict]:
+        """Yield tree nodes in depth-first order, protecting against cyclic relations.
 
         Some rows in the underlying dataset contain accidental self-references
         (e.g. a proposition whose ``parent_id`` matches its own ``id``). Without
@@ -583,36 +856,28 @@ class TractatusService:
         repeated entries.
         """
 
-        visited = _visited or set()
+        visited = _visited if _visited is not None else set()
         if node.id in visited:
             # Cycle detected – stop recursion on this branch.
-            return []
+            return
 
         visited.add(node.id)
 
-        items = [
-            {
-                "depth": depth,
-                **self._proposition_to_dict(node),
-            }
-        ]
-
-        if max_depth is not None and depth >= max_depth:
-            visited.remove(node.id)
-            return items
+        yield {
+            "depth": depth,
+            **self._proposition_to_dict(node),
+        }
 
-        for child in sorted(node.children, key=lambda ch: self._sort_key(ch.name)):
-            items.extend(
-                self._render_tree_data(
+        if max_depth is None or depth < max_depth:
+            for child in sorted(node.children, key=lambda ch: self._sort_key(ch.name)):
+                yield from self._iter_tree_data(
                     child,
                     depth + 1,
                     max_depth=max_depth,
                     _visited=visited,
                 )
-            )
 
         visited.remove(node.id)
-        return items
 
     @staticmethod
     def _sort_key(name: str) -> list[int | str]:
@@ -707,30 +972,68 @@ class TractatusService:
     # ------------------------------------------------------------------
 
     def sync_preferences(self) -> None:
-        """Reload preferences if the config file changed on disk."""
+        """Reload preferences if the config file changed on disk.
 
-        latest_mtime = self._config_file_mtime()
-        if latest_mtime == self._config_mtime:
-            return
+        Cheap enough to call on every request: unless the config's version
+        counter moved, the backing file is only stat'ed once per
+        ``_DISK_CHECK_INTERVAL`` seconds.
+        """
 
-        self.config.load()
-        self._config_mtime = latest_mtime
-        self.invalidate_agent_router_cache()
+        with self._lock:
+            now = time.monotonic()
+            if self.config.version != self._seen_version:
+                # In-process write: adopt the new mtime so it is not mistaken
+                # for an external edit below
+                self._seen_version = self.config.version
+                self._config_mtime = self._config_file_mtime()
+                self._next_disk_check = now + self._DISK_CHECK_INTERVAL
+                return
+            if now < self._next_disk_check:
+                return
+
+            self._next_disk_check = now + self._DISK_CHECK_INTERVAL
+            latest_mtime = self._config_file_mtime()
+            if latest_mtime == self._config_mtime:
+                return
+
+            self.config.load()
+            self._config_mtime = latest_mtime
+            self._seen_version = self.config.version
+            self.invalidate_agent_router_cache()
 
     def record_config_update(self, key: str | None = None) -> None:
         """Track an in-process preference change and refresh caches as needed."""
 
-        self._config_mtime = self._config_file_mtime()
-        if key is None or key in ("llm_max_tokens", "llm_provider", "llm_model"):
-            self.invalidate_agent_router_cache()
+        with self._lock:
+            self.sync_preferences()
+            if key is None or key in ("llm_max_tokens", "llm_provider", "llm_model"):
+                self.invalidate_agent_router_cache()
+
+    def set_preference(self, key: str, value: Any) -> bool:
+        """Persist a validated preference and refresh dependent caches.
+
+        Runs under the service lock, so concurrent updates from different
+        threads are applied (and flushed to disk) one at a time.
+
+        Returns:
+            True if the preference was stored
+        """
+
+        with self._lock:
+            if not self.config.set(key, value):
+                return False
+            self.config.flush()
+            self.record_config_update(key)
+        return True
 
     def invalidate_agent_router_cache(self) -> None:
         """Clear the cached agent router so it is rebuilt on next use."""
 
-        self._agent_router = None
-        self._agent_router_tokens = None
-        self._agent_router_provider = None
-        self._agent_router_model = None
+        with self._lock:
+            self._agent_router = None
+            self._agent_router_tokens = None
+            self._agent_router_provider = None
+            self._agent_router_model = None
 
     def _config_file_mtime(self) -> float | None:
         """Return the modification time of the backing config file, if any."""
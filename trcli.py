@@ -269,19 +269,13 @@ class TractatusCLI(cmd.Cmd):
         key, value_str = parts
         # Try to parse the value as appropriate type
         try:
-            # Get the expected type from defaults
-            default_value = self.config.DEFAULT_PREFERENCES.get(key)
-            if default_value is None:
+            # Get the type converter derived from the defaults
+            converter = self.config.CONVERTERS.get(key)
+            if converter is None:
                 print(f"Unknown preference: {key}")
                 return
 
-            expected_type = type(default_value)
-            if expected_type == int:
-                value = int(value_str)
-            elif expected_type == bool:
-                value = value_str.lower() in ("true", "1", "yes", "on")
-            else:
-                value = value_str
+            value = converter(value_str)
 
             # Validate the preference
             is_valid, error_msg = self.config.validate_preference(key, value)
@@ -291,6 +285,7 @@ class TractatusCLI(cmd.Cmd):
 
             # Set it
             if self.config.set(key, value):
+                self.config.flush()
                 print(f"Set {key} = {value}")
                 if key == "llm_max_tokens":
                     self._refresh_agent_router()
@@ -303,12 +298,14 @@ class TractatusCLI(cmd.Cmd):
 
         if action == "reset":
             self.config.reset()
+            self.config.flush()
             self._refresh_agent_router()
             print("All preferences reset to defaults.")
             return
 
         if action == "reset-all":
             self.config.reset()
+            self.config.flush()
             self._refresh_agent_router()
             print("All preferences reset to defaults.")
             return
@@ -318,6 +315,7 @@ class TractatusCLI(cmd.Cmd):
             if action.startswith("reset "):
                 key = action[6:].strip()
                 if self.config.reset(key):
+                    self.config.flush()
                     print(f"Reset {key} to default value.")
                     if key == "llm_max_tokens":
                         self._refresh_agent_router()
@@ -360,10 +358,16 @@ class TractatusCLI(cmd.Cmd):
         return self.do_agent(arg)
 
     def do_agent(self, arg: str):
-        """Hybrid agent command supporting prefixes and inline usage."""
+        """Hybrid agent command supporting prefixes and inline usage.
+
+        ``--no-cache`` anywhere in the arguments forces a fresh completion.
+        """
 
         arg = arg.strip()
         tokens = shlex.split(arg)
+        use_cache = "--no-cache" not in tokens
+        if not use_cache:
+            tokens = [token for token in tokens if token != "--no-cache"]
 
         action_override: AgentAction | None = None
         if tokens and tokens[0].startswith(":"):
@@ -377,7 +381,7 @@ class TractatusCLI(cmd.Cmd):
                 tokens.insert(0, leading)
 
         if not tokens:
-            return self._agent_on_current(action_override or AgentAction.COMMENT)
+            return self._agent_on_current(action_override or AgentAction.COMMENT, use_cache)
 
         command_map = {
             "get": self._agent_payload_for_targets,
@@ -398,7 +402,7 @@ class TractatusCLI(cmd.Cmd):
             else:
                 action, target_tokens = self._split_action_token(tokens)
                 if not target_tokens:
-                    return self._agent_on_current(action)
+                    return self._agent_on_current(action, use_cache)
                 payload_info = self._agent_payload_for_targets(target_tokens)
         except ValueError as exc:
             print(exc)
@@ -408,7 +412,9 @@ class TractatusCLI(cmd.Cmd):
             return
 
         propositions, payload, scope = payload_info
-        response = self.agent_router.perform(action, propositions, payload=payload)
+        response = self.agent_router.perform(
+            action, propositions, payload=payload, use_cache=use_cache
+        )
         self._display_agent_response(response, scope)
 
     @staticmethod
@@ -437,12 +443,12 @@ class TractatusCLI(cmd.Cmd):
             return shlex.join(tokens)
         return shlex.join(tokens[1:] + [tokens[0]])
 
-    def _agent_on_current(self, action: AgentAction) -> None:
+    def _agent_on_current(self, action: AgentAction, use_cache: bool = True) -> None:
         if not self.current:
             print("No current node.")
             return
         propositions = [self.current]
-        response = self.agent_router.perform(action, propositions)
+        response = self.agent_router.perform(action, propositions, use_cache=use_cache)
         scope = self._format_proposition_scope(propositions)
         self._display_agent_response(response, scope)
 
@@ -594,19 +600,19 @@ class TractatusCLI(cmd.Cmd):
 
         client = None
         try:
+            # The openai SDK itself is imported lazily by the client
             from tractatus_agents.llm_openai import OpenAILLMClient
+
+            client = OpenAILLMClient()
         except ImportError:  # pragma: no cover - optional dependency
             print(
                 "OpenAI backend unavailable (missing 'openai' package?). "
                 "Falling back to echo client.",
             )
-        else:
-            try:
-                client = OpenAILLMClient()
-            except RuntimeError as exc:
-                print(f"{exc} Falling back to echo client.")
-            except Exception as exc:  # pragma: no cover - defensive guard
-                print(f"Unable to initialise OpenAI client: {exc}. Falling back to echo client.")
+        except RuntimeError as exc:
+            print(f"{exc} Falling back to echo client.")
+        except Exception as exc:  # pragma: no cover - defensive guard
+            print(f"Unable to initialise OpenAI client: {exc}. Falling back to echo client.")
 
         # Get max_tokens from config
         max_tokens = self.config.get("llm_max_tokens")
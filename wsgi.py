@@ -0,0 +1,15 @@
+"""WSGI entry point for production servers.
+
+Run the web app under gunicorn with threaded workers, e.g.::
+
+    gunicorn -w 4 -k gthread --threads 8 -b 0.0.0.0:8000 wsgi:app
+
+Each worker process holds its own SQLAlchemy connection pool, sized to the
+number of worker threads (see ``tractatus_orm.database``). The threads of a
+worker share one TractatusService, which keeps no per-client navigation
+state and serializes its preference and agent-router bookkeeping.
+"""
+
+from app import app
+
+__all__ = ["app"]